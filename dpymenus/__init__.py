@@ -12,15 +12,20 @@ import logging
 
 from .exceptions import PagesError, ButtonsError, EventError, SessionError
 from .sessions import sessions
-from .sessions.session import Session
+from .sessions.session import Session, close_all
 from .hooks import HookWhen, HookEvent
-from .template import Template, FieldSort, FieldStyle
+from .executors import ExecutionMode, blocking, cpu_bound
+from .matcher import ResponseMatcher
+from .voters import VoterSet
+from .tally import VoteTally, CompactVoteTally
+from .template import Template, CompiledTemplate, FieldSort, FieldStyle
 from .page import Page
 from .base_menu import BaseMenu
 from .text_menu import TextMenu
 from .button_menu import ButtonMenu
 from .paginated_menu import PaginatedMenu
 from .poll import Poll
+from .sharded_poll import ShardedPoll
 
 
 logger = logging.getLogger('dpymenus')
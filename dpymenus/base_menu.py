@@ -1,32 +1,34 @@
 import abc
 import asyncio
+import inspect
 import logging
-from typing import Any, Callable, List, Optional, TYPE_CHECKING, Union
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Iterable, List, Mapping, Optional, TYPE_CHECKING, Union
 
-from discord import Message, Reaction, TextChannel, User
+from discord import Embed, HTTPException, Message, Reaction, TextChannel, User
 from discord.abc import GuildChannel
 from discord.ext.commands import Context
 
 from dpymenus import Page, PagesError, Session, SessionError
-from dpymenus.hooks import HookEvent, HookWhen, call_hook
-from dpymenus.settings import BUTTON_DELAY, HISTORY_CACHE_LIMIT, REPLY_AS_DEFAULT, TIMEOUT
+from dpymenus.executors import ExecutionMode, execution_mode, map_in_executor, run_in_executor
+from dpymenus.hooks import HookEvent, HookRegistry, HookWhen, call_hook
+from dpymenus.history import History
+from dpymenus.scheduler import BACKGROUND, CLEANUP, INTERACTIVE, request_scheduler
+from dpymenus.settings import REPLY_AS_DEFAULT, TIMEOUT
+from dpymenus.template import CompiledTemplate, Template
+from dpymenus.watchdog import watchdog
 
 if TYPE_CHECKING:
-    from dpymenus import Template
     from dpymenus.types import PageType
 
+_DEFAULT_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
 
 class BaseMenu(abc.ABC):
     """The abstract base menu object. All menu types derive from this class. Implements generic properties,
     menu loop handling, and defines various helper methods."""
 
-    _timeout: int
-    _command_message: bool
-    _persist: bool
-    _reply: bool
-    _custom_check: Optional[Callable]
-    _replies_disabled: bool
-    _start_page_index: int
+    __slots__ = ('_id', 'ctx', 'pages', 'page', 'active', 'input', 'output', 'history', '_hooks', '_options')
 
     def __init__(self, ctx: Context):
         self._id: int = -1
@@ -36,7 +38,9 @@ class BaseMenu(abc.ABC):
         self.active: bool = True
         self.input: Optional[Union[Message, Reaction]] = None
         self.output: Optional[Message] = None
-        self.history: List[int] = []
+        self.history: History = History()
+        self._hooks: Optional[HookRegistry] = None
+        self._options: Mapping[str, Any] = _DEFAULT_OPTIONS
 
     @abc.abstractmethod
     async def open(self):
@@ -44,7 +48,7 @@ class BaseMenu(abc.ABC):
 
     @property
     def timeout(self) -> int:
-        return getattr(self, '_timeout', TIMEOUT)
+        return self._options.get('timeout', TIMEOUT)
 
     def set_timeout(self, duration: int) -> 'BaseMenu':
         """Sets the timeout on a menu. Returns itself for fluent-style chaining.
@@ -52,13 +56,13 @@ class BaseMenu(abc.ABC):
         :param duration: Specifies how long, in seconds, before the menu will time out.
         :rtype: :class:`BaseMenu`
         """
-        setattr(self, '_timeout', duration)
+        self._set_option('timeout', duration)
 
         return self
 
     @property
     def destination(self) -> Union[Context, User, TextChannel]:
-        return getattr(self, '_destination', self.ctx)
+        return self._options.get('destination', self.ctx)
 
     def set_destination(self, dest: Union[User, TextChannel]) -> 'BaseMenu':
         """Sets the message destination for the menu. Returns itself for fluent-style chaining.
@@ -66,13 +70,13 @@ class BaseMenu(abc.ABC):
         :param dest: Where, in Discord, to send and display the menu.
         :rtype: :class:`BaseMenu`
         """
-        setattr(self, '_destination', dest)
+        self._set_option('destination', dest)
 
         return self
 
     @property
     def replies_disabled(self) -> bool:
-        return getattr(self, '_replies_disabled', False)
+        return self._options.get('replies_disabled', False)
 
     def disable_replies(self) -> 'BaseMenu':
         """Disables the Reply feature on Discord from being used with this menu. Overrides the global settings.
@@ -80,13 +84,13 @@ class BaseMenu(abc.ABC):
 
         :rtype: :class:`BaseMenu`
         """
-        self._replies_disabled = True
+        self._set_option('replies_disabled', True)
 
         return self
 
     @property
     def command_message(self) -> bool:
-        return getattr(self, '_command_message', False)
+        return self._options.get('command_message', False)
 
     def show_command_message(self) -> 'BaseMenu':
         """Persists user command invocation messages in the chat instead of deleting them after execution.
@@ -94,13 +98,13 @@ class BaseMenu(abc.ABC):
 
         :rtype: :class:`BaseMenu`
         """
-        self._command_message = True
+        self._set_option('command_message', True)
 
         return self
 
     @property
     def persist(self) -> bool:
-        return getattr(self, '_persist', False)
+        return self._options.get('persist', False)
 
     def persist_on_close(self) -> 'BaseMenu':
         """Prevents message cleanup from running when a menu closes.
@@ -108,13 +112,13 @@ class BaseMenu(abc.ABC):
 
         :rtype: :class:`BaseMenu`
         """
-        self._persist = True
+        self._set_option('persist', True)
 
         return self
 
     @property
     def custom_check(self) -> Optional[Callable]:
-        return getattr(self, '_custom_check', None)
+        return self._options.get('custom_check')
 
     def set_custom_check(self, fn: Callable) -> 'BaseMenu':
         """Overrides the default check method for user responses.
@@ -123,13 +127,13 @@ class BaseMenu(abc.ABC):
         :param fn: A reference to a predicate function.
         :rtype: :class:`BaseMenu`
         """
-        setattr(self, '_custom_check', fn)
+        self._set_option('custom_check', fn)
 
         return self
 
     @property
     def start_page_index(self) -> int:
-        return getattr(self, '_start_page_index', 0)
+        return self._options.get('start_page_index', 0)
 
     def set_initial_page(self, index: int) -> 'BaseMenu':
         """Sets the initial page of the menu when opened based on a pages index in the `add_pages` list.
@@ -138,38 +142,56 @@ class BaseMenu(abc.ABC):
         :param index: Which page index to start on.
         :rtype: :class:`BaseMenu`
         """
-        self._start_page_index = index
+        self._set_option('start_page_index', index)
 
         return self
 
-    def add_hook(self, when: HookWhen, event: HookEvent, callback: Callable) -> 'BaseMenu':
-        """Sets various callback attributes on the menu so users can hook into
-        specific events. See https://dpymenus.com/lifecycle for the full list of events
+    def set_history_limit(self, limit: int) -> 'BaseMenu':
+        """Sets how many visited pages the menu remembers for `back` navigation. Overrides the global settings.
+        Returns itself for fluent-style chaining.
+
+        :param limit: How many page visits to keep. 0 is no limit.
+        :rtype: :class:`BaseMenu`
+        """
+        self.history.set_limit(limit)
+
+        return self
+
+    def add_hook(
+        self, when: HookWhen, event: HookEvent, callback: Callable, timeout: Optional[float] = None
+    ) -> 'BaseMenu':
+        """Registers a callback so users can hook into specific events. Any number of callbacks can be added to the
+        same hook; they may be sync or async. See https://dpymenus.com/lifecycle for the full list of events
         and hook structure.
 
         :param when: Defines which point in the menu lifetime the callback will be executed.
         :param event: Defines which event in the menu lifetime the callback will be executed on.
         :param callback: References a function or method which will be executed based on the `when`
                          and `event` params.
+        :param timeout: How long, in seconds, the callback may run before it is cancelled. Defaults to the
+                        `hook-timeout` setting.
         :rtype: :class:`BaseMenu`
         """
-        setattr(self, f'_hook_{when.name.lower()}_{event.name.lower()}', callback)
+        if self._hooks is None:
+            self._hooks = HookRegistry()
+
+        self._hooks.add(when, event, callback, timeout)
 
         return self
 
     # Helper Methods
     async def close(self):
         """Gracefully exits out of the menu, performing necessary cleanup of sessions, reactions, and messages."""
-        await call_hook(self, '_hook_before_close')
+        await call_hook(self, HookWhen.BEFORE, HookEvent.CLOSE)
         Session.get(self).kill_or_freeze()
         self.active = False
 
-        if self.output.reactions:
-            await asyncio.sleep(BUTTON_DELAY)
-            await self._safe_clear_reactions()
+        # one failed cleanup step must not stop the others, or the AFTER hook
+        for result in await asyncio.gather(*self._cleanup_tasks(), return_exceptions=True):
+            if isinstance(result, Exception):
+                logging.error(f'A cleanup step of {self!r} failed: {result!r}.')
 
-        await self._safe_delete_output()
-        await call_hook(self, '_hook_after_close')
+        await call_hook(self, HookWhen.AFTER, HookEvent.CLOSE)
 
     async def next(self):
         """Transitions to the next page."""
@@ -218,23 +240,46 @@ class BaseMenu(abc.ABC):
 
         await self._next()
 
-    def last_visited_page(self) -> int:
-        """Returns the last visited page index.
+    async def back(self):
+        """Transitions to the previously visited page, like the back button of a web browser."""
+        if (index := self.history.back()) is None:
+            return
+
+        self.page = self.pages[index]
 
-        :rtype: int
+        await self._next(record=False)
+
+    async def forward(self):
+        """Transitions forward again after going `back`. Visiting any other page clears the forward history."""
+        if (index := self.history.forward()) is None:
+            return
+
+        self.page = self.pages[index]
+
+        await self._next(record=False)
+
+    def last_visited_page(self) -> Optional[int]:
+        """Returns the page index visited before the current one, or None if there is no such entry, ie. on the
+        first page or after going `back` to it.
+
+        :rtype: Optional[int]
         """
-        return self.history[-2] if len(self.history) > 1 else 0
+        return self.history[-2] if len(self.history) > 1 else None
 
-    def add_pages(self, pages: List['PageType'], template: 'Template' = None) -> 'BaseMenu':
+    def add_pages(self, pages: List['PageType'], template: Union[Template, CompiledTemplate] = None) -> 'BaseMenu':
         """Adds a list of pages to a menu, setting their index based on the position in the list.
         Returns itself for fluent-style chaining.
 
         :param pages: A list of pages to display; ordered from first to last in linear menus.
-        :param template: An optional :class:`Template` to define a menu style.
+        :param template: An optional :class:`Template` to define a menu style. It is compiled once and shared
+                         by every page.
         :rtype: :class:`BaseMenu`
         """
         self._validate_pages(pages)
 
+        if isinstance(template, Template):
+            template = template.compile()
+
         for i, page in enumerate(pages):
             if not isinstance(page, Page):
                 page = Page.convert_from(page)
@@ -249,21 +294,57 @@ class BaseMenu(abc.ABC):
 
         return self
 
+    async def build_pages(
+        self, builder: Callable, inputs: Iterable, template: Union[Template, CompiledTemplate] = None
+    ) -> 'BaseMenu':
+        """Calls `builder` once per input to create pages, then adds them to the menu in input order. Builders marked
+        with `@blocking` or `@cpu_bound` run in the shared thread or process pool, so the event loop keeps serving
+        other menus while heavy pages are built. Returns itself for fluent-style chaining.
+
+        :param builder: A reference to a synchronous function which takes one input and returns a :class:`PageType`.
+        :param inputs: The values to build pages from; they must be picklable for `@cpu_bound` builders.
+        :param template: An optional :class:`Template` to define a menu style.
+        :rtype: :class:`BaseMenu`
+        """
+        pages = await map_in_executor(builder, inputs)
+
+        return self.add_pages(pages, template)
+
     async def send_message(self, page: 'PageType'):
-        """Updates the output message if it can be edited, otherwise sends a new message.
+        """Updates the output message in place. Outside of guild channels, the message is sent again if Discord
+        rejects the edit.
 
         :param page: A :class:`PageType` to send to Discord.
         """
         safe_embed = page.as_safe_embed() if type(page) == Page else page
 
-        if isinstance(self.output.channel, GuildChannel):
-            return await self.output.edit(embed=safe_embed)
-        else:
-            await self.output.delete()
+        try:
+            await request_scheduler.edit(self.output, owner=self, embed=safe_embed)
+        except HTTPException as exc:
+            if isinstance(self.output.channel, GuildChannel):
+                raise
 
-        self.output = await self.destination.send(embed=safe_embed)
+            logging.debug(f'Could not edit the menu message ({exc.status}); sending it again.')
+            await self._resend(safe_embed)
 
     # Internal Methods
+    async def _resend(self, embed: Embed):
+        """Replaces the output message with a new one, after it could not be edited."""
+        try:
+            await request_scheduler.delete(self.output, owner=self, priority=INTERACTIVE)
+        except HTTPException:
+            pass
+
+        self.output = await self.destination.send(embed=embed)
+
+    def _set_option(self, key: str, value: Any):
+        """Sets a menu option. Menus share one empty, read-only options record until their first option is set,
+        so menus using only the defaults cost nothing extra."""
+        if self._options is _DEFAULT_OPTIONS:
+            self._options = {}
+
+        self._options[key] = value
+
     async def _open(self):
         """This method runs for ALL menus after their own open method. Session handling and initial setup is
         performed in here; it should NEVER be handled inside specific menus."""
@@ -272,6 +353,7 @@ class BaseMenu(abc.ABC):
         except SessionError as exc:
             logging.info(exc.message)
         else:
+            watchdog.start()
             self.history = session.history
 
             if self.history:
@@ -279,9 +361,12 @@ class BaseMenu(abc.ABC):
             else:
                 self.page = self.pages[self.start_page_index]
 
-            await call_hook(self, '_hook_before_open')
+            await call_hook(self, HookWhen.BEFORE, HookEvent.OPEN)
 
-            if REPLY_AS_DEFAULT and self.replies_disabled is False:
+            # menus resuming on an existing message set their output before opening
+            if self.output is not None:
+                pass
+            elif REPLY_AS_DEFAULT and self.replies_disabled is False:
                 self.output = await self.destination.reply(embed=self.page.as_safe_embed())
             else:
                 self.output = await self.destination.send(embed=self.page.as_safe_embed())
@@ -297,20 +382,43 @@ class BaseMenu(abc.ABC):
             if isinstance(self.output.channel, GuildChannel):
                 await self.input.delete()
 
+    def _cleanup_tasks(self) -> List[Awaitable]:
+        """Returns the independent cleanup steps to run concurrently when the menu closes."""
+        if self.output is None or self.persist:
+            return []
+
+        return [self._safe_delete_output()]
+
     async def _safe_delete_output(self):
         """Safely deletes a message if the bot has permissions and persist is set to false."""
         if self.persist is False:
-            await self.output.delete()
+            await request_scheduler.delete(self.output, owner=self, priority=CLEANUP)
             self.output = None
 
     def _update_history(self):
-        """Adds the most recent page index to the menus history cache. If the history is longer than
-        the cache limit, defined globally, then the oldest item is popped before updating the history."""
-        if len(self.history) >= HISTORY_CACHE_LIMIT:
-            self.history.pop(0)
-
+        """Adds the most recent page index to the menus history cache. If the history is at its limit, the oldest
+        entry is overwritten."""
         self.history.append(self.page.index)
 
+    async def _call_event(self, fn: Callable, *args) -> Any:
+        """Runs a user-defined page event callback. Callbacks marked with `@blocking` or `@cpu_bound` run in a shared
+        executor; everything else runs on the event loop and is timed by the watchdog when it is enabled."""
+        if execution_mode(fn) is not ExecutionMode.INLINE:
+            return await run_in_executor(fn, *args)
+
+        if watchdog.enabled:
+            return await watchdog.run(self, fn, *args)
+
+        result = fn(*args)
+        if inspect.isawaitable(result):
+            result = await result
+
+        return result
+
+    def _watched_check(self, check: Callable) -> Callable:
+        """Returns a check predicate which is timed by the watchdog when it is enabled."""
+        return watchdog.wrap_check(self, check) if watchdog.enabled else check
+
     def _check(self, message: Message) -> bool:
         """Returns true if the event author and channel are the same as the initial values in the menu context."""
         return message.author == self.ctx.author and self.output.channel == message.channel
@@ -318,37 +426,41 @@ class BaseMenu(abc.ABC):
     async def _cancel_menu(self):
         """Closes the menu as a user-defined 'cancel' event. Checks if an on_cancel_event callback exists first."""
         if self.page.on_cancel_event:
-            await self.page.on_cancel_event()
+            await self._call_event(self.page.on_cancel_event)
             return
 
-        if cancel_page := getattr(self, 'cancel_page', None):
-            await self.output.edit(embed=cancel_page)
+        # the output is deleted on close unless it persists, so there is no point in showing the cancel page
+        if self.persist and (cancel_page := getattr(self, 'cancel_page', None)):
+            await request_scheduler.edit(self.output, owner=self, embed=cancel_page)
 
         await self.close()
 
     async def _timeout_menu(self):
         """Closes the menu on an asyncio.TimeoutError event. If an on_timeout_event callback exists, that function
         will be run instead of the default behaviour."""
-        await call_hook(self, '_hook_before_timeout')
+        await call_hook(self, HookWhen.BEFORE, HookEvent.TIMEOUT)
         if self.page.on_timeout_event:
-            await self.page.on_timeout_event()
+            await self._call_event(self.page.on_timeout_event)
             return
 
-        if timeout_page := getattr(self, 'timeout_page', None):
-            await self.output.edit(embed=timeout_page)
+        if self.persist and (timeout_page := getattr(self, 'timeout_page', None)):
+            await request_scheduler.edit(self.output, owner=self, priority=BACKGROUND, embed=timeout_page)
 
         await self.close()
-        await call_hook(self, '_hook_after_timeout')
+        await call_hook(self, HookWhen.AFTER, HookEvent.TIMEOUT)
 
-    async def _next(self):
+    async def _next(self, record: bool = True):
         """Sends a message after the `next` method is called. Closes the menu instance if there is no callback for
-        the on_next_event on the current page."""
+        the on_next_event on the current page. Back and forward navigation set `record` to False, since they move
+        through the history instead of adding to it."""
         if self.__class__.__name__ != 'PaginatedMenu':
             if self.page.on_next_event is None:
                 Session.get(self).kill()
                 self.active = False
 
-        self._update_history()
+        if record:
+            self._update_history()
+
         await self.send_message(self.page)
 
     # Validation Methods
@@ -1,34 +1,72 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, TYPE_CHECKING, Tuple
 
 import emoji
-from discord import DMChannel, Emoji, Message, PartialEmoji, RawReactionActionEvent, Reaction
+from discord import DMChannel, Embed, Emoji, Message, PartialEmoji, RawReactionActionEvent
 from discord.abc import GuildChannel
 from discord.ext.commands import Context
 
 from dpymenus import BaseMenu, ButtonsError, EventError, SessionError
-from dpymenus.hooks import call_hook
-from dpymenus.settings import BUTTON_DELAY, HIDE_WARNINGS
+from dpymenus.components import (
+    COMPONENTS,
+    DEFAULT_BACKEND,
+    ComponentPress,
+    InputBackend,
+    component_router,
+    render_components,
+    set_components,
+)
+from dpymenus.hooks import HookEvent, HookWhen, call_hook
+from dpymenus.scheduler import BACKGROUND, CLEANUP, INTERACTIVE, Priority, request_scheduler
+from dpymenus.settings import BUTTON_DELAY, HIDE_WARNINGS, INPUT_BURST, INPUT_RATE, TOGGLE_BUTTONS
+from dpymenus.throttle import DEFAULT_INPUT_RATE, InputThrottle, ThrottleMode
 
 if TYPE_CHECKING:
     from dpymenus.types import Button
 
 
+def diff_reactions(
+    current: Sequence[Any], wanted: Sequence[Any], key: Callable[[Any], Any] = lambda button: button
+) -> Tuple[List[Any], List[Any]]:
+    """Returns the reactions to remove from a message and the reactions to add to it, in order, so that it shows
+    `wanted` instead of `current`. New reactions are always shown last, so reactions are only kept while they appear
+    in the same order as in `wanted`.
+
+    :param current: The reactions on the message, in the order they are shown.
+    :param wanted: The reactions the message should show, in order.
+    :param key: Returns the value reactions are compared by.
+    :rtype: Tuple[List[Any], List[Any]]
+    """
+    wanted_keys = [key(button) for button in wanted]
+    kept = 0
+    remove = []
+
+    for button in current:
+        if kept < len(wanted_keys) and key(button) == wanted_keys[kept]:
+            kept += 1
+        else:
+            remove.append(button)
+
+    return remove, list(wanted[kept:])
+
+
 class ButtonMenu(BaseMenu):
     """Represents a button-based response menu."""
 
-    _data: Dict
+    __slots__ = ('_adding', '_shown')
 
     def __init__(self, ctx: Context):
         super().__init__(ctx)
+        self._adding: Optional[asyncio.Task] = None
+        self._shown: Optional[List['Button']] = None
 
     def __repr__(self):
         return f'ButtonMenu({self.ctx})'
 
     @property
     def data(self) -> Dict:
-        return getattr(self, '_data', {})
+        return self._options.get('data', {})
 
     def set_data(self, data: Dict) -> 'ButtonMenu':
         """Sets a dictionary up for persistent state data. Returns itself for fluent-style chaining.
@@ -36,7 +74,61 @@ class ButtonMenu(BaseMenu):
         :param data: Structure representing variables that can be easily accessed across a menu instance.
         :rtype: :class:`TextMenu`
         """
-        self._data = data
+        self._set_option('data', data)
+
+        return self
+
+    @property
+    def input_throttle(self) -> Optional[InputThrottle]:
+        return self._options.get('input_throttle')
+
+    def set_input_throttle(
+        self,
+        rate: float = INPUT_RATE or DEFAULT_INPUT_RATE,
+        burst: int = INPUT_BURST,
+        mode: ThrottleMode = ThrottleMode.COLLAPSE,
+    ) -> 'ButtonMenu':
+        """Limits how fast the menu acts on button presses. Presses beyond the limit are handled before any request
+        is sent to Discord; `input_throttle.suppressed` counts them. Returns itself for fluent-style chaining.
+
+        :param rate: How many presses per second are accepted on average, per menu and per user. Defaults to the
+                     `input-rate` setting, or 2 if that is 0.
+        :param burst: How many presses may be accepted back to back.
+        :param mode: DROP ignores excess presses; COLLAPSE waits and only acts on the latest one.
+        :rtype: :class:`ButtonMenu`
+        """
+        self._set_option('input_throttle', InputThrottle(rate, burst, mode))
+
+        return self
+
+    @property
+    def toggle_buttons(self) -> bool:
+        return self._options.get('toggle_buttons', TOGGLE_BUTTONS)
+
+    def use_toggle_buttons(self) -> 'ButtonMenu':
+        """Counts both adding and removing a reaction as a button press in guild channels, like in DMs, so the menu
+        never has to remove the user's reaction. Halves the requests per press, but the user's reactions stay visible.
+        Returns itself for fluent-style chaining.
+
+        :rtype: :class:`ButtonMenu`
+        """
+        self._set_option('toggle_buttons', True)
+
+        return self
+
+    @property
+    def input_backend(self) -> InputBackend:
+        return self._options.get('input_backend', DEFAULT_BACKEND)
+
+    def set_input_backend(self, backend: InputBackend) -> 'ButtonMenu':
+        """Sets how the menu shows its buttons and receives presses. COMPONENTS shows message buttons, which are set
+        with a single request per page and never have to be removed after a press. Custom checks only apply to
+        reactions. Returns itself for fluent-style chaining.
+
+        :param backend: REACTIONS *(the default, or the `input-backend` setting)* or COMPONENTS.
+        :rtype: :class:`ButtonMenu`
+        """
+        self._set_option('input_backend', backend)
 
         return self
 
@@ -62,32 +154,35 @@ class ButtonMenu(BaseMenu):
             logging.info(exc.message)
 
         else:
-            await self._add_buttons()
+            self._start_adding_buttons()
             _first_iter = True
+            _page_index = self.page.index
 
-            await call_hook(self, '_hook_after_open')
+            await call_hook(self, HookWhen.AFTER, HookEvent.OPEN)
 
             while self.active:
-                await call_hook(self, '_hook_before_update')
+                await call_hook(self, HookWhen.BEFORE, HookEvent.UPDATE)
                 if _first_iter is False:
-                    if self.last_visited_page() != self.page.index:
+                    # compared with the page of the previous input rather than the history, which `back` rewinds
+                    if self.page.index != _page_index:
                         await asyncio.sleep(BUTTON_DELAY)
-                        await self._add_buttons()
+                        self._start_adding_buttons()
                     else:
-                        if self.output and isinstance(self.output.channel, GuildChannel):
-                            await self.output.remove_reaction(self.input, self.ctx.author)
-
-                # refresh our message content with the new reactions added; this is an API hit
-                self.output = await self.destination.fetch_message(self.output.id)
+                        if self.input and self._removes_reactions():
+                            await request_scheduler.remove_reaction(
+                                self.output, self.input, self.ctx.author, owner=self
+                            )
 
-                self.input = await self._get_input()
+                # buttons keep being added in the background; the ones already shown can be pressed right away
+                _page_index = self.page.index
+                self.input = await self._throttle_input(await self._get_input())
 
                 if self.input:
-                    await call_hook(self, '_hook_after_update')
-                    await self.page.on_next_event(self)
+                    await call_hook(self, HookWhen.AFTER, HookEvent.UPDATE)
+                    await self._call_event(self.page.on_next_event, self)
 
-                    if self.last_visited_page() != self.page.index:
-                        await self._safe_clear_reactions()
+                    if self.page.index != _page_index:
+                        await self._safe_clear_reactions(INTERACTIVE)
 
                 _first_iter = False
 
@@ -108,14 +203,7 @@ class ButtonMenu(BaseMenu):
 
     async def _get_input(self) -> Optional[Message]:
         """Waits for a user reaction input event and returns the message object."""
-        task_list = [self._get_reaction_add, self._shortcircuit]
-        if isinstance(self.output.channel, DMChannel):
-            task_list.append(self._get_reaction_remove)
-
-        tasks = [
-            asyncio.create_task(task())
-            for task in task_list
-        ]
+        tasks = [asyncio.create_task(task()) for task in [*self._press_listeners(), self._shortcircuit]]
 
         done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED, timeout=self.timeout)
 
@@ -129,24 +217,220 @@ class ButtonMenu(BaseMenu):
         else:
             for future in done:
                 result = future.result()
-                if result:
+                if result is not None:
                     return result
                 return
 
         self.kill_tasks(pending)
 
+    def _press_listeners(self) -> List[Callable[[], Awaitable[Optional['Button']]]]:
+        """Returns the event listeners which count as a button press. Bots can not remove reactions in a DM, so
+        removing one counts as a press there as well, and in toggle mode everywhere else."""
+        if self.input_backend is COMPONENTS:
+            return [self._get_component_press]
+
+        listeners = [self._get_reaction_add]
+        if isinstance(self.output.channel, DMChannel) or self.toggle_buttons:
+            listeners.append(self._get_reaction_remove)
+
+        return listeners
+
+    def _removes_reactions(self) -> bool:
+        """Returns true if the user's reaction has to be removed after each press, so the button can be pressed
+        again."""
+        return (
+            self.input_backend is not COMPONENTS
+            and bool(self.output)
+            and isinstance(self.output.channel, GuildChannel)
+            and not self.toggle_buttons
+        )
+
+    async def _throttle_input(self, button: Optional['Button']) -> Optional['Button']:
+        """Passes a button press through the input throttle, if there is one. Returns the button to act on, or None
+        if the press was dropped. In collapse mode, waits until the throttle allows a press and returns the latest
+        one made in the meantime."""
+        throttle = self.input_throttle
+        if throttle is None and INPUT_RATE:
+            throttle = InputThrottle(INPUT_RATE, INPUT_BURST)
+            self._set_option('input_throttle', throttle)
+
+        if button is None or throttle is None:
+            return button
+
+        delay = throttle.acquire(self.ctx.author.id)
+        if delay == 0:
+            return button
+
+        if throttle.mode is ThrottleMode.DROP:
+            await self._suppress_press(throttle, button)
+            return
+
+        listeners = {asyncio.create_task(listener()): listener for listener in self._press_listeners()}
+        try:
+            while delay > 0:
+                done, _ = await asyncio.wait(listeners, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not self.active:
+                    return
+
+                for task in done:
+                    listener = listeners.pop(task)
+                    listeners[asyncio.create_task(listener())] = listener
+                    # a newer press replaces the one that was waiting
+                    if task.result() is not None:
+                        await self._suppress_press(throttle, button)
+                        button = task.result()
+
+                delay = throttle.acquire(self.ctx.author.id)
+
+            return button
+
+        finally:
+            self.kill_tasks(list(listeners))
+
+    async def _suppress_press(self, throttle: InputThrottle, button: Optional['Button']):
+        """Counts a press the throttle will not act on, and removes its reaction where the menu would otherwise do so
+        after acting on it, so the button keeps working."""
+        throttle.suppressed += 1
+
+        if self._removes_reactions() and not isinstance(button, int):
+            await request_scheduler.remove_reaction(
+                self.output, button, self.ctx.author, owner=self, priority=BACKGROUND
+            )
+
+    def _start_adding_buttons(self):
+        """Adds the page buttons in the background, so the menu listens for input while they are being added."""
+        self._stop_adding_buttons()
+        self._adding = asyncio.create_task(self._add_buttons())
+        self._adding.add_done_callback(self._log_button_error)
+
+    def _stop_adding_buttons(self):
+        """Cancels adding buttons which may still be in progress."""
+        if self._adding is not None:
+            self._adding.cancel()
+            self._adding = None
+
+    @staticmethod
+    def _log_button_error(task: asyncio.Task):
+        """Logs errors from adding buttons in the background, which would otherwise go unnoticed."""
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f'Failed to add menu buttons: {task.exception()}')
+
+    @staticmethod
+    def _button_name(button: 'Button') -> str:
+        """Returns the name a reaction event reports for a button. Custom emoji strings such as `<:name:id>` or
+        `name:id` are reduced to their name."""
+        if isinstance(button, (Emoji, PartialEmoji)):
+            return button.name
+
+        parts = str(button).strip('<>').split(':')
+
+        return parts[-2] if len(parts) > 1 else parts[0]
+
     async def _add_buttons(self):
         """Adds reactions to the message object based on what was passed into the page buttons."""
-        for button in self.page.buttons_list:
-            await self.output.add_reaction(button)
-            await asyncio.sleep(BUTTON_DELAY)
+        await self._sync_buttons(self.page.buttons_list)
+
+    async def _sync_buttons(self, buttons: List['Button']):
+        """Changes the bot's reactions on the output message to `buttons`. Reactions which are already in place are
+        kept, so a message edited in place only costs the reactions that differ between two pages."""
+        if self.input_backend is COMPONENTS:
+            return await self._set_components(buttons)
+
+        if self._shown is None:
+            self._shown = []
+
+        remove, add = diff_reactions(self._shown, [button for button in buttons if button], key=self._button_name)
+
+        # requests of the same menu run in order, so every removal is done before the first reaction is added
+        await asyncio.gather(
+            *(self._remove_button(button) for button in remove), *(self._add_button(button) for button in add)
+        )
+
+    async def _add_button(self, button: 'Button'):
+        """Adds one reaction. It is recorded as shown by the request itself, so a sync cancelled while the request
+        is in flight does not leave `_shown` behind."""
+        await request_scheduler.submit(
+            (self.output.channel.id, 'reactions'), self._show_button, self.output, button, owner=self
+        )
+
+    async def _remove_button(self, button: 'Button'):
+        """Removes one of the bot's reactions. Like `_add_button`, the request itself records it as no longer
+        shown."""
+        await request_scheduler.submit(
+            (self.output.channel.id, 'reactions'), self._hide_button, self.output, button, owner=self
+        )
+
+    async def _show_button(self, message: Message, button: 'Button'):
+        """Runs in the scheduler; reacts with a button and records it as shown, unless the output message has been
+        replaced meanwhile."""
+        await message.add_reaction(button)
+        if message is self.output and self._shown is not None:
+            self._shown.append(button)
+
+    async def _hide_button(self, message: Message, button: 'Button'):
+        """Runs in the scheduler; removes the bot's reaction of a button and records it as no longer shown."""
+        await message.remove_reaction(button, self.ctx.me)
+        if message is self.output and self._shown is not None and button in self._shown:
+            self._shown.remove(button)
+
+    async def _set_components(self, buttons: List['Button'], priority: Priority = INTERACTIVE):
+        """Replaces the message buttons on the output message with `buttons` in a single request."""
+        buttons = [button for button in buttons if button]
+        if buttons == (self._shown or []):
+            return
+
+        components = []
+        if buttons:
+            component_router.listen(self.ctx.bot, self.output.id)
+            components = render_components(buttons, self.output.id) + self._extra_components()
+
+        await request_scheduler.submit(
+            (self.output.channel.id, 'edit'),
+            set_components,
+            self.ctx.bot.http,
+            self.output,
+            components,
+            owner=self,
+            priority=priority,
+        )
+        self._shown = buttons
+
+    def _extra_components(self) -> List[Dict[str, Any]]:
+        """Returns action rows to show below the buttons. Subclasses add their own controls here."""
+        return []
+
+    async def _get_component_press(self) -> Optional['Button']:
+        """Waits for the menu's user to press one of the message buttons and returns the button."""
+        presses = component_router.listen(self.ctx.bot, self.output.id)
+
+        while True:
+            result = self._press_input(await presses.get())
+            if result is not None:
+                return result
+
+    def _press_input(self, press: ComponentPress) -> Optional['Button']:
+        """Returns the button a component press stands for, or None if it should be ignored. Presses on buttons which
+        were rendered for another page are ignored, even if a button is now shown at the same position."""
+        if press.user_id != self.ctx.author.id or press.index >= len(self._shown or []):
+            return
+
+        button = self._shown[press.index]
+        if press.name == self._button_name(button):
+            return button
+
+    async def _resend(self, embed: Embed):
+        """Extends resending the output message with adding the buttons to the new message."""
+        component_router.forget(self.output.id)
+        await super()._resend(embed)
+        self._shown = None
+        self._start_adding_buttons()
 
     async def _get_reaction_add(self) -> Optional['Button']:
         """Waits for a user reaction add event and returns the event object."""
         try:
             event = await self.ctx.bot.wait_for(
                 'raw_reaction_add',
-                check=self.custom_check if self.custom_check else self._check_reaction,
+                check=self._watched_check(self.custom_check) if self.custom_check else self._check_reaction,
             )
 
         except asyncio.TimeoutError:
@@ -163,7 +447,7 @@ class ButtonMenu(BaseMenu):
         try:
             event = await self.ctx.bot.wait_for(
                 'raw_reaction_remove',
-                check=self.custom_check if self.custom_check else self._check_reaction,
+                check=self._watched_check(self.custom_check) if self.custom_check else self._check_reaction,
             )
 
         except asyncio.TimeoutError:
@@ -196,27 +480,47 @@ class ButtonMenu(BaseMenu):
             else:
                 return reaction_event.emoji
 
-    async def _safe_clear_reactions(self):
-        """Removes all reactions from the output message object if the bot has permissions."""
-        if self.output and isinstance(self.output.channel, GuildChannel):
-            await self.output.clear_reactions()
+    def _cleanup_tasks(self) -> List[Awaitable]:
+        """Extends the close cleanup with clearing reactions. Deleting the output message also removes its reactions,
+        so they are only cleared when the message persists."""
+        tasks = super()._cleanup_tasks()
+
+        if self.output:
+            component_router.forget(self.output.id)
+
+        if self.output and self.persist:
+            tasks.append(self._clear_reactions_on_close())
+
+        return tasks
+
+    async def _clear_reactions_on_close(self):
+        """Waits for pending reaction updates to settle, then clears the reactions."""
+        await asyncio.sleep(BUTTON_DELAY)
+        await self._safe_clear_reactions()
+
+    async def _safe_clear_reactions(self, priority: Priority = CLEANUP):
+        """Stops adding buttons and removes all reactions from the output message object if the bot has
+        permissions. Outside of guild channels the reactions are kept, and the next page's buttons are synced with
+        them instead. Message buttons are replaced in one request on every page change, so they are only removed
+        once the menu has closed."""
+        self._stop_adding_buttons()
+
+        if self.input_backend is COMPONENTS:
+            if self.output and not self.active:
+                await self._set_components([], priority)
+
+        elif self.output and isinstance(self.output.channel, GuildChannel):
+            await request_scheduler.clear_reactions(self.output, owner=self, priority=priority)
+            self._shown = None
 
     def _check_reaction(self, event: RawReactionActionEvent) -> bool:
         """Returns true if the event author is the same as the initial value in the menu context.
-        Additionally, checks if the reaction is a valid button (and not a user added reaction)."""
-        # very cursed code...
+        Additionally, checks if the reaction is a valid button (and not a user added reaction). Buttons are checked
+        against the page rather than the message, so they work before every reaction has been added."""
         return (
             event.user_id == self.ctx.author.id
             and event.message_id == self.output.id
-            and any(
-                event.emoji.name == btn
-                for btn in [
-                    (reaction.emoji.name if isinstance(reaction.emoji, Emoji) else reaction.emoji)
-                    if isinstance(reaction, Reaction)
-                    else reaction
-                    for reaction in self.output.reactions
-                ]
-            )
+            and any(event.emoji.name == self._button_name(btn) for btn in self.page.buttons_list)
         )
 
     # Validation Checks
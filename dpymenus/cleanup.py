@@ -0,0 +1,112 @@
+import asyncio
+import datetime
+import logging
+from typing import Dict, List, Set
+
+from discord import HTTPException, Message, NotFound, TextChannel
+from discord.utils import time_snowflake
+
+from dpymenus.scheduler import CLEANUP, request_scheduler
+from dpymenus.settings import BATCH_DELETE_INTERVAL, BATCH_DELETE_SIZE
+
+# Discord refuses to bulk delete messages older than two weeks; keep a small margin for clock drift
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14, minutes=-5)
+BULK_DELETE_LIMIT = 100
+
+
+class DeleteQueue:
+    """Collects messages per channel and deletes them with a single bulk delete request once the batch is full or
+    the flush interval has passed. Messages that can not be bulk deleted, because they are too old or not in a
+    guild text channel, are deleted one at a time.
+
+    :param interval: How long, in seconds, a message may wait in the queue before its batch is flushed.
+    :param size: How many messages a batch may hold before it is flushed early; capped at 100.
+    """
+
+    def __init__(self, interval: float, size: int):
+        self.interval: float = interval
+        self.size: int = min(size, BULK_DELETE_LIMIT)
+        self._pending: Dict[int, List[Message]] = {}
+        self._timers: Dict[int, asyncio.Task] = {}
+        self._flushes: Set[asyncio.Task] = set()
+
+    def add(self, message: Message):
+        """Queues a message for deletion.
+
+        :param message: The message to delete.
+        """
+        if not isinstance(message.channel, TextChannel):
+            self._track(asyncio.create_task(self._delete(message)))
+            return
+
+        channel_id = message.channel.id
+        pending = self._pending.setdefault(channel_id, [])
+        pending.append(message)
+
+        if len(pending) >= self.size:
+            self._track(asyncio.create_task(self.flush(channel_id)))
+        elif channel_id not in self._timers:
+            self._timers[channel_id] = asyncio.create_task(self._flush_later(channel_id))
+
+    async def flush(self, channel_id: int):
+        """Deletes every queued message in a channel immediately.
+
+        :param channel_id: The channel to flush.
+        """
+        timer = self._timers.pop(channel_id, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+        messages = self._pending.pop(channel_id, [])
+        if not messages:
+            return
+
+        channel = messages[0].channel
+        cutoff = time_snowflake(datetime.datetime.utcnow() - BULK_DELETE_MAX_AGE)
+        recent = [message for message in messages if message.id > cutoff]
+
+        for i in range(0, len(recent), BULK_DELETE_LIMIT):
+            chunk = recent[i : i + BULK_DELETE_LIMIT]
+            if len(chunk) == 1:
+                await self._delete(chunk[0])
+                continue
+
+            try:
+                await channel.delete_messages(chunk)
+            except HTTPException as exc:
+                logging.warning(f'Bulk delete of {len(chunk)} messages failed: {exc}; deleting them one at a time.')
+                for message in chunk:
+                    await self._delete(message)
+
+        for message in messages:
+            if message.id <= cutoff:
+                await self._delete(message)
+
+    async def flush_all(self):
+        """Deletes every queued message in every channel immediately."""
+        await asyncio.gather(*(self.flush(channel_id) for channel_id in list(self._pending)))
+
+    # Internal Methods
+    async def _flush_later(self, channel_id: int):
+        """Flushes a channel once the interval has passed."""
+        await asyncio.sleep(self.interval)
+        await self.flush(channel_id)
+
+    def _track(self, task: asyncio.Task):
+        """Keeps a reference to a background task until it completes."""
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    @staticmethod
+    async def _delete(message: Message):
+        """Deletes a single message, ignoring messages that were already deleted. Other failures are logged, so one
+        message that can not be deleted does not stop the rest of its batch."""
+        try:
+            await request_scheduler.delete(message, priority=CLEANUP)
+        except NotFound:
+            pass
+        except HTTPException as exc:
+            logging.warning(f'Could not delete message {message.id}: {exc}.')
+
+
+delete_queue = DeleteQueue(BATCH_DELETE_INTERVAL, BATCH_DELETE_SIZE)
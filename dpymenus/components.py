@@ -0,0 +1,245 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Tuple
+from weakref import WeakSet
+
+from discord import Emoji, HTTPException, Message, PartialEmoji
+from discord.http import HTTPClient, Route
+
+from dpymenus.exceptions import ButtonsError
+from dpymenus.settings import INPUT_BACKEND
+
+if TYPE_CHECKING:
+    from dpymenus.types import Button
+
+# Discord API values; discord.py 1.7 does not model message components, so they are sent as raw payloads
+ACTION_ROW = 1
+BUTTON = 2
+SECONDARY_STYLE = 2
+STRING_SELECT = 3
+COMPONENT_INTERACTION = 3
+DEFERRED_UPDATE_MESSAGE = 6
+BUTTONS_PER_ROW = 5
+ROWS_PER_MESSAGE = 5
+SELECT_OPTIONS_LIMIT = 25
+
+# a select menu takes the custom ID position after the last possible button
+SELECT_INDEX = BUTTONS_PER_ROW * ROWS_PER_MESSAGE
+
+CUSTOM_ID_PREFIX = 'dpymenus'
+
+
+class InputBackend(Enum):
+    """Defines how a menu shows its buttons and receives button presses.
+
+    REACTIONS adds a reaction per button. COMPONENTS shows message buttons, which are set with a single request and
+    never have to be removed after a press.
+    """
+
+    REACTIONS = 0
+    COMPONENTS = 1
+
+
+# map Enum references so we can export them in a user-friendly way
+REACTIONS = InputBackend.REACTIONS
+COMPONENTS = InputBackend.COMPONENTS
+
+DEFAULT_BACKEND = InputBackend[INPUT_BACKEND.upper()]
+
+
+@dataclass
+class ComponentPress:
+    """A user pressing one of a menu's message buttons, or picking options from its select menu. `name` is the emoji
+    name of the pressed button as it was rendered, so a press on buttons that have since been replaced can be told
+    apart from a press on the buttons now shown."""
+
+    user_id: int
+    message_id: int
+    index: int
+    values: Tuple[str, ...] = ()
+    name: str = ''
+
+
+def render_components(buttons: Sequence['Button'], message_id: int) -> List[Dict[str, Any]]:
+    """Returns the action rows showing `buttons` as message buttons, five per row. Each button's custom ID holds the
+    message ID, the button's position, and its emoji name, which is how presses are routed back to their menu.
+
+    :param buttons: The buttons to show, in order; at most 25.
+    :param message_id: The ID of the message the buttons are shown on.
+    :rtype: List[Dict[str, Any]]
+    """
+    if len(buttons) > BUTTONS_PER_ROW * ROWS_PER_MESSAGE:
+        raise ButtonsError(
+            f'A message can show at most {BUTTONS_PER_ROW * ROWS_PER_MESSAGE} buttons. Found {len(buttons)}.'
+        )
+
+    components = []
+    for index, button in enumerate(buttons):
+        emoji = _emoji_payload(button)
+        components.append(
+            {
+                'type': BUTTON,
+                'style': SECONDARY_STYLE,
+                'emoji': emoji,
+                'custom_id': f'{CUSTOM_ID_PREFIX}:{message_id}:{index}:{emoji["name"]}',
+            }
+        )
+
+    return [
+        {'type': ACTION_ROW, 'components': components[i : i + BUTTONS_PER_ROW]}
+        for i in range(0, len(components), BUTTONS_PER_ROW)
+    ]
+
+
+def page_buckets(page_count: int) -> range:
+    """Splits pages into at most 25 equally sized ranges, one per select option, and returns the first page index of
+    each. The bucket holding any page is `index // buckets.step`, so nothing here depends on the number of pages.
+
+    :param page_count: How many pages the menu has.
+    :rtype: range
+    """
+    size = max(1, -(-page_count // SELECT_OPTIONS_LIMIT))
+
+    return range(0, page_count, size)
+
+
+def render_page_select(page_count: int, message_id: int) -> Dict[str, Any]:
+    """Returns an action row with a select menu for jumping to a range of pages. Each option's value is the index of
+    the first page in its range.
+
+    :param page_count: How many pages the menu has.
+    :param message_id: The ID of the message the select menu is shown on.
+    :rtype: Dict[str, Any]
+    """
+    buckets = page_buckets(page_count)
+    options = []
+    for first in buckets:
+        last = min(first + buckets.step, page_count)
+        label = f'Page {last}' if last == first + 1 else f'Pages {first + 1}-{last}'
+        options.append({'label': label, 'value': str(first)})
+
+    select = {
+        'type': STRING_SELECT,
+        'custom_id': f'{CUSTOM_ID_PREFIX}:{message_id}:{SELECT_INDEX}',
+        'placeholder': 'Jump to page',
+        'options': options,
+    }
+
+    return {'type': ACTION_ROW, 'components': [select]}
+
+
+def parse_custom_id(custom_id: str) -> Optional[Tuple[int, int, str]]:
+    """Returns the message ID, button position, and emoji name a custom ID was rendered with, or None if it does not
+    belong to a menu. Select menus have no emoji name, so theirs is empty.
+
+    :param custom_id: The custom ID of a pressed component.
+    :rtype: Optional[Tuple[int, int, str]]
+    """
+    prefix, _, rest = custom_id.partition(':')
+    message_id, _, rest = rest.partition(':')
+    index, _, name = rest.partition(':')
+    if prefix != CUSTOM_ID_PREFIX or not message_id.isdigit() or not index.isdigit():
+        return None
+
+    return int(message_id), int(index), name
+
+
+class ComponentRouter:
+    """Routes component interactions to menus through one `socket_response` listener per bot.
+
+    Menus register the message their buttons are on and receive presses from a queue. Every press on a registered
+    message is acknowledged right away, so Discord never reports the interaction as failed, even if the menu ignores
+    the press.
+    """
+
+    def __init__(self):
+        self._routes: Dict[int, Tuple[HTTPClient, asyncio.Queue]] = {}
+        self._bots: WeakSet = WeakSet()
+
+    def listen(self, bot: Any, message_id: int) -> asyncio.Queue:
+        """Registers a message and returns the queue its presses are put in.
+
+        :param bot: The bot the message was sent by.
+        :param message_id: The ID of the message with the buttons.
+        :rtype: :class:`asyncio.Queue`
+        """
+        if bot not in self._bots:
+            bot.add_listener(self._on_socket_response, 'on_socket_response')
+            self._bots.add(bot)
+
+        route = self._routes.get(message_id)
+        if route is None:
+            route = self._routes[message_id] = (bot.http, asyncio.Queue())
+
+        return route[1]
+
+    def forget(self, message_id: int):
+        """Stops routing presses for a message.
+
+        :param message_id: The ID of the message with the buttons.
+        """
+        self._routes.pop(message_id, None)
+
+    # Internal Methods
+    async def _on_socket_response(self, payload: Dict[str, Any]):
+        """Puts component presses on registered messages in their queue, and acknowledges them."""
+        if payload.get('t') != 'INTERACTION_CREATE':
+            return
+
+        data = payload.get('d') or {}
+        if data.get('type') != COMPONENT_INTERACTION:
+            return
+
+        parsed = parse_custom_id(data.get('data', {}).get('custom_id', ''))
+        route = self._routes.get(parsed[0]) if parsed else None
+        if route is None:
+            return
+
+        http, queue = route
+        user = data.get('member', {}).get('user') or data.get('user', {})
+        values = tuple(data['data'].get('values', ()))
+        queue.put_nowait(ComponentPress(int(user['id']), parsed[0], parsed[1], values, parsed[2]))
+
+        try:
+            await http.request(
+                Route(
+                    'POST',
+                    '/interactions/{interaction_id}/{interaction_token}/callback',
+                    interaction_id=data['id'],
+                    interaction_token=data['token'],
+                ),
+                json={'type': DEFERRED_UPDATE_MESSAGE},
+            )
+        except HTTPException as exc:
+            logging.warning(f'Could not acknowledge a button press on message {parsed[0]}: {exc}.')
+
+
+async def set_components(http: HTTPClient, message: Message, components: List[Dict[str, Any]]):
+    """Replaces the components of a message, leaving its content and embeds as they are."""
+    await http.request(
+        Route(
+            'PATCH',
+            '/channels/{channel_id}/messages/{message_id}',
+            channel_id=message.channel.id,
+            message_id=message.id,
+        ),
+        json={'components': components},
+    )
+
+
+def _emoji_payload(button: 'Button') -> Dict[str, Any]:
+    """Returns the partial emoji payload of a button; custom emoji strings such as `<:name:id>` or `<a:name:id>`
+    are split into their parts."""
+    if isinstance(button, (Emoji, PartialEmoji)):
+        return {'name': button.name, 'id': button.id, 'animated': button.animated}
+
+    parts = str(button).strip('<>').split(':')
+    if len(parts) > 1 and parts[-1].isdigit():
+        return {'name': parts[-2], 'id': int(parts[-1]), 'animated': parts[0] == 'a'}
+
+    return {'name': str(button)}
+
+
+component_router = ComponentRouter()
@@ -1,6 +1,12 @@
+from dpymenus.matcher import ResponseMatcher
 from dpymenus.settings import CONSTANTS_BUTTONS, CONSTANTS_CONFIRM, CONSTANTS_DENY, CONSTANTS_QUIT
 
-CONFIRM = CONSTANTS_CONFIRM
-DENY = CONSTANTS_DENY
-QUIT = CONSTANTS_QUIT
+# compiled once on load; see `ResponseMatcher` for why these are not plain lists
+CONFIRM = ResponseMatcher(CONSTANTS_CONFIRM)
+DENY = ResponseMatcher(CONSTANTS_DENY)
+QUIT = ResponseMatcher(CONSTANTS_QUIT)
 GENERIC_BUTTONS = CONSTANTS_BUTTONS
+PAGE_NUMBER = ResponseMatcher(patterns=[r'\d{1,9}'])
+
+# Discord limits how many different reactions a single message can have
+REACTIONS_PER_MESSAGE = 20
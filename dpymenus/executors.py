@@ -0,0 +1,138 @@
+import asyncio
+import inspect
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional
+
+from dpymenus.exceptions import EventError
+from dpymenus.settings import PROCESS_POOL_WORKERS, THREAD_POOL_WORKERS
+
+
+class ExecutionMode(Enum):
+    """Defines where a page builder or callback is executed.
+
+    INLINE runs on the event loop, BLOCKING runs in a shared thread pool, and CPU_BOUND runs in a shared process pool.
+    """
+
+    INLINE = 0
+    BLOCKING = 1
+    CPU_BOUND = 2
+
+
+# map Enum references so we can export them in a user-friendly way
+INLINE = ExecutionMode.INLINE
+BLOCKING = ExecutionMode.BLOCKING
+CPU_BOUND = ExecutionMode.CPU_BOUND
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def blocking(fn: Callable) -> Callable:
+    """Marks a synchronous function as doing blocking I/O, so menus run it in the shared thread pool."""
+    return _mark(fn, ExecutionMode.BLOCKING)
+
+
+def cpu_bound(fn: Callable) -> Callable:
+    """Marks a module-level synchronous function as CPU-heavy, so menus run it in the shared process pool. Its
+    arguments and return value must be picklable; page builders should return a dictionary rather than a Page.
+    Page callbacks receive the menu, which can not be pickled, so they should use `@blocking` instead."""
+    return _mark(fn, ExecutionMode.CPU_BOUND)
+
+
+def execution_mode(fn: Callable) -> ExecutionMode:
+    """Returns how a function was marked to run. Unmarked functions run inline."""
+    return getattr(fn, 'execution_mode', ExecutionMode.INLINE)
+
+
+def get_executor(mode: ExecutionMode) -> Optional[Executor]:
+    """Returns the shared executor for an execution mode, creating it on first use. Returns None for INLINE."""
+    global _thread_pool, _process_pool
+
+    if mode is ExecutionMode.BLOCKING:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(max_workers=THREAD_POOL_WORKERS or None, thread_name_prefix='dpymenus')
+        return _thread_pool
+
+    if mode is ExecutionMode.CPU_BOUND:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=_process_workers())
+        return _process_pool
+
+    return None
+
+
+def shutdown_executors(wait: bool = True):
+    """Shuts down the shared executors. They are recreated on the next use, so this is safe to call when
+    unloading a cog."""
+    global _thread_pool, _process_pool
+
+    for executor in (_thread_pool, _process_pool):
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    _thread_pool = _process_pool = None
+
+
+async def run_in_executor(fn: Callable, *args) -> Any:
+    """Runs a function in the executor matching its execution mode. The result is awaited on the event loop if
+    the function returned an awaitable."""
+    executor = get_executor(execution_mode(fn))
+
+    if executor is None:
+        result = fn(*args)
+    else:
+        result = await asyncio.get_running_loop().run_in_executor(executor, partial(fn, *args))
+
+    if inspect.isawaitable(result):
+        result = await result
+
+    return result
+
+
+async def map_in_executor(fn: Callable, inputs: Iterable) -> List[Any]:
+    """Calls a function once per input in the executor matching its execution mode, preserving input order.
+    Inputs sent to the process pool are split into one chunk per worker to keep pickling overhead low."""
+    mode = execution_mode(fn)
+    inputs = list(inputs)
+
+    if mode is ExecutionMode.INLINE:
+        return [fn(i) for i in inputs]
+
+    executor = get_executor(mode)
+    loop = asyncio.get_running_loop()
+
+    if mode is ExecutionMode.BLOCKING:
+        return list(await asyncio.gather(*(loop.run_in_executor(executor, fn, i) for i in inputs)))
+
+    size = -(-len(inputs) // _process_workers()) or 1
+    chunks = [inputs[i : i + size] for i in range(0, len(inputs), size)]
+    results = await asyncio.gather(*(loop.run_in_executor(executor, _map_chunk, fn, chunk) for chunk in chunks))
+
+    return [result for chunk in results for result in chunk]
+
+
+def _mark(fn: Callable, mode: ExecutionMode) -> Callable:
+    """Sets the execution mode of a function. Coroutine functions are rejected: calling one in an executor only
+    creates the coroutine, which would still run on the event loop."""
+    if inspect.iscoroutinefunction(fn):
+        raise EventError(
+            f'`{fn.__qualname__}` is a coroutine function and already runs on the event loop; only synchronous '
+            f'functions can be marked as {mode.name.lower()}.'
+        )
+
+    fn.execution_mode = mode
+
+    return fn
+
+
+def _process_workers() -> int:
+    """Returns the size of the shared process pool."""
+    return PROCESS_POOL_WORKERS or os.cpu_count() or 1
+
+
+def _map_chunk(fn: Callable, chunk: List[Any]) -> List[Any]:
+    """Runs inside a worker process; must stay at module level so it can be pickled."""
+    return [fn(i) for i in chunk]
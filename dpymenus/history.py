@@ -0,0 +1,128 @@
+from array import array
+from typing import Iterator, Optional
+
+from dpymenus.settings import HISTORY_CACHE_LIMIT
+
+
+class History:
+    """Stores the page indices a menu has visited, oldest first. Once the limit is reached, the oldest entry is
+    overwritten in place, so recording a visit is O(1) regardless of the limit. Stepping back moves entries onto a
+    forward stack, which is discarded when a new page is visited, like the history of a web browser.
+
+    Indices are stored in int arrays rather than lists, and the arrays are only allocated once they are needed, to
+    keep the cost per session low.
+
+    :param limit: How many entries to keep. 0 is no limit.
+    """
+
+    __slots__ = ('_limit', '_items', '_start', '_size', '_forward')
+
+    def __init__(self, limit: int = HISTORY_CACHE_LIMIT):
+        self._limit: int = limit
+        self._items: Optional[array] = None
+        self._start: int = 0
+        self._size: int = 0
+        self._forward: Optional[array] = None
+
+    def __repr__(self):
+        return f'History({list(self)})'
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        for i in range(self._size):
+            yield self._items[self._physical(i)]
+
+    def __getitem__(self, i: int) -> int:
+        if i < 0:
+            i += self._size
+
+        if not 0 <= i < self._size:
+            raise IndexError('history index out of range')
+
+        return self._items[self._physical(i)]
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, limit: int):
+        """Changes how many entries are kept, dropping the oldest ones if needed.
+
+        :param limit: How many entries to keep. 0 is no limit.
+        """
+        items = list(self)
+        if limit:
+            items = items[-limit:]
+
+        self._limit = limit
+        self._items = array('i', items) if items else None
+        self._start = 0
+        self._size = len(items)
+
+    def append(self, index: int):
+        """Records a visit to a page, clearing the forward stack.
+
+        :param index: The visited page index.
+        """
+        self._forward = None
+        self._push(index)
+
+    def back(self) -> Optional[int]:
+        """Steps back one entry. Returns the page index to display, or None if there is nothing to go back to.
+
+        :rtype: Optional[int]
+        """
+        if self._size < 2:
+            return None
+
+        if self._forward is None:
+            self._forward = array('i')
+
+        self._forward.append(self._pop())
+
+        return self[-1]
+
+    def forward(self) -> Optional[int]:
+        """Steps forward one entry after going back. Returns the page index to display, or None if there is
+        nothing to go forward to.
+
+        :rtype: Optional[int]
+        """
+        if not self._forward:
+            return None
+
+        index = self._forward.pop()
+        self._push(index)
+
+        return index
+
+    # Internal Methods
+    def _physical(self, i: int) -> int:
+        """Maps a logical position, oldest first, to its position in the ring buffer."""
+        return (self._start + i) % self._limit if self._limit else i
+
+    def _push(self, index: int):
+        """Adds an entry, overwriting the oldest one when the buffer is full."""
+        if self._items is None:
+            self._items = array('i')
+
+        if not self._limit or self._size < self._limit:
+            position = self._physical(self._size)
+            if position < len(self._items):
+                self._items[position] = index
+            else:
+                self._items.append(index)
+            self._size += 1
+
+        else:
+            self._items[self._start] = index
+            self._start = (self._start + 1) % self._limit
+
+    def _pop(self) -> int:
+        """Removes and returns the newest entry."""
+        index = self[-1]
+        self._size -= 1
+
+        return index
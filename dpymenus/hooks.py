@@ -1,5 +1,9 @@
+import asyncio
+import logging
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Set, TYPE_CHECKING, Tuple
+
+from dpymenus.settings import AFTER_HOOK_TIMEOUT, HOOK_TIMEOUT
 
 if TYPE_CHECKING:
     from dpymenus import BaseMenu
@@ -37,7 +41,89 @@ BEFORE = HookWhen.BEFORE
 AFTER = HookWhen.AFTER
 
 
-async def call_hook(instance: 'BaseMenu', hook: str):
-    """Checks if a menu instance contains a valid hook attribute and calls it asynchronously."""
-    if fn := getattr(instance, hook, None):
-        await fn()
+class HookRegistry:
+    """Stores hook callbacks by when and event. Any number of callbacks can be registered for the same hook, and
+    each may define its own timeout in seconds.
+
+    Every menu holds its own registry; callbacks added to the module-level `global_hooks` registry run for all menus.
+    """
+
+    def __init__(self):
+        self._hooks: Dict[Tuple[HookWhen, HookEvent], List[Tuple[Callable, Optional[float]]]] = {}
+
+    def add(self, when: HookWhen, event: HookEvent, callback: Callable, timeout: Optional[float] = None):
+        """Registers a sync or async callback for a hook.
+
+        :param when: Defines which point in the menu lifetime the callback will be executed.
+        :param event: Defines which event in the menu lifetime the callback will be executed on.
+        :param callback: References a function or method which will be executed based on the `when` and `event` params.
+        :param timeout: How long, in seconds, the callback may run before it is cancelled. Defaults to the
+                        `hook-timeout` setting.
+        """
+        self._hooks.setdefault((when, event), []).append((callback, timeout))
+
+    def remove(self, when: HookWhen, event: HookEvent, callback: Callable):
+        """Unregisters every occurrence of a callback from a hook."""
+        if hooks := self._hooks.get((when, event)):
+            hooks[:] = [hook for hook in hooks if hook[0] != callback]
+
+    def get(self, when: HookWhen, event: HookEvent) -> List[Tuple[Callable, Optional[float]]]:
+        """Returns the callbacks registered for a hook."""
+        return self._hooks.get((when, event), [])
+
+
+global_hooks = HookRegistry()
+
+# AFTER hooks running in the background; referenced here so they are not garbage collected while they run
+_background_hooks: Set[asyncio.Task] = set()
+
+
+def add_global_hook(when: HookWhen, event: HookEvent, callback: Callable, timeout: Optional[float] = None):
+    """Registers a callback which runs for every menu. See :meth:`HookRegistry.add`."""
+    global_hooks.add(when, event, callback, timeout)
+
+
+async def call_hook(instance: 'BaseMenu', when: HookWhen, event: HookEvent):
+    """Calls the global and menu callbacks registered for a hook. BEFORE hooks run one after another, in the order
+    they were added. AFTER hooks are independent of each other and of the menu, so they are started in the
+    background and run concurrently; a slow AFTER hook never holds up the next render."""
+    hooks = global_hooks.get(when, event)
+    if instance._hooks:
+        hooks = [*hooks, *instance._hooks.get(when, event)]
+
+    if not hooks:
+        return
+
+    if when is HookWhen.BEFORE:
+        for callback, timeout in hooks:
+            await _run_hook(instance, callback, timeout)
+    else:
+        task = asyncio.create_task(_run_after_hooks(instance, hooks))
+        _background_hooks.add(task)
+        task.add_done_callback(_background_hooks.discard)
+
+
+async def _run_after_hooks(instance: 'BaseMenu', hooks: List[Tuple[Callable, Optional[float]]]):
+    """Runs AFTER hooks concurrently and logs the ones that failed. Hooks without a timeout of their own are bounded
+    by `hook-timeout`, or by `after-hook-timeout` if that is unlimited, so background hooks can not pile up."""
+    results = await asyncio.gather(
+        *(
+            _run_hook(instance, callback, timeout if timeout is not None else HOOK_TIMEOUT or AFTER_HOOK_TIMEOUT)
+            for callback, timeout in hooks
+        ),
+        return_exceptions=True,
+    )
+
+    for (callback, _), result in zip(hooks, results):
+        if isinstance(result, Exception):
+            logging.error(f'Hook {getattr(callback, "__qualname__", callback)} raised {result!r}.')
+
+
+async def _run_hook(instance: 'BaseMenu', callback: Callable, timeout: Optional[float]):
+    """Runs a single hook callback, cancelling it if it exceeds its timeout."""
+    timeout = timeout if timeout is not None else HOOK_TIMEOUT
+
+    try:
+        await asyncio.wait_for(instance._call_event(callback), timeout or None)
+    except asyncio.TimeoutError:
+        logging.warning(f'Hook {getattr(callback, "__qualname__", callback)} timed out after {timeout}s.')
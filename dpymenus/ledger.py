@@ -0,0 +1,220 @@
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, TYPE_CHECKING, Union
+
+from dpymenus.executors import ExecutionMode, get_executor
+from dpymenus.settings import LEDGER_FLUSH_INTERVAL, LEDGER_SNAPSHOT_EVENTS
+
+if TYPE_CHECKING:
+    from dpymenus.tally import VoteTally
+
+LEDGER_FORMAT = 1
+
+
+@dataclass
+class LedgerState:
+    """Everything needed to resume a poll: where its message lives, when it ends, and who holds which choice."""
+
+    choices: List[str]
+    multiple: bool
+    ends_at: float
+    channel_id: int
+    message_id: int
+    votes: Dict[str, Set[int]] = field(default_factory=dict)
+
+
+class VoteLedger:
+    """An append-only, crash-safe record of a poll's votes.
+
+    Vote events are buffered in memory and appended to `<path>.log` in batches, which are fsynced every
+    `flush_interval` seconds. Once `snapshot_events` events have been logged, the whole tally is written to
+    `<path>.snapshot` with an atomic rename and the log is truncated, so a restarted bot only replays a short tail.
+    Every event carries a sequence number, so a crash between the rename and the truncation is harmless.
+
+    File I/O runs in the shared thread pool and never blocks the event loop.
+
+    :param path: The file path to store the ledger at, without an extension.
+    :param flush_interval: How often, in seconds, buffered events are written and fsynced.
+    :param snapshot_events: How many logged events trigger a new snapshot.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_interval: float = LEDGER_FLUSH_INTERVAL,
+        snapshot_events: int = LEDGER_SNAPSHOT_EVENTS,
+    ):
+        path = Path(path)
+        self.log_path: Path = path.with_name(path.name + '.log')
+        self.snapshot_path: Path = path.with_name(path.name + '.snapshot')
+        self.flush_interval: float = flush_interval
+        self.snapshot_events: int = snapshot_events
+        self._meta: Dict = {}
+        self._tally: Optional['VoteTally'] = None
+        self._seq: int = 0
+        self._logged: int = 0
+        self._buffer: List[str] = []
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def __repr__(self):
+        return f'VoteLedger({self.log_path.with_suffix("")})'
+
+    async def load(self) -> Optional[LedgerState]:
+        """Rebuilds the state of an unfinished poll from the last snapshot and the log tail. Returns None if there is
+        no ledger at this path.
+
+        :rtype: Optional[:class:`LedgerState`]
+        """
+        return await self._run_blocking(self._read)
+
+    async def start(self, tally: 'VoteTally', ends_at: float, channel_id: int, message_id: int):
+        """Starts recording a poll. Writes an initial snapshot, so the poll can be resumed even before its first
+        vote, and starts the periodic flush task.
+
+        :param tally: The tally which snapshots are taken from.
+        :param ends_at: The UNIX timestamp the poll ends at.
+        :param channel_id: The ID of the channel the poll message is in.
+        :param message_id: The ID of the poll message.
+        """
+        self._tally = tally
+        self._meta = {
+            'format': LEDGER_FORMAT,
+            'multiple': tally.multiple,
+            'ends_at': ends_at,
+            'channel_id': channel_id,
+            'message_id': message_id,
+        }
+
+        async with self._lock:
+            await self._snapshot()
+
+        self._task = asyncio.create_task(self._flush_later())
+
+    def record(self, added: bool, voter: int, choice: str):
+        """Buffers a vote event. It is written to disk on the next flush.
+
+        :param added: True if the vote was added, False if it was removed.
+        :param voter: The user ID of the voter.
+        :param choice: The button the vote was for.
+        """
+        self._seq += 1
+        self._buffer.append(json.dumps([self._seq, int(added), voter, choice]) + '\n')
+
+    async def flush(self):
+        """Writes and fsyncs buffered events, taking a snapshot if enough events have been logged since the last
+        one."""
+        async with self._lock:
+            if not self._buffer:
+                return
+
+            lines, self._buffer = self._buffer, []
+            await self._run_blocking(self._append, lines)
+            self._logged += len(lines)
+
+            if self._logged >= self.snapshot_events:
+                await self._snapshot()
+
+    async def close(self, delete: bool = False):
+        """Stops the flush task and writes any buffered events.
+
+        :param delete: Removes the ledger files afterwards; used once a poll has finished.
+        """
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        await self.flush()
+
+        if delete:
+            await self._run_blocking(self._delete)
+
+    # Internal Methods
+    async def _flush_later(self):
+        """Flushes the buffer every interval until the ledger is closed."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except OSError as exc:
+                logging.error(f'Could not write to the vote ledger at {self.log_path}: {exc}.')
+
+    async def _snapshot(self):
+        """Writes the current tally as a snapshot and truncates the log. Must be called with the lock held."""
+        data = dict(self._meta, seq=self._seq, votes=self._tally.snapshot())
+        await self._run_blocking(self._write_snapshot, data)
+        self._logged = 0
+
+    @staticmethod
+    async def _run_blocking(fn, *args):
+        """Runs file I/O in the shared thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(get_executor(ExecutionMode.BLOCKING), fn, *args)
+
+    def _append(self, lines: List[str]):
+        """Appends lines to the log and waits until they are on disk."""
+        with open(self.log_path, 'a', encoding='utf-8') as file:
+            file.writelines(lines)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _write_snapshot(self, data: Dict):
+        """Atomically replaces the snapshot, then truncates the log it made redundant."""
+        temp_path = self.snapshot_path.with_name(self.snapshot_path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.snapshot_path)
+
+        with open(self.log_path, 'w', encoding='utf-8') as file:
+            os.fsync(file.fileno())
+
+    def _read(self) -> Optional[LedgerState]:
+        """Reads the snapshot and replays every logged event that is newer than it."""
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        votes = {choice: set(voters) for choice, voters in data['votes'].items()}
+        self._seq = data['seq']
+
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        seq, added, voter, choice = json.loads(line)
+                    except ValueError:
+                        # the last line may be incomplete if the bot died while writing it
+                        break
+
+                    if seq <= data['seq'] or choice not in votes:
+                        continue
+
+                    votes[choice].add(voter) if added else votes[choice].discard(voter)
+                    self._seq = seq
+        except FileNotFoundError:
+            pass
+
+        return LedgerState(
+            choices=list(votes),
+            multiple=data['multiple'],
+            ends_at=data['ends_at'],
+            channel_id=data['channel_id'],
+            message_id=data['message_id'],
+            votes=votes,
+        )
+
+    def _delete(self):
+        """Removes the ledger files."""
+        for path in (self.log_path, self.snapshot_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
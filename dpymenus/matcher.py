@@ -0,0 +1,84 @@
+import re
+from typing import Dict, Iterable, Iterator, Optional
+
+
+class ResponseMatcher:
+    """A precompiled set of valid text responses for :meth:`TextMenu.response_is`.
+
+    Exact choices are checked with a frozenset lookup, prefixes (ie. command names) with a trie walk, and regex
+    patterns with a single compiled alternation, so a matcher costs the same no matter how many values it holds.
+
+    :param choices: Responses which must match exactly.
+    :param prefixes: Responses which match if the input starts with them.
+    :param patterns: Regular expressions which must match the whole input.
+    """
+
+    __slots__ = ('_choices', '_lookup', '_trie', '_pattern')
+
+    def __init__(self, choices: Iterable[str] = (), prefixes: Iterable[str] = (), patterns: Iterable[str] = ()):
+        self._choices = tuple(dict.fromkeys(choices))
+        self._lookup = frozenset(self._choices)
+        self._trie = _build_trie(prefixes)
+        patterns = list(patterns)
+        self._pattern = re.compile('|'.join(f'(?:{p})' for p in patterns)) if patterns else None
+
+    def __repr__(self):
+        return f'ResponseMatcher(choices={list(self._choices)})'
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._choices)
+
+    def __len__(self) -> int:
+        return len(self._choices)
+
+    def __contains__(self, response: str) -> bool:
+        return response in self._lookup
+
+    def matches(self, response: str) -> bool:
+        """Returns true if the response is an exact choice, starts with a prefix, or matches a pattern.
+
+        :param response: The user input to test.
+        :rtype: bool
+        """
+        return (
+            response in self._lookup
+            or (self._trie is not None and self.match_prefix(response) is not None)
+            or (self._pattern is not None and self._pattern.fullmatch(response) is not None)
+        )
+
+    def match_prefix(self, response: str) -> Optional[str]:
+        """Returns the longest prefix the response starts with, or None if there is no match.
+
+        :param response: The user input to test.
+        :rtype: Optional[str]
+        """
+        node = self._trie
+        longest = None
+
+        for i, char in enumerate(response):
+            if node is None:
+                break
+            if None in node:
+                longest = i
+            node = node.get(char)
+        else:
+            if node is not None and None in node:
+                longest = len(response)
+
+        return response[:longest] if longest is not None else None
+
+
+def _build_trie(prefixes: Iterable[str]) -> Optional[Dict]:
+    """Builds a character trie; a None key marks the end of a prefix."""
+    trie = None
+
+    for prefix in prefixes:
+        if trie is None:
+            trie = {}
+
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[None] = True
+
+    return trie
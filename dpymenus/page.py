@@ -1,12 +1,18 @@
-from typing import Any, Callable, Dict, List, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, Iterable, List, TYPE_CHECKING, Union
 
-from discord import Embed
+from discord import Colour, Embed
+from discord.embeds import EmbedProxy, EmptyEmbed
+from discord.utils import parse_time
 
-from dpymenus.template import FieldSort, FieldStyle
+from dpymenus.template import CompiledTemplate
 
 if TYPE_CHECKING:
     from dpymenus import Template
 
+_EMBED_SLOTS = Embed.__slots__
+_MISSING = object()
+_RICH_KEYS = frozenset(('color', 'timestamp', 'thumbnail', 'video', 'provider', 'author', 'fields', 'image', 'footer'))
+
 
 class Page(Embed):
     """Represents a single page inside a menu."""
@@ -19,6 +25,7 @@ class Page(Embed):
         '_on_fail_event',
         '_on_cancel_event',
         '_on_timeout_event',
+        '_template',
     )
 
     def __init__(self, **kwargs):
@@ -127,74 +134,130 @@ class Page(Embed):
         :param other: Embed or dictionary in a valid Embed format.
         :rtype: :class:`Page`
         """
-        if type(other) == Embed:
-            return Page.from_dict(other.to_dict())
+        if isinstance(other, Embed):
+            return Page.from_embed(other)
         else:
             return Page.from_dict(other)
 
-    # Internal Methods
-    def _apply_template(self, template: 'Template') -> 'Page':
-        """Applies user-defined template options to a page."""
+    @classmethod
+    def from_embed(cls, embed: Embed) -> 'Page':
+        """Returns a Page which adopts the internal state of an existing Embed, without serializing it first. The
+        Page shares fields and other nested data with the Embed, so the Embed should not be modified afterwards.
 
-        if not self.title and template.title:
-            self.title = template.title
+        :param embed: The Embed to adopt.
+        :rtype: :class:`Page`
+        """
+        self = cls.__new__(cls)
 
-        if not self.description and template.description:
-            self.description = template.description
+        for attr in _EMBED_SLOTS:
+            if (value := getattr(embed, attr, _MISSING)) is not _MISSING:
+                setattr(self, attr, value)
 
-        if not self.color and not self.colour and template.color:
-            self.color = template.color
+        return self
 
-        if not self.footer and template.footer:
-            self.set_footer(text=template.footer.get('text', ''), icon_url=template.footer.get('icon_url', ''))
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> 'Page':
+        """Returns a Page from a dictionary which is already in the exact format Discord sends and expects, such
+        as one previously produced by `to_dict`. Unlike `from_dict`, values are not coerced to strings.
 
-        if not self.image and template.image:
-            self.set_image(url=template.image)
+        :param data: Dictionary in a valid Embed format.
+        :rtype: :class:`Page`
+        """
+        self = cls.__new__(cls)
+
+        get = data.get
+        self.title = get('title', EmptyEmbed)
+        self.type = get('type', EmptyEmbed)
+        self.description = get('description', EmptyEmbed)
+        self.url = get('url', EmptyEmbed)
+
+        for key in data.keys() & _RICH_KEYS:
+            if key == 'color':
+                self._colour = Colour(value=data[key])
+            elif key == 'timestamp':
+                self._timestamp = parse_time(data[key])
+            else:
+                setattr(self, f'_{key}', data[key])
 
-        if not self.url and template.url:
-            self.url = template.url
+        return self
 
-        if not self.thumbnail and template.thumbnail:
-            self.set_thumbnail(url=template.thumbnail)
+    @classmethod
+    def from_dicts(cls, data: Iterable[Dict[str, Any]], trusted: bool = False) -> List['Page']:
+        """Returns a list of Pages from an iterable of dictionaries, such as a JSON array. This is faster than
+        converting each dictionary through `add_pages`.
 
-        if not self.author and template.author:
-            self.set_author(
-                name=template.author.get('name', ''),
-                url=template.author.get('url', ''),
-                icon_url=template.author.get('icon_url', ''),
-            )
+        :param data: Dictionaries in a valid Embed format.
+        :param trusted: Skips value coercion; see `from_trusted_dict`.
+        :rtype: List[:class:`Page`]
+        """
+        convert = cls.from_trusted_dict if trusted else cls.from_dict
 
-        if template.fields:
-            # check if there are existing fields
-            if self.fields:
-                # if so, we need to determine whether to ignore, combine, or overwrite with the template fields
-                # IGNORE is the default, so always check that first; cascade from most to least likely option
-                if template.field_style == FieldStyle.IGNORE:
-                    pass
+        return [convert(d) for d in data]
 
-                elif template.field_style == FieldStyle.COMBINE:
-                    self._apply_fields(template.field_sort, template.fields)
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the page into a dictionary in a valid Embed format. Template attributes are merged in here,
+        rather than being copied into every page when the template is applied.
 
-                elif template.field_style == FieldStyle.OVERRIDE:
-                    # if override is set, we need to remove all existing fields
-                    self.clear_fields()
-                    self._apply_fields(template.field_sort, template.fields)
+        :rtype: Dict[str, Any]
+        """
+        data = super().to_dict()
+        template = data.pop('template', None)
 
-            else:
-                self._apply_fields(template.field_sort, template.fields)
+        if template is not None:
+            for attr in ('footer', 'image', 'thumbnail', 'author'):
+                if not data.get(attr) and (value := getattr(template, attr)):
+                    data[attr] = value
 
-        return self
+            if fields := template.merge_fields(data.get('fields', [])):
+                data['fields'] = fields
 
-    def _apply_fields(self, sort: FieldSort, fields: List):
-        """Handles adding fields to a templated embed. Checks for sort styles if needed."""
-        for field in fields:
-            # when combining, we determine whether to add the template fields at the start or end
-            # LAST is the default, so always check that first; cascade from most to least likely option
-            if sort == FieldSort.LAST:
-                self.add_field(
-                    name=field.get('name', ''), value=field.get('value', ''), inline=field.get('inline', False)
-                )
-            else:
-                self.insert_field_at(
-                    0, name=field.get('name', ''), value=field.get('value', ''), inline=field.get('inline', False)
-                )
+        return data
+
+    @property
+    def footer(self) -> EmbedProxy:
+        return EmbedProxy(self._get_templated('footer'))
+
+    @property
+    def image(self) -> EmbedProxy:
+        return EmbedProxy(self._get_templated('image'))
+
+    @property
+    def thumbnail(self) -> EmbedProxy:
+        return EmbedProxy(self._get_templated('thumbnail'))
+
+    @property
+    def author(self) -> EmbedProxy:
+        return EmbedProxy(self._get_templated('author'))
+
+    @property
+    def fields(self) -> List[EmbedProxy]:
+        fields = getattr(self, '_fields', [])
+        if template := getattr(self, '_template', None):
+            fields = template.merge_fields(fields)
+
+        return [EmbedProxy(field) for field in fields]
+
+    # Internal Methods
+    def _get_templated(self, attr: str) -> Dict[str, Any]:
+        """Returns the page's own value for an Embed attribute, falling back to the shared template value."""
+        if value := getattr(self, f'_{attr}', None):
+            return value
+
+        if template := getattr(self, '_template', None):
+            return getattr(template, attr) or {}
+
+        return {}
+
+    def _apply_template(self, template: Union['Template', CompiledTemplate]) -> 'Page':
+        """Applies user-defined template options to a page. Only a reference to the shared template data is kept;
+        footers, images, thumbnails, authors, and fields are merged in when the page is serialized."""
+        if not isinstance(template, CompiledTemplate):
+            template = template.compile()
+
+        for attr, value in template.scalars:
+            if not getattr(self, attr):
+                setattr(self, attr, value)
+
+        self._template = template
+
+        return self
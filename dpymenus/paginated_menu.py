@@ -1,20 +1,16 @@
-import asyncio
 import logging
-from typing import Callable, List, Optional, TYPE_CHECKING
-
-from discord import (
-    Embed,
-    Emoji,
-    RawReactionActionEvent,
-    Reaction,
-)
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING, Tuple, Union
+
+from discord import Embed, Message, RawReactionActionEvent
 from discord.abc import GuildChannel
 from discord.ext.commands import Context
 
-from dpymenus import ButtonMenu, ButtonsError, Page, PagesError, SessionError
-from dpymenus.constants import GENERIC_BUTTONS
-from dpymenus.hooks import call_hook
-from dpymenus.settings import BUTTON_DELAY
+from dpymenus import ButtonMenu, ButtonsError, PagesError, SessionError
+from dpymenus.cleanup import delete_queue
+from dpymenus.components import ComponentPress, render_page_select
+from dpymenus.constants import GENERIC_BUTTONS, PAGE_NUMBER
+from dpymenus.hooks import HookEvent, HookWhen, call_hook
+from dpymenus.scheduler import request_scheduler
 
 if TYPE_CHECKING:
     from dpymenus.types import PageType, Button
@@ -23,11 +19,7 @@ if TYPE_CHECKING:
 class PaginatedMenu(ButtonMenu):
     """Represents an paginated, button-based response menu."""
 
-    _cancel_page: Optional['PageType']
-    _timeout_page: Optional['PageType']
-    _skip_buttons: bool
-    _cancel_button: bool
-    _buttons_list: List
+    __slots__ = ()
 
     def __init__(self, ctx: Context):
         super().__init__(ctx)
@@ -37,7 +29,7 @@ class PaginatedMenu(ButtonMenu):
 
     @property
     def cancel_page(self) -> Optional['PageType']:
-        return getattr(self, '_cancel_page', None)
+        return self._options.get('cancel_page')
 
     def set_cancel_page(self, embed: Embed) -> 'PaginatedMenu':
         """Sets the function that will be called when the `cancel` event runs. Returns itself for fluent-style
@@ -46,13 +38,13 @@ class PaginatedMenu(ButtonMenu):
         :param embed: Defines which page to display.
         :rtype: :class:`PaginatedMenu`
         """
-        self._cancel_page = embed
+        self._set_option('cancel_page', embed)
 
         return self
 
     @property
     def timeout_page(self) -> Optional['PageType']:
-        return getattr(self, '_timeout_page', None)
+        return self._options.get('timeout_page')
 
     def set_timeout_page(self, embed: Embed) -> 'PaginatedMenu':
         """Sets the function that will be called when the `timeout` event runs. Returns itself for fluent-style
@@ -61,39 +53,53 @@ class PaginatedMenu(ButtonMenu):
         :param embed: Defines which page to display.
         :rtype: :class:`PaginatedMenu`
         """
-        setattr(self, '_timeout_page', embed)
+        self._set_option('timeout_page', embed)
 
         return self
 
     @property
     def skip_buttons(self) -> bool:
-        return getattr(self, '_skip_buttons', False)
+        return self._options.get('skip_buttons', False)
 
     def show_skip_buttons(self) -> 'PaginatedMenu':
         """Adds two extra buttons for jumping to the first and last page. Returns itself for fluent-style chaining.
 
         :rtype: :class:`PaginatedMenu`
         """
-        setattr(self, '_skip_buttons', True)
+        self._set_option('skip_buttons', True)
 
         return self
 
     @property
     def cancel_button(self) -> bool:
-        return getattr(self, '_cancel_button', True)
+        return self._options.get('cancel_button', True)
 
     def hide_cancel_button(self) -> 'PaginatedMenu':
         """Sets whether to show the cancel button or not. Returns itself for fluent-style chaining.
 
         :rtype: :class:`PaginatedMenu`
         """
-        setattr(self, '_cancel_button', True)
+        self._set_option('cancel_button', False)
+
+        return self
+
+    @property
+    def jump_control(self) -> bool:
+        return self._options.get('jump_control', False)
+
+    def show_jump_control(self) -> 'PaginatedMenu':
+        """Lets the user jump straight to a page by typing its number in the channel. With the components input
+        backend, a select menu of page ranges is shown as well. Returns itself for fluent-style chaining.
+
+        :rtype: :class:`PaginatedMenu`
+        """
+        self._set_option('jump_control', True)
 
         return self
 
     @property
     def buttons_list(self) -> List:
-        return getattr(self, '_buttons_list', [])
+        return self._options.get('buttons_list', [])
 
     def buttons(self, buttons: List['Button']) -> 'PaginatedMenu':
         """Replaces the default buttons. You must include 3 or 5 emoji/strings in the order they would be displayed.
@@ -108,26 +114,16 @@ class PaginatedMenu(ButtonMenu):
         :param buttons: Which emoji reactions will replace the default buttons.
         :rtype: :class:`PaginatedMenu`
         """
-        _buttons = buttons
+        _buttons = list(buttons)
 
-        if len(_buttons) < 3:
+        if len(_buttons) == 3:
             _buttons.insert(0, GENERIC_BUTTONS[0])
             _buttons.insert(4, GENERIC_BUTTONS[4])
 
-        setattr(self, '_buttons_list', _buttons)
+        self._set_option('buttons_list', _buttons)
 
         return self
 
-    async def send_message(self, page: 'PageType'):
-        """Updates the output message. We override the base implementation because we always want to edit,
-        even in a DM  channel type.
-
-        :param page: A :class:`PageType` to send to Discord.
-        """
-        safe_embed = page.as_safe_embed() if type(page) == Page else page
-
-        await self.output.edit(embed=safe_embed)
-
     async def open(self):
         """The entry point to a new PaginatedMenu instance; starts the main menu loop.
         Manages gathering user input, basic validation, sending messages, and cancellation requests."""
@@ -145,23 +141,26 @@ class PaginatedMenu(ButtonMenu):
             logging.info(exc.message)
 
         else:
-            await self._add_buttons()
-
-            # refresh our message content with the reactions added
-            self.output = await self.destination.fetch_message(self.output.id)
+            # buttons are added in the background, so the first ones can be pressed before the last one is added
+            self._start_adding_buttons()
 
-            await call_hook(self, '_hook_after_open')
+            await call_hook(self, HookWhen.AFTER, HookEvent.OPEN)
 
             while self.active:
-                await call_hook(self, '_hook_before_update')
-                self.input = await self._get_input()
+                await call_hook(self, HookWhen.BEFORE, HookEvent.UPDATE)
+                self.input = await self._throttle_input(await self._get_input())
 
                 # this will be true when input handles a timeout event
                 if (not self.output) or (not self.active) or (self.output and self.persist and not self.active):
                     return
 
-                if self.output and isinstance(self.output.channel, GuildChannel):
-                    await self.output.remove_reaction(self.input, self.ctx.author)
+                # the press was dropped by the input throttle
+                if self.input is None:
+                    continue
+
+                # page numbers are typed or picked, so there is no reaction to remove
+                if self._removes_reactions() and not isinstance(self.input, int):
+                    await request_scheduler.remove_reaction(self.output, self.input, self.ctx.author, owner=self)
 
                 # this must come after removing reactions to prevent duplicate actions on bot remove
                 await self._handle_transition()
@@ -170,18 +169,11 @@ class PaginatedMenu(ButtonMenu):
 
     # Internal Methods
     def _get_check(self) -> Callable:
-        """Returns a check predicate based on detected buttons. Using the standard button list uses a
-        simpler, and faster, predicate. Using custom buttons has to iterate over buttons to ensure they
-        are valid options, thus slower. Likely not large enough to notice in practice, but care should be
-        taken nonetheless."""
-        check = self._check_reaction_defaults
-
+        """Returns the custom check predicate if one was set, otherwise one matching the shown buttons."""
         if self.custom_check:
-            check = self.custom_check
-        elif self.buttons_list != GENERIC_BUTTONS:
-            check = self._check
+            return self._watched_check(self.custom_check)
 
-        return check
+        return self._check_reaction_defaults
 
     async def _get_reaction_add(self) -> Optional['Button']:
         """Waits for a user reaction add event and returns the event object."""
@@ -207,13 +199,59 @@ class PaginatedMenu(ButtonMenu):
 
         return reaction_event.emoji
 
+    def _press_listeners(self) -> List[Callable[[], Awaitable[Optional[Union['Button', int]]]]]:
+        """Extends the press listeners with typed page numbers if the jump control is shown."""
+        listeners = super()._press_listeners()
+        if self.jump_control:
+            listeners.append(self._get_page_number)
+
+        return listeners
+
+    async def _get_page_number(self) -> Optional[int]:
+        """Waits for the user to type a page number in the menu's channel and returns its page index. The message is
+        deleted with the same batched deletes as text menu input."""
+        try:
+            message = await self.ctx.bot.wait_for('message', check=self._check_page_number)
+        except AttributeError:
+            return
+
+        if isinstance(message.channel, GuildChannel):
+            delete_queue.add(message)
+
+        return int(message.content) - 1
+
+    def _check_page_number(self, message: Message) -> bool:
+        """Returns true if the message was sent by the menu's user in its channel and is a valid page number."""
+        content = message.content.strip()
+
+        return self._check(message) and PAGE_NUMBER.matches(content) and 0 < int(content) <= len(self.pages)
+
+    def _press_input(self, press: ComponentPress) -> Optional[Union['Button', int]]:
+        """Extends component presses with the jump select menu, whose values are page indices."""
+        if press.values:
+            if press.user_id != self.ctx.author.id or not press.values[0].isdigit():
+                return
+
+            index = int(press.values[0])
+
+            return index if index < len(self.pages) else None
+
+        return super()._press_input(press)
+
+    def _extra_components(self) -> List[Dict[str, Any]]:
+        """Adds the jump select menu below the buttons if the jump control is shown."""
+        if self.jump_control and len(self.pages) > 1:
+            return [render_page_select(len(self.pages), self.output.id)]
+
+        return []
+
     def _check_reaction_defaults(self, event: RawReactionActionEvent) -> bool:
-        """Returns true if the event author is the same as the initial value in the menu context. This function
-        specifically checks against the default button list (GENERIC_BUTTONS)."""
+        """Returns true if the event author is the same as the initial value in the menu context and the reaction
+        is one of the shown buttons."""
         return (
             event.user_id == self.ctx.author.id
             and event.message_id == self.output.id
-            and any(event.emoji.name == btn for btn in self.buttons_list)
+            and any(event.emoji.name == self._button_name(button) for button, _ in self._shown_buttons())
         )
 
     def _validate_buttons(self):
@@ -222,51 +260,46 @@ class PaginatedMenu(ButtonMenu):
             if len(self.buttons_list) != 3 and len(self.buttons_list) != 5:
                 raise ButtonsError(f'Buttons length mismatch. Expected 3 or 5, found {len(self.buttons_list)}')
 
-    async def _add_buttons(self):
-        """Adds reactions to the message object based on what was passed into the page buttons. Handles the cancel
-        and skip button settings."""
+    def _shown_buttons(self) -> List[Tuple['Button', Callable]]:
+        """Returns the buttons to show, in order, paired with the method each one calls. Handles the cancel and
+        skip button settings."""
+        transitions = [self.to_first, self.previous, self._cancel_menu, self.next, self.to_last]
+        hidden = set()
+
+        if self.skip_buttons is False:
+            hidden.update((0, 4))
+
         if self.cancel_button is False:
-            self.buttons_list[2] = None
+            hidden.add(2)
 
-        if self.skip_buttons:
-            for button in self.buttons_list:
-                if button is None:
-                    continue
-                await self.output.add_reaction(button)
-                await asyncio.sleep(BUTTON_DELAY)
-        else:
-            for button in self.buttons_list[1:4]:
-                if button is None:
-                    continue
+        return [
+            (button, transition)
+            for i, (button, transition) in enumerate(zip(self.buttons_list, transitions))
+            if i not in hidden and button
+        ]
 
-                await self.output.add_reaction(button)
-                await asyncio.sleep(BUTTON_DELAY)
+    async def _add_buttons(self):
+        """Adds reactions to the message object based on the shown buttons."""
+        await self._sync_buttons([button for button, _ in self._shown_buttons()])
 
     async def _handle_transition(self):
-        """Dictionary mapping of reactions to methods to be called when handling user input on a button."""
-        transitions = [
-            self.to_first,
-            self.previous,
-            self._cancel_menu,
-            self.next,
-            self.to_last,
-        ]
+        """Dictionary mapping of reactions to methods to be called when handling user input on a button. The map is
+        built from the configured buttons, so it does not depend on which reactions the message already has. Page
+        numbers from the jump control go straight to their page with a single edit."""
+        if isinstance(self.input, int):
+            if self.input != self.page.index:
+                await call_hook(self, HookWhen.AFTER, HookEvent.UPDATE)
+                await self.go_to(self.input)
 
-        if self.cancel_button is False:
-            transitions.remove(self.close)
+            return
 
-        if self.skip_buttons is False:
-            transitions.remove(self.to_first)
-            transitions.remove(self.to_last)
+        transition_map = {self._button_name(button): transition for button, transition in self._shown_buttons()}
 
-        transition_map = {
-            (button.emoji.name if isinstance(button.emoji, Emoji) else button.emoji)
-            if isinstance(button, Reaction)
-            else button: transition
-            for button, transition in zip(self.output.reactions, transitions)
-        }
+        transition = transition_map.get(self._button_name(self.input))
+        if transition is None:
+            return
 
-        if not transition_map[self.input.name] == self.close:
-            await call_hook(self, '_hook_after_update')
+        if transition != self._cancel_menu:
+            await call_hook(self, HookWhen.AFTER, HookEvent.UPDATE)
 
-        await transition_map[self.input.name]()
+        await transition()
@@ -1,13 +1,21 @@
 import asyncio
 import logging
-from typing import Any, Dict, List, Set
+import time
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional, Set, Tuple, Union
 from warnings import warn
 
-from discord import RawReactionActionEvent, User
+from discord import Embed, HTTPException, Message, NotFound, RawReactionActionEvent, Reaction, User
 from discord.ext.commands import Context
 
 from dpymenus import ButtonMenu, ButtonsError, EventError, PagesError, SessionError
-from dpymenus.hooks import call_hook
+from dpymenus.components import COMPONENTS, component_router
+from dpymenus.hooks import HookEvent, HookWhen, call_hook
+from dpymenus.ledger import LedgerState, VoteLedger
+from dpymenus.scheduler import BACKGROUND, CLEANUP, request_scheduler
+from dpymenus.settings import LIVE_RESULTS_INTERVAL, RECONCILE_CONCURRENCY
+from dpymenus.tally import CompactVoteTally, VoteTally
+from dpymenus.voters import VoterSet
 
 
 class Poll(ButtonMenu):
@@ -16,23 +24,109 @@ class Poll(ButtonMenu):
     :param ctx: A reference to the command context.
     """
 
+    __slots__ = ('voted', 'tally', 'ledger', '_ends_at', '_missed', '_reconcile_lock')
+
+    # a ledger reattaches a poll to a single message, so polls spread across several messages can not use one
+    _resumable: bool = True
+
     def __init__(self, ctx: Context):
         super().__init__(ctx)
         self.voted: Set[User] = set()
+        self.tally: Optional[VoteTally] = None
+        self.ledger: Optional[VoteLedger] = None
+        self._ends_at: float = 0.0
+        self._missed: Optional[List[Tuple[bool, int, str]]] = None
+        self._reconcile_lock: asyncio.Lock = asyncio.Lock()
 
     def __repr__(self):
         return f'Poll(pages={[p.__str__() for p in self.pages]}, page={self.page.index}, timeout={self.timeout}, data={self.data})'
 
+    @property
+    def multiple_votes(self) -> bool:
+        return self._options.get('multiple_votes', False)
+
+    def allow_multiple_votes(self) -> 'Poll':
+        """Lets users vote for more than one choice. By default, a user who votes for several choices has their vote
+        voided. Returns itself for fluent-style chaining.
+
+        :rtype: :class:`Poll`
+        """
+        self._set_option('multiple_votes', True)
+
+        return self
+
+    @property
+    def compact_votes(self) -> bool:
+        return self._options.get('compact_votes', False)
+
+    def use_compact_votes(self) -> 'Poll':
+        """Stores voters in sorted int64 arrays instead of Python sets, which uses about 8 bytes per vote instead of
+        60+. Meant for server-wide polls with hundreds of thousands of voters; each vote costs slightly more CPU.
+        Returns itself for fluent-style chaining.
+
+        :rtype: :class:`Poll`
+        """
+        self._set_option('compact_votes', True)
+
+        return self
+
+    def set_ledger(self, path: Union[str, Path]) -> 'Poll':
+        """Records votes in a crash-safe ledger at the given path. If the bot restarts while the poll is open,
+        opening a poll with the same ledger path resumes it on its original message, with its votes and its remaining
+        duration. Returns itself for fluent-style chaining.
+
+        :param path: Where to store the ledger files; `.log` and `.snapshot` are appended to it.
+        :rtype: :class:`Poll`
+        """
+        if not self._resumable:
+            logging.error(f'A {type(self).__name__} can not be resumed from a vote ledger; ignoring `set_ledger`.')
+            return self
+
+        self.ledger = VoteLedger(path)
+
+        return self
+
+    @property
+    def reconcile(self) -> bool:
+        return self._options.get('reconcile', False)
+
+    def reconcile_votes(self) -> 'Poll':
+        """Counts votes from the poll message's reactions when the poll closes, instead of listening to every
+        reaction event while it is open. Costs no listeners per vote, but live results are not available.
+        Returns itself for fluent-style chaining.
+
+        :rtype: :class:`Poll`
+        """
+        self._set_option('reconcile', True)
+
+        return self
+
+    @property
+    def live_results_interval(self) -> float:
+        return self._options.get('live_results_interval', 0)
+
+    def show_live_results(self, interval: float = LIVE_RESULTS_INTERVAL) -> 'Poll':
+        """Shows the current vote counts on the poll while it is open. The message is edited at most once per
+        interval, and only if the counts changed, so busy polls cost a bounded number of API calls.
+        Returns itself for fluent-style chaining.
+
+        :param interval: The minimum time, in seconds, between two edits.
+        :rtype: :class:`Poll`
+        """
+        self._set_option('live_results_interval', interval)
+
+        return self
+
     # Utility Methods
     async def results(self) -> Dict[str, int]:
-        """Utility method to get a dictionary of poll results."""
-        return {choice: len(voters) for choice, voters in self.data.items()}
+        """Utility method to get a dictionary of poll results. Results are live while the poll is open."""
+        return self.tally.results() if self.tally else {}
 
     async def add_results_fields(self):
         """Utility method to add new fields to your next page automatically."""
-        for choice, voters in self.data.items():
-            next_page = self.pages[self.page.index + 1]
-            next_page.add_field(name=choice, value=str(len(voters)))
+        next_page = self.pages[self.page.index + 1]
+        for choice, count in (await self.results()).items():
+            next_page.add_field(name=choice, value=str(count))
 
     async def generate_results_page(self):
         """Utility method to build your entire results page automatically."""
@@ -40,38 +134,50 @@ class Poll(ButtonMenu):
 
         await self.add_results_fields()
 
-        highest_value = max(self.data.values())
-        winning_key = {choice for choice, voters in self.data.items() if voters == highest_value}
+        results = await self.results()
+        highest_value = max(results.values())
+        winners = [choice for choice, count in results.items() if count == highest_value]
 
-        if len(highest_value) == 0:
+        if len(winners) > 1:
             next_page.description = ' '.join([next_page.description, f'It\'s a draw!'])
 
         else:
-            next_page.description = ' '.join([next_page.description, f'{str(next(iter(winning_key)))} wins!'])
+            next_page.description = ' '.join([next_page.description, f'{winners[0]} wins!'])
 
     async def open(self):
         """The entry point to a new Poll instance; starts the main menu loop.
         Manages gathering user input, basic validation, sending messages, and cancellation requests."""
         try:
             self._validate_callbacks()
+            state = await self.ledger.load() if self.ledger else None
+            resumed = await self._resume(state) if state else False
+
             await super()._open()
         except SessionError as exc:
             logging.info(exc.message)
         else:
             await self._set_data()
-            await self._add_buttons()
 
-            await call_hook(self, '_hook_after_open')
+            if not resumed:
+                await self._add_buttons()
+
+            if not state:
+                self._ends_at = time.time() + self.timeout
+
+            if self.ledger:
+                await self.ledger.start(self.tally, self._ends_at, self.output.channel.id, self.output.id)
+
+            # votes may have changed while the bot was offline
+            if resumed:
+                await self._reconcile()
+
+            await call_hook(self, HookWhen.AFTER, HookEvent.OPEN)
 
             pending = set()
             while self.active:
                 try:
                     _, pending = await asyncio.wait(
-                        [
-                            asyncio.create_task(self._get_vote_add()),
-                            asyncio.create_task(self._get_vote_remove()),
-                            asyncio.create_task(self._poll_timer()),
-                        ],
+                        [asyncio.create_task(coro) for coro in self._poll_tasks()],
                         return_when=asyncio.FIRST_COMPLETED,
                     )
 
@@ -82,6 +188,20 @@ class Poll(ButtonMenu):
                     await self._finish_poll()
 
     # Internal Methods
+    def _poll_tasks(self) -> List[Coroutine]:
+        """Returns the coroutines which run for as long as the poll is open."""
+        if self.input_backend is COMPONENTS:
+            tasks = [self._get_component_votes(), self._poll_timer()]
+        elif self.reconcile:
+            return [self._poll_timer()]
+        else:
+            tasks = [self._get_vote_add(), self._get_vote_remove(), self._poll_timer(), self._reconcile_on_resume()]
+
+        if self.live_results_interval:
+            tasks.append(self._update_live_results())
+
+        return tasks
+
     async def _get_vote_add(self):
         """Watches for a user adding a reaction on the Poll. Adds them to the relevant state_field values."""
         while True:
@@ -94,8 +214,7 @@ class Poll(ButtonMenu):
                 return
 
             else:
-                if reaction_event.emoji.name in self.page.buttons_list:
-                    self.data[reaction_event.emoji.name].add(reaction_event.user_id)
+                self._record_vote(True, reaction_event.user_id, reaction_event.emoji.name)
 
     async def _get_vote_remove(self):
         """Watches for a user removing a reaction on the Poll. Removes them from the relevant state_field values."""
@@ -104,50 +223,212 @@ class Poll(ButtonMenu):
                 reaction_event = await self.ctx.bot.wait_for(
                     'raw_reaction_remove',
                     timeout=self.timeout,
-                    check=self._check_reaction,
+                    check=self._check_reaction_remove,
                 )
 
             except asyncio.TimeoutError:
                 return
 
             else:
-                if reaction_event.emoji.name in self.page.buttons_list:
-                    self.data[reaction_event.emoji.name].remove(reaction_event.user_id)
+                self._record_vote(False, reaction_event.user_id, reaction_event.emoji.name)
+
+    async def _get_component_votes(self):
+        """Watches for users pressing the poll's message buttons. A press votes for a choice, or withdraws the vote
+        if the user already holds it."""
+        presses = component_router.listen(self.ctx.bot, self.output.id)
+        choices = self.page.buttons_list
+
+        while True:
+            press = await presses.get()
+            if press.index < len(choices) and press.name == self._button_name(choices[press.index]):
+                choice = choices[press.index]
+                self._record_vote(choice not in self.tally.choices_of(press.user_id), press.user_id, choice)
 
     def _check_reaction(self, event: RawReactionActionEvent) -> bool:
-        """Returns true only if the reaction event member is not a bot (ie. excludes self from counts)."""
-        return event.member is not None and event.member.bot is False
+        """Returns true only if the reaction is on the poll and the event member is not a bot (ie. excludes self
+        from counts)."""
+        return event.message_id in self._message_ids() and event.member is not None and event.member.bot is False
+
+    def _check_reaction_remove(self, event: RawReactionActionEvent) -> bool:
+        """Returns true if the reaction is on the poll and was not removed by the bot itself. Removal events carry
+        no member, so other bots are filtered out by never having a vote in the tally."""
+        return event.message_id in self._message_ids() and event.user_id != self.ctx.bot.user.id
+
+    def _poll_messages(self) -> List[Message]:
+        """Returns the messages votes are cast on."""
+        return [self.output]
+
+    def _message_ids(self) -> Set[int]:
+        """Returns the IDs of the messages votes are cast on."""
+        return {self.output.id}
+
+    async def _update_live_results(self):
+        """Edits the poll message with the current counts whenever the tally changed since the last edit. Edits are
+        awaited here, so there is never more than one in flight and votes arriving meanwhile are picked up by the
+        next one."""
+        rendered = self.tally.version
+
+        while True:
+            await asyncio.sleep(self.live_results_interval)
+
+            if self.tally.version == rendered:
+                continue
+
+            rendered = self.tally.version
+            try:
+                await request_scheduler.edit(
+                    self.output, owner=self, priority=BACKGROUND, embed=self._live_results_embed()
+                )
+            except HTTPException as exc:
+                logging.warning(f'Could not update live poll results: {exc}.')
+
+    def _live_results_embed(self) -> Embed:
+        """Returns a copy of the current page with a field for each choice's vote count."""
+        embed = Embed.from_dict(self.page.to_dict())
+        for choice, count in self.tally.results().items():
+            embed.add_field(name=choice, value=str(count))
+
+        return embed
+
+    def _record_vote(self, added: bool, voter: int, choice: str):
+        """Applies a vote event to the tally and the ledger."""
+        if choice not in self.page.buttons_list:
+            return
+
+        self.tally.add(voter, choice) if added else self.tally.remove(voter, choice)
+
+        # events arriving during a reconcile are written to the ledger once they are replayed
+        if self._missed is not None:
+            self._missed.append((added, voter, choice))
+        elif self.ledger:
+            self.ledger.record(added, voter, choice)
+
+    async def _reconcile_on_resume(self):
+        """Reconciles the tally every time the gateway connection resumes or reconnects, since reaction events sent
+        while it was down are lost."""
+        while True:
+            waiters = [asyncio.create_task(self.ctx.bot.wait_for(event)) for event in ('resumed', 'ready')]
+            try:
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+            await self._reconcile()
+
+    async def _reconcile(self):
+        """Rebuilds the tally from the reactions on the poll message. Each reaction's paginated user list is
+        walked, with at most `reconcile-concurrency` reactions fetched at once, and the difference to the current
+        tally is applied as vote events. Events that arrive meanwhile are replayed afterwards, so they win over
+        reaction lists which may have been fetched before them. Votes cast with message buttons leave no reactions
+        behind, so they are never reconciled. Only one reconcile runs at a time."""
+        if self.input_backend is COMPONENTS:
+            return
+
+        async with self._reconcile_lock:
+            try:
+                messages = [await message.channel.fetch_message(message.id) for message in self._poll_messages()]
+            except HTTPException as exc:
+                logging.warning(f'Could not fetch poll {self.output.id} to reconcile its votes: {exc}.')
+                return
+
+            semaphore = asyncio.Semaphore(RECONCILE_CONCURRENCY)
+            self._missed = []
+
+            async def _fetch(reaction: Reaction) -> Tuple[str, VoterSet]:
+                async with semaphore:
+                    voters = VoterSet()
+                    async for user in reaction.users(limit=None):
+                        if not user.bot:
+                            voters.add(user.id)
+
+                    return str(reaction.emoji), voters
+
+            reactions = [
+                reaction
+                for message in messages
+                for reaction in message.reactions
+                if str(reaction.emoji) in self.page.buttons_list
+            ]
+            fetched = None
+            try:
+                fetched = dict(await asyncio.gather(*(_fetch(reaction) for reaction in reactions)))
+            except HTTPException as exc:
+                logging.warning(f'Could not fetch the voters of poll {self.output.id}: {exc}.')
+            finally:
+                missed, self._missed = self._missed, None
+
+            if fetched is not None:
+                for choice, voters in self.tally.snapshot().items():
+                    current = fetched.get(choice, VoterSet())
+                    for voter in voters:
+                        if voter not in current:
+                            self._record_vote(False, voter, choice)
+                        else:
+                            current.discard(voter)
+
+                    for voter in current:
+                        self._record_vote(True, voter, choice)
+
+            for event in missed:
+                self._record_vote(*event)
+
+    async def _resume(self, state: LedgerState) -> bool:
+        """Restores the tally and end time of a poll from its ledger, and reattaches to its original message.
+        Returns false if that message no longer exists, in which case a new one is sent."""
+        tally_type = CompactVoteTally if self.compact_votes else VoteTally
+        self.tally = tally_type(state.choices, multiple=state.multiple)
+        for choice, voters in state.votes.items():
+            for voter in voters:
+                self.tally.add(voter, choice)
+
+        self._ends_at = state.ends_at
+
+        channel = self.ctx.bot.get_channel(state.channel_id)
+        try:
+            self.output = await channel.fetch_message(state.message_id)
+        except (AttributeError, NotFound):
+            logging.warning(f'Could not find the message of the resumed poll {state.message_id}; sending a new one.')
+            return False
+
+        logging.info(f'Resumed poll {state.message_id} with {len(self.tally)} votes.')
+
+        return True
 
     async def _poll_timer(self):
-        """Handles poll duration."""
-        await asyncio.sleep(self.timeout)
+        """Handles poll duration. Resumed polls only run for their remaining time."""
+        await asyncio.sleep(max(self._ends_at - time.time(), 0))
 
     async def _finish_poll(self):
-        """Removes multi-votes and calls the Page on_next function when finished."""
-        cheaters = await self._get_cheaters()
-        for voters in self.data.values():
-            voters -= cheaters
-
-        await self.output.clear_reactions()
-        await self.page.on_next_event(self)
-
-    async def _get_cheaters(self) -> Set[int]:
-        """Returns a set of user ID's that appear in more than one state_field value."""
-        seen = set()
-        repeated = set()
-        for voters in self.data.values():
-            for voter in voters:
-                repeated.add(voter) if voter in seen else seen.add(voter)
+        """Stores the counted voters in `data` and calls the Page on_next function when finished."""
+        if self.reconcile:
+            await self._reconcile()
+
+        self.set_data(self.tally.voters())
 
-        return repeated
+        if self.ledger:
+            await self.ledger.close(delete=True)
+
+        await self._clear_poll_messages()
+        await self._call_event(self.page.on_next_event, self)
+
+    async def _clear_poll_messages(self):
+        """Removes the voting reactions or buttons once the poll has finished."""
+        if self.input_backend is COMPONENTS:
+            component_router.forget(self.output.id)
+            return await self._set_components([], CLEANUP)
+
+        await request_scheduler.clear_reactions(self.output, owner=self)
 
     async def _set_data(self):
-        """Internally sets data field keys and values based on the current Page button properties."""
+        """Internally sets up the vote tally and data field keys based on the current Page button properties."""
         self._validate_buttons()
 
-        self.set_data({})
-        for button in self.page.buttons_list:
-            self.data.update({button: set()})
+        if self.tally is None:
+            tally_type = CompactVoteTally if self.compact_votes else VoteTally
+            self.tally = tally_type(self.page.buttons_list, multiple=self.multiple_votes)
+
+        self.set_data({button: set() for button in self.page.buttons_list})
 
     def _validate_buttons(self):
         """Checks that Poll objects always have more than two buttons."""
@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from discord import HTTPException, Message
+
+from dpymenus.settings import REQUEST_RATE
+
+# AIMD tuning: requests per second gained after every unthrottled request, and the factor applied when throttled
+RATE_INCREASE = 1.0
+RATE_DECREASE = 0.5
+MIN_RATE = 0.5
+MAX_RATE = 20.0
+
+# a request is considered throttled when it takes this much longer than usual; discord.py retries 429 responses
+# internally, so an unusually slow request is usually the only sign of one
+THROTTLE_LATENCY_FACTOR = 3.0
+THROTTLE_MIN_DELAY = 0.5
+
+# how often, in seconds, idle throttled buckets are checked for eviction
+IDLE_SWEEP_INTERVAL = 60.0
+
+
+class Priority(IntEnum):
+    """Defines the lane a request waits in. Lower values are always served first.
+
+    INTERACTIVE is for responses to user input, BACKGROUND for periodic refreshes, and CLEANUP for work done after a
+    menu has closed.
+    """
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    CLEANUP = 2
+
+
+# map Enum references so we can export them in a user-friendly way
+INTERACTIVE = Priority.INTERACTIVE
+BACKGROUND = Priority.BACKGROUND
+CLEANUP = Priority.CLEANUP
+
+Job = Tuple[Callable[..., Awaitable], tuple, asyncio.Future]
+
+
+class _Bucket:
+    """The pacing state and the queued requests of a single rate limit bucket. Each priority lane maps an owner to
+    its own queue; owners take turns, so one busy menu can not starve the others."""
+
+    __slots__ = ('rate', 'latency', 'last_issue', 'lanes', 'depth', 'worker')
+
+    def __init__(self, rate: float):
+        self.rate: float = rate
+        self.latency: Optional[float] = None
+        self.last_issue: float = 0.0
+        self.lanes: List['OrderedDict[Hashable, Deque[Job]]'] = [OrderedDict() for _ in Priority]
+        self.depth: int = 0
+        self.worker: Optional[asyncio.Task] = None
+
+    def push(self, owner: Hashable, priority: Priority, job: Job):
+        """Queues a job at the back of its owner's queue."""
+        lane = self.lanes[priority]
+        queue = lane.get(owner)
+        if queue is None:
+            queue = lane[owner] = deque()
+
+        queue.append(job)
+        self.depth += 1
+
+    def pop(self) -> Job:
+        """Takes the next job from the most urgent non-empty lane, rotating its owners round-robin."""
+        for lane in self.lanes:
+            if lane:
+                owner, queue = next(iter(lane.items()))
+                job = queue.popleft()
+                self.depth -= 1
+
+                if queue:
+                    lane.move_to_end(owner)
+                else:
+                    del lane[owner]
+
+                return job
+
+        raise IndexError('pop from an empty bucket')
+
+
+class RateLimitScheduler:
+    """Issues API requests per rate limit bucket as fast as the bucket allows, instead of sleeping a fixed delay after
+    each one.
+
+    Requests in the same bucket run one at a time, spaced by the bucket's current rate. The rate grows additively
+    after every request that completes normally and is halved when a request is throttled, either with a 429 error or
+    by taking much longer than the bucket's usual latency.
+
+    Waiting requests are ordered by priority lane first. Within a lane, owners (usually menus) take turns, and each
+    owner's requests run in the order they were submitted.
+
+    :param rate: The starting number of requests per second for a new bucket.
+    """
+
+    def __init__(self, rate: float = REQUEST_RATE):
+        self.rate: float = rate
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self._swept: float = time.monotonic()
+
+    def bucket_rate(self, key: Hashable) -> float:
+        """Returns the current requests per second of a bucket.
+
+        :param key: The bucket key, ie. a `(channel_id, route)` tuple.
+        :rtype: float
+        """
+        bucket = self._buckets.get(key)
+
+        return bucket.rate if bucket else self.rate
+
+    def queue_depths(self) -> Dict[int, int]:
+        """Returns how many requests are waiting per channel ID, across all routes. Useful for forwarding to a metrics
+        backend.
+
+        :rtype: Dict[int, int]
+        """
+        depths: Dict[int, int] = {}
+        for key, bucket in self._buckets.items():
+            if bucket.depth:
+                channel_id = key[0] if isinstance(key, tuple) else key
+                depths[channel_id] = depths.get(channel_id, 0) + bucket.depth
+
+        return depths
+
+    def submit(
+        self,
+        key: Hashable,
+        fn: Callable[..., Awaitable],
+        *args,
+        owner: Hashable = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> asyncio.Future:
+        """Queues a request in a bucket and returns a future for its result.
+
+        :param key: The bucket key, ie. a `(channel_id, route)` tuple.
+        :param fn: A coroutine function which makes the request.
+        :param owner: Who the request is made for, usually a menu; owners in the same lane take turns.
+        :param priority: The lane the request waits in.
+        :rtype: :class:`asyncio.Future`
+        """
+        now = time.monotonic()
+        if now - self._swept >= IDLE_SWEEP_INTERVAL:
+            self._evict_idle(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.rate)
+
+        future = asyncio.get_running_loop().create_future()
+        bucket.push(owner, priority, (fn, args, future))
+
+        if bucket.worker is None or bucket.worker.done():
+            bucket.worker = asyncio.create_task(self._work(key, bucket))
+
+        return future
+
+    async def add_reactions(
+        self,
+        message: Message,
+        buttons: Iterable[Any],
+        owner: Hashable = None,
+        priority: Priority = Priority.INTERACTIVE,
+    ):
+        """Adds reactions to a message in order, paced by the reaction bucket of its channel.
+
+        :param message: The message to react to.
+        :param buttons: The emoji to add, skipping any that are None.
+        :param owner: Who the reactions are added for, usually a menu.
+        :param priority: The lane the requests wait in.
+        """
+        key = (message.channel.id, 'reactions')
+        futures: List[asyncio.Future] = [
+            self.submit(key, message.add_reaction, button, owner=owner, priority=priority)
+            for button in buttons
+            if button is not None
+        ]
+
+        try:
+            await asyncio.gather(*futures)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def remove_reaction(
+        self, message: Message, button: Any, member: Any, owner: Hashable = None, priority: Priority = INTERACTIVE
+    ):
+        """Removes a user's reaction from a message, paced by the reaction bucket of its channel."""
+        key = (message.channel.id, 'reactions')
+
+        return await self.submit(key, message.remove_reaction, button, member, owner=owner, priority=priority)
+
+    async def clear_reactions(self, message: Message, owner: Hashable = None, priority: Priority = CLEANUP):
+        """Removes every reaction from a message, paced by the reaction bucket of its channel."""
+        key = (message.channel.id, 'reactions')
+
+        return await self.submit(key, message.clear_reactions, owner=owner, priority=priority)
+
+    async def edit(self, message: Message, owner: Hashable = None, priority: Priority = INTERACTIVE, **fields):
+        """Edits a message, paced by the edit bucket of its channel."""
+        key = (message.channel.id, 'edit')
+
+        return await self.submit(key, _edit, message, fields, owner=owner, priority=priority)
+
+    async def delete(self, message: Message, owner: Hashable = None, priority: Priority = CLEANUP):
+        """Deletes a message, paced by the delete bucket of its channel."""
+        key = (message.channel.id, 'delete')
+
+        return await self.submit(key, message.delete, owner=owner, priority=priority)
+
+    # Internal Methods
+    async def _work(self, key: Hashable, bucket: _Bucket):
+        """Runs the queued requests of a bucket until it is empty. Buckets which are not slowed down are dropped once
+        they are idle, so the scheduler does not keep state for every channel it has ever seen; throttled ones are
+        left to `_evict_idle`."""
+        while bucket.depth:
+            fn, args, future = bucket.pop()
+            if future.done():
+                continue
+
+            delay = bucket.last_issue + 1 / bucket.rate - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            bucket.last_issue = start = time.monotonic()
+            try:
+                result = await fn(*args)
+            except HTTPException as exc:
+                if exc.status == 429:
+                    self._throttle(key, bucket)
+                if not future.done():
+                    future.set_exception(exc)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                self._measure(key, bucket, time.monotonic() - start)
+                if not future.done():
+                    future.set_result(result)
+
+        if bucket.rate >= self.rate and self._buckets.get(key) is bucket:
+            del self._buckets[key]
+
+    def _evict_idle(self, now: float):
+        """Drops throttled buckets which have been idle long enough to be back at the starting rate. An idle bucket
+        is treated as regaining `RATE_INCREASE` requests per second for every second without a request, the same as
+        if it had spent that time on requests which completed normally."""
+        self._swept = now
+
+        for key in [
+            key
+            for key, bucket in self._buckets.items()
+            if bucket.depth == 0
+            and (bucket.worker is None or bucket.worker.done())
+            and bucket.rate + (now - bucket.last_issue) * RATE_INCREASE >= self.rate
+        ]:
+            del self._buckets[key]
+
+    def _measure(self, key: Hashable, bucket: _Bucket, duration: float):
+        """Adapts the rate of a bucket to how long a successful request took."""
+        if bucket.latency is not None and duration > max(
+            bucket.latency * THROTTLE_LATENCY_FACTOR, bucket.latency + THROTTLE_MIN_DELAY
+        ):
+            self._throttle(key, bucket)
+            return
+
+        bucket.latency = duration if bucket.latency is None else bucket.latency * 0.8 + duration * 0.2
+        bucket.rate = min(bucket.rate + RATE_INCREASE, MAX_RATE)
+
+    @staticmethod
+    def _throttle(key: Hashable, bucket: _Bucket):
+        """Halves the rate of a bucket after it was throttled."""
+        bucket.rate = max(bucket.rate * RATE_DECREASE, MIN_RATE)
+        logging.debug(f'Rate limit bucket {key} was throttled; slowing down to {bucket.rate:.2f} requests/s.')
+
+
+async def _edit(message: Message, fields: Dict[str, Any]):
+    """Edits a message; keyword arguments can not be queued, so they are passed as a dictionary."""
+    return await message.edit(**fields)
+
+
+request_scheduler = RateLimitScheduler(REQUEST_RATE)
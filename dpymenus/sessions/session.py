@@ -1,18 +1,23 @@
+import asyncio
+import logging
 import time
 from operator import itemgetter
-from typing import List, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
+
+from discord import Guild
 
 from dpymenus import sessions
 from dpymenus.settings import ALLOW_SESSION_RESTORE, SESSION_PER_USER_LIMIT
 
 if TYPE_CHECKING:
+    from dpymenus.history import History
     from dpymenus.types import Menu, SessionKey
 
 
 class Session:
     key: 'SessionKey'
     instance: 'Menu'
-    history: List[int]
+    history: 'History'
     active: bool
 
     def __repr__(self):
@@ -84,3 +89,53 @@ class Session:
             sessions[self.key][instance._id] = self
 
         return self
+
+
+async def close_all(guild: Optional[Guild] = None, concurrency: int = 10, timeout: Optional[float] = None) -> int:
+    """Closes every open menu, for example when the bot shuts down or a cog is unloaded. At most `concurrency` menus
+    are closed at the same time. Menus which are still closing once `timeout` seconds have passed are abandoned.
+    Returns how many menus were closed.
+
+    :param guild: Only closes menus opened in this guild, if set.
+    :param concurrency: How many menus may be closing at the same time.
+    :param timeout: The deadline, in seconds, for closing every menu. Waits until all menus are closed if not set.
+    :rtype: int
+    """
+    menus = [
+        session.instance
+        for user_sessions in sessions.values()
+        for session in user_sessions.values()
+        if session.active and (guild is None or session.instance.ctx.guild == guild)
+    ]
+
+    if not menus:
+        return 0
+
+    semaphore = asyncio.Semaphore(concurrency)
+    closed = 0
+
+    async def _close(menu: 'Menu'):
+        nonlocal closed
+
+        async with semaphore:
+            # a menu may have closed on its own while waiting for the semaphore
+            if not menu.active:
+                return
+
+            try:
+                await menu.close()
+            except Exception:
+                logging.exception(f'Failed to close {menu}.')
+            else:
+                closed += 1
+
+    tasks = [asyncio.create_task(_close(menu)) for menu in menus]
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+    for task in pending:
+        task.cancel()
+
+    if pending:
+        logging.warning(f'{len(pending)} menus did not close within {timeout}s.')
+
+    return closed
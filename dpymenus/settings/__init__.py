@@ -38,7 +38,25 @@ ALLOW_SESSION_RESTORE = config.get('allow-session-restore', False)
 HIDE_WARNINGS = config.get('hide-warnings', False)
 REPLY_AS_DEFAULT = config.get('reply-as-default', False)
 BUTTON_DELAY = config.get('button-delay', 0.35)
+# `reaction-rate` is the old name of this setting
+REQUEST_RATE = config.get('request-rate', config.get('reaction-rate', 4.0))
 TIMEOUT = config.get('timeout', 120)
+HOOK_TIMEOUT = config.get('hook-timeout', 0)
+AFTER_HOOK_TIMEOUT = config.get('after-hook-timeout', 30)
+BATCH_DELETES = config.get('batch-deletes', False)
+BATCH_DELETE_INTERVAL = config.get('batch-delete-interval', 2.0)
+BATCH_DELETE_SIZE = config.get('batch-delete-size', 100)
+WATCHDOG_THRESHOLD = config.get('watchdog-threshold', 0)
+THREAD_POOL_WORKERS = config.get('thread-pool-workers', 4)
+PROCESS_POOL_WORKERS = config.get('process-pool-workers', 0)
+LIVE_RESULTS_INTERVAL = config.get('live-results-interval', 5.0)
+LEDGER_FLUSH_INTERVAL = config.get('ledger-flush-interval', 1.0)
+LEDGER_SNAPSHOT_EVENTS = config.get('ledger-snapshot-events', 10000)
+RECONCILE_CONCURRENCY = config.get('reconcile-concurrency', 2)
+INPUT_RATE = config.get('input-rate', 0)
+INPUT_BURST = config.get('input-burst', 3)
+TOGGLE_BUTTONS = config.get('toggle-buttons', False)
+INPUT_BACKEND = config.get('input-backend', 'reactions')
 
 # set constants
 CONSTANTS_CONFIRM = config.get(
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+from typing import List, Set
+
+from discord import Embed, Message
+from discord.ext.commands import Context
+
+from dpymenus import ButtonsError, Poll
+from dpymenus.components import REACTIONS, InputBackend
+from dpymenus.constants import REACTIONS_PER_MESSAGE
+from dpymenus.scheduler import request_scheduler
+
+# Discord rejects embed field values longer than this
+FIELD_VALUE_LIMIT = 1024
+
+
+class ShardedPoll(Poll):
+    """Represents a Poll with more choices than a single message can hold reactions for.
+
+    Choices are spread across several messages; the first one displays the poll page and the others only list
+    their choices. All messages share a single tally, so a user who votes on two different messages is detected as
+    a duplicate voter like on a regular Poll.
+
+    :param ctx: A reference to the command context.
+    """
+
+    __slots__ = ('shards',)
+
+    _resumable = False
+
+    def __init__(self, ctx: Context):
+        super().__init__(ctx)
+        self.shards: List[Message] = []
+
+    def __repr__(self):
+        return (
+            f'ShardedPoll(pages={[p.__str__() for p in self.pages]}, shards={len(self.shards)}, timeout={self.timeout})'
+        )
+
+    @property
+    def shard_size(self) -> int:
+        return self._options.get('shard_size', REACTIONS_PER_MESSAGE)
+
+    def set_shard_size(self, size: int) -> 'ShardedPoll':
+        """Sets how many choices each message holds. Returns itself for fluent-style chaining.
+
+        :param size: The number of reactions per message; at most 20.
+        :rtype: :class:`ShardedPoll`
+        """
+        self._set_option('shard_size', min(size, REACTIONS_PER_MESSAGE))
+
+        return self
+
+    @property
+    def input_backend(self) -> InputBackend:
+        return REACTIONS
+
+    def set_input_backend(self, backend: InputBackend) -> 'ShardedPoll':
+        """Ignored; choices are spread across messages by their reaction limit, so a ShardedPoll always uses
+        reactions. Returns itself for fluent-style chaining.
+
+        :rtype: :class:`ShardedPoll`
+        """
+        if backend is not REACTIONS:
+            logging.error('A ShardedPoll only supports reaction buttons; ignoring `set_input_backend`.')
+
+        return self
+
+    async def add_results_fields(self):
+        """Utility method to add the results to your next page automatically. Results are sorted by vote count and
+        packed into as few fields as possible, since a page can not hold a field per choice."""
+        next_page = self.pages[self.page.index + 1]
+        results = sorted((await self.results()).items(), key=lambda item: item[1], reverse=True)
+
+        value = ''
+        for choice, count in results:
+            line = f'{choice} {count}\n'
+            if len(value) + len(line) > FIELD_VALUE_LIMIT:
+                next_page.add_field(name='Results', value=value, inline=False)
+                value = ''
+            value += line
+
+        if value:
+            next_page.add_field(name='Results', value=value, inline=False)
+
+    # Internal Methods
+    def _chunks(self) -> List[List[str]]:
+        """Splits the buttons into one list per message."""
+        buttons = self.page.buttons_list
+
+        return [buttons[i : i + self.shard_size] for i in range(0, len(buttons), self.shard_size)]
+
+    async def _add_buttons(self):
+        """Sends a message for every chunk of choices after the first, then adds each message's reactions.
+        Messages are filled in parallel, each one in button order, under the shared reaction scheduler."""
+        chunks = self._chunks()
+        self.shards = [self.output]
+
+        for number, chunk in enumerate(chunks[1:], start=2):
+            embed = Embed(title=self.page.title, description=f'Choices, part {number} of {len(chunks)}')
+            self.shards.append(await self.output.channel.send(embed=embed))
+
+        await asyncio.gather(
+            *(request_scheduler.add_reactions(shard, chunk, owner=self) for shard, chunk in zip(self.shards, chunks))
+        )
+
+    def _poll_messages(self) -> List[Message]:
+        return self.shards or [self.output]
+
+    def _message_ids(self) -> Set[int]:
+        return {shard.id for shard in self._poll_messages()}
+
+    async def _clear_poll_messages(self):
+        """Removes the extra messages and the reactions on the first one once the poll has finished."""
+        await asyncio.gather(
+            request_scheduler.clear_reactions(self.output, owner=self),
+            *(request_scheduler.delete(shard, owner=self) for shard in self.shards[1:]),
+        )
+        self.shards = [self.output]
+
+    def _validate_buttons(self):
+        """Checks that the poll has at least two choices and that no choice is used twice."""
+        buttons = self.page.buttons_list
+        if len(buttons) < 2:
+            raise ButtonsError(
+                f'A Poll primary page must have at least two buttons. Expected at least 2, found {len(buttons)}.'
+            )
+
+        if len(set(buttons)) != len(buttons):
+            raise ButtonsError('A ShardedPoll can not use the same button for more than one choice.')
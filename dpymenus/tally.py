@@ -0,0 +1,207 @@
+from typing import Collection, Dict, Iterable, List, Set
+
+from dpymenus.voters import VoterSet
+
+
+class VoteTally:
+    """Counts poll votes as they arrive. Every add or remove event updates a voter to choices index and the
+    per-choice counters in constant time, so results are always current and never need a rescan.
+
+    In single-choice mode a voter only counts while they hold exactly one choice; voting for a second choice voids
+    their vote until they remove one of them again.
+
+    `version` is incremented every time the counts change, so renderers can cheaply tell whether they are stale.
+
+    :param choices: The choices which can be voted for.
+    :param multiple: Whether a voter may vote for more than one choice.
+    """
+
+    __slots__ = ('multiple', 'version', '_counts', '_votes', '_voters', '_duplicates')
+
+    def __init__(self, choices: Iterable[str], multiple: bool = False):
+        self.multiple: bool = multiple
+        self.version: int = 0
+        self._counts: Dict[str, int] = dict.fromkeys(choices, 0)
+        self._votes: Dict[int, Set[str]] = {}
+        self._voters: int = 0
+        self._duplicates: Set[int] = set()
+
+    def __repr__(self):
+        return f'VoteTally({self._counts})'
+
+    def __len__(self) -> int:
+        """Returns how many voters currently have a counted vote."""
+        if self.multiple:
+            return self._voters
+
+        return self._voters - len(self._duplicates)
+
+    def add(self, voter: int, choice: str) -> bool:
+        """Records a vote. Returns true if the counts changed.
+
+        :param voter: The user ID of the voter.
+        :param choice: The chosen button.
+        :rtype: bool
+        """
+        if choice not in self._counts:
+            return False
+
+        held = self._held(voter)
+        if choice in held:
+            return False
+
+        others = tuple(held)
+        self._hold(voter, choice)
+
+        if not others:
+            self._voters += 1
+
+        if self.multiple or not others:
+            self._counts[choice] += 1
+            self.version += 1
+            return True
+
+        if len(others) == 1:
+            self._duplicates.add(voter)
+            self._counts[others[0]] -= 1
+            self.version += 1
+            return True
+
+        return False
+
+    def remove(self, voter: int, choice: str) -> bool:
+        """Withdraws a vote. Returns true if the counts changed.
+
+        :param voter: The user ID of the voter.
+        :param choice: The withdrawn button.
+        :rtype: bool
+        """
+        held = self._held(voter)
+        if choice not in held:
+            return False
+
+        others = tuple(c for c in held if c != choice)
+        self._release(voter, choice)
+
+        if not others:
+            self._voters -= 1
+
+        if self.multiple or not others:
+            self._counts[choice] -= 1
+            self.version += 1
+            return True
+
+        if len(others) == 1:
+            self._duplicates.discard(voter)
+            self._counts[others[0]] += 1
+            self.version += 1
+            return True
+
+        return False
+
+    def results(self) -> Dict[str, int]:
+        """Returns the current number of counted votes per choice.
+
+        :rtype: Dict[str, int]
+        """
+        return dict(self._counts)
+
+    def count(self, choice: str) -> int:
+        """Returns the current number of counted votes for a choice.
+
+        :rtype: int
+        """
+        return self._counts[choice]
+
+    def choices_of(self, voter: int) -> Set[str]:
+        """Returns the choices a voter currently holds, counted or not.
+
+        :rtype: Set[str]
+        """
+        return set(self._held(voter))
+
+    @property
+    def duplicates(self) -> Set[int]:
+        """Voters whose vote is void because they hold more than one choice. Always empty in multi-choice mode."""
+        return set(self._duplicates)
+
+    def voters(self) -> Dict[str, Set[int]]:
+        """Returns the voters behind each choice's count; duplicate voters are left out in single-choice mode.
+
+        :rtype: Dict[str, Set[int]]
+        """
+        voters = {choice: set() for choice in self._counts}
+        for voter, choices in self._votes.items():
+            if self.multiple or len(choices) == 1:
+                for choice in choices:
+                    voters[choice].add(voter)
+
+        return voters
+
+    def snapshot(self) -> Dict[str, List[int]]:
+        """Returns every choice with the voters holding it, including voided duplicate votes, in a form which can be
+        serialized and replayed into a new tally.
+
+        :rtype: Dict[str, List[int]]
+        """
+        holdings = {choice: [] for choice in self._counts}
+        for voter, choices in self._votes.items():
+            for choice in choices:
+                holdings[choice].append(voter)
+
+        return holdings
+
+    # Internal Methods
+    def _held(self, voter: int) -> Collection[str]:
+        """Returns the choices a voter currently holds."""
+        return self._votes.get(voter, ())
+
+    def _hold(self, voter: int, choice: str):
+        """Stores that a voter holds a choice."""
+        self._votes.setdefault(voter, set()).add(choice)
+
+    def _release(self, voter: int, choice: str):
+        """Stores that a voter no longer holds a choice."""
+        choices = self._votes[voter]
+        choices.remove(choice)
+        if not choices:
+            del self._votes[voter]
+
+
+class CompactVoteTally(VoteTally):
+    """A :class:`VoteTally` for very large polls. Instead of a voter to choices index, each choice keeps its voters
+    in a :class:`VoterSet`, which costs about 8 bytes per vote. Looking up a voter's choices checks each choice's
+    set, so it is O(choices * log voters) rather than O(1).
+
+    :param choices: The choices which can be voted for.
+    :param multiple: Whether a voter may vote for more than one choice.
+    """
+
+    __slots__ = ('_members',)
+
+    def __init__(self, choices: Iterable[str], multiple: bool = False):
+        super().__init__(choices, multiple)
+        self._members: Dict[str, VoterSet] = {choice: VoterSet() for choice in self._counts}
+
+    def voters(self) -> Dict[str, VoterSet]:
+        """Returns the voters behind each choice's count; duplicate voters are left out in single-choice mode.
+
+        :rtype: Dict[str, VoterSet]
+        """
+        if self.multiple or not self._duplicates:
+            return {choice: members.copy() for choice, members in self._members.items()}
+
+        return {choice: members - self._duplicates for choice, members in self._members.items()}
+
+    def snapshot(self) -> Dict[str, List[int]]:
+        return {choice: list(members) for choice, members in self._members.items()}
+
+    # Internal Methods
+    def _held(self, voter: int) -> Collection[str]:
+        return [choice for choice, members in self._members.items() if voter in members]
+
+    def _hold(self, voter: int, choice: str):
+        self._members[choice].add(voter)
+
+    def _release(self, voter: int, choice: str):
+        self._members[choice].discard(voter)
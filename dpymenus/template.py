@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import Dict, Tuple, List, Union
+from typing import Any, Callable, Dict, Iterable, Tuple, List, TYPE_CHECKING, Union
 from enum import Enum
 
+if TYPE_CHECKING:
+    from dpymenus import Page
+
 
 class FieldStyle(Enum):
     """Defines how templated fields are handled when interacting with existing embed fields.
@@ -52,3 +55,88 @@ class Template:
     fields: List[Dict[str, Union[str, bool]]] = None
     field_style: FieldStyle = FieldStyle.IGNORE
     field_sort: FieldSort = FieldSort.LAST
+
+    def compile(self) -> 'CompiledTemplate':
+        """Resolves the template once into a :class:`CompiledTemplate`, which can be applied to any number of pages.
+        `add_pages` does this automatically when it is given a template.
+
+        :rtype: :class:`CompiledTemplate`
+        """
+        return CompiledTemplate(self)
+
+
+class CompiledTemplate:
+    """A template resolved into a flat plan that can be applied to many pages. Only the attributes the template
+    actually sets are kept, the field style and sort are resolved into a single merge function, and footers,
+    images, thumbnails, authors, and fields are converted into the internal format Embeds use.
+
+    The converted data is shared by reference between every page the template is applied to; pages merge it with
+    their own attributes only when they are serialized, so it must never be mutated.
+    """
+
+    __slots__ = ('scalars', 'footer', 'image', 'thumbnail', 'author', 'fields', '_merge')
+
+    def __init__(self, template: Template):
+        self.scalars: Tuple[Tuple[str, Any], ...] = tuple(
+            (attr, value)
+            for attr, value in (
+                ('title', template.title),
+                ('description', template.description),
+                ('color', template.color),
+                ('url', template.url),
+            )
+            if value
+        )
+
+        self.footer = (
+            {'text': str(template.footer.get('text', '')), 'icon_url': str(template.footer.get('icon_url', ''))}
+            if template.footer
+            else None
+        )
+        self.image = {'url': str(template.image)} if template.image else None
+        self.thumbnail = {'url': str(template.thumbnail)} if template.thumbnail else None
+        self.author = (
+            {
+                'name': str(template.author.get('name', '')),
+                'url': str(template.author.get('url', '')),
+                'icon_url': str(template.author.get('icon_url', '')),
+            }
+            if template.author
+            else None
+        )
+        self.fields: Tuple[Dict, ...] = tuple(
+            {
+                'inline': field.get('inline', False),
+                'name': str(field.get('name', '')),
+                'value': str(field.get('value', '')),
+            }
+            for field in template.fields or ()
+        )
+
+        self._merge = _resolve_field_merge(template.field_style, template.field_sort) if self.fields else None
+
+    def apply(self, pages: Iterable['Page']) -> List['Page']:
+        """Applies the template to every page in a single pass.
+
+        :param pages: The pages to template.
+        :rtype: List[:class:`Page`]
+        """
+        return [page._apply_template(self) for page in pages]
+
+    def merge_fields(self, fields: List[Dict]) -> List[Dict]:
+        """Returns a page's own fields combined with the template fields according to the field style and sort."""
+        return self._merge(self.fields, fields) if self._merge else fields
+
+
+def _resolve_field_merge(style: FieldStyle, sort: FieldSort) -> Callable[[Tuple[Dict, ...], List[Dict]], List[Dict]]:
+    """Returns a function which splices template fields into a page's own fields in one step."""
+    if style == FieldStyle.OVERRIDE:
+        return lambda template, own: list(template)
+
+    if style == FieldStyle.COMBINE:
+        if sort == FieldSort.FIRST:
+            return lambda template, own: [*template, *own]
+
+        return lambda template, own: [*own, *template]
+
+    return lambda template, own: own or list(template)
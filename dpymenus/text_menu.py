@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Dict, List, Union
+from typing import Awaitable, Dict, Iterable, List, Optional, Union
 
 from discord import Message
 from discord.abc import GuildChannel
@@ -8,26 +8,29 @@ from discord.ext.commands import Context
 
 from dpymenus import PagesError, SessionError
 from dpymenus.base_menu import BaseMenu
+from dpymenus.cleanup import delete_queue
 from dpymenus.constants import QUIT
-from dpymenus.hooks import call_hook
+from dpymenus.hooks import HookEvent, HookWhen, call_hook
+from dpymenus.matcher import ResponseMatcher
+from dpymenus.settings import BATCH_DELETES
 
 
 class TextMenu(BaseMenu):
     """Represents a text-based response menu."""
 
-    _delay: float
-    _data: Dict
-    _normalized: bool
+    __slots__ = ('_response', '_response_source')
 
     def __init__(self, ctx: Context):
         super().__init__(ctx)
+        self._response: Optional[str] = None
+        self._response_source: Optional[Message] = None
 
     def __repr__(self):
         return f'TextMenu({self.ctx})'
 
     @property
     def delay(self) -> float:
-        return getattr(self, '_delay', 0.250)
+        return self._options.get('delay', 0.250)
 
     def set_delay(self, delay: float) -> 'TextMenu':
         """Sets the delay on when a users message will be deleted. Returns itself for fluent-style
@@ -36,13 +39,13 @@ class TextMenu(BaseMenu):
         :param delay: Specifies the duration in seconds.
         :rtype: :class:`BaseMenu`
         """
-        self._delay = delay
+        self._set_option('delay', delay)
 
         return self
 
     @property
     def data(self) -> Dict:
-        return getattr(self, '_data', {})
+        return self._options.get('data', {})
 
     def set_data(self, data: Dict) -> 'TextMenu':
         """Sets a dictionary up for persistent state data. Returns itself for fluent-style chaining.
@@ -50,13 +53,28 @@ class TextMenu(BaseMenu):
         :param data: Structure representing variables that can be easily accessed across a menu instance.
         :rtype: :class:`TextMenu`
         """
-        self._data = data
+        self._set_option('data', data)
+
+        return self
+
+    @property
+    def batch_deletes(self) -> bool:
+        return self._options.get('batch_deletes', BATCH_DELETES)
+
+    def batch_input_deletes(self) -> 'TextMenu':
+        """Queues user messages for bulk deletion instead of deleting each one with its own request. Queued messages
+        are flushed per channel every `batch-delete-interval` seconds, or sooner once `batch-delete-size` messages
+        are waiting; the menu delay is ignored. Overrides the global settings. Returns itself for fluent-style chaining.
+
+        :rtype: :class:`TextMenu`
+        """
+        self._set_option('batch_deletes', True)
 
         return self
 
     @property
     def normalized(self) -> bool:
-        return getattr(self, '_normalized', False)
+        return self._options.get('normalized', False)
 
     def normalize_responses(self) -> 'TextMenu':
         """Strips all input data and ignores case when comparing strings with `response_is`. Returns itself for
@@ -64,26 +82,26 @@ class TextMenu(BaseMenu):
 
         :rtype: :class:`TextMenu`
         """
-        self._normalized = True
+        self._set_option('normalized', True)
 
         return self
 
-    def response_is(self, valid_response: Union[str, List[str]]) -> bool:
-        """Helper method which checks if a users response is in the str or list of strings passed in.
-        `response_in` exists as an alias to this method.
+    def response_is(self, valid_response: Union[str, Iterable[str], ResponseMatcher]) -> bool:
+        """Helper method which checks if a users response is in the str, collection of strings, or
+        :class:`ResponseMatcher` passed in. `response_in` exists as an alias to this method.
 
         :valid_response: Values to compare user input against.
         :rtype: bool
         """
-        response = self.input.content
-        if self.normalized:
-            response = ' '.join(response.lower().split())
+        response = self._get_response()
 
-        return (
-            any(response == res for res in valid_response)
-            if isinstance(valid_response, List)
-            else valid_response == response
-        )
+        if isinstance(valid_response, ResponseMatcher):
+            return valid_response.matches(response)
+
+        if isinstance(valid_response, str):
+            return valid_response == response
+
+        return response in valid_response
 
     # response_is alias
     response_in = response_is
@@ -101,37 +119,62 @@ class TextMenu(BaseMenu):
             logging.info(exc.message)
 
         else:
-            await call_hook(self, '_hook_after_open')
+            await call_hook(self, HookWhen.AFTER, HookEvent.OPEN)
 
             first_iter = True
 
             while self.active:
-                await call_hook(self, '_hook_before_update')
+                await call_hook(self, HookWhen.BEFORE, HookEvent.UPDATE)
                 if not first_iter and self.page.on_fail_event:
-                    return await self.page.on_fail_event()
+                    return await self._call_event(self.page.on_fail_event)
 
                 self.input = await self._get_input()
 
                 if self.input:
                     if self.output and isinstance(self.output.channel, GuildChannel) and self.delay != 0:
-                        await self.input.delete(delay=self.delay)
+                        if self.batch_deletes:
+                            delete_queue.add(self.input)
+                        else:
+                            await self.input.delete(delay=self.delay)
 
                     if self.response_in(QUIT):
                         return await self._cancel_menu()
 
-                    await call_hook(self, '_hook_after_update')
-                    await self.page.on_next_event(self)
+                    await call_hook(self, HookWhen.AFTER, HookEvent.UPDATE)
+                    await self._call_event(self.page.on_next_event, self)
 
                 first_iter = False
 
     # Internal Methods
+    def _cleanup_tasks(self) -> List[Awaitable]:
+        """Extends the close cleanup with flushing any user messages still queued for deletion."""
+        tasks = super()._cleanup_tasks()
+
+        if self.output and self.batch_deletes:
+            tasks.append(delete_queue.flush(self.output.channel.id))
+
+        return tasks
+
+    def _get_response(self) -> str:
+        """Returns the user input, normalized if enabled. This is computed once per message, since callbacks
+        usually compare the same input several times."""
+        if self._response_source is not self.input:
+            response = self.input.content
+            if self.normalized:
+                response = ' '.join(response.lower().split())
+
+            self._response = response
+            self._response_source = self.input
+
+        return self._response
+
     async def _get_input(self) -> Message:
         """Waits for user text input and returns the message object."""
         try:
             message = await self.ctx.bot.wait_for('message', timeout=self.timeout, check=self._check)
         except asyncio.TimeoutError:
             if self.page.on_timeout_event:
-                await self.page.on_timeout_event()
+                await self._call_event(self.page.on_timeout_event)
             else:
                 await self._timeout_menu()
         else:
@@ -0,0 +1,126 @@
+import time
+from enum import Enum
+from typing import Dict, Tuple
+
+from dpymenus.exceptions import ButtonsError
+from dpymenus.settings import INPUT_BURST, INPUT_RATE
+
+# the rate used when the `input-rate` setting leaves throttling disabled, but a menu asks for a throttle anyway
+DEFAULT_INPUT_RATE = 2.0
+
+# user buckets are pruned once there are this many; buckets which have fully refilled carry no state worth keeping
+USER_BUCKET_PRUNE_SIZE = 1024
+
+
+class ThrottleMode(Enum):
+    """Defines what happens to inputs beyond the throttle's rate.
+
+    DROP ignores them. COLLAPSE holds the menu until the throttle allows another input, and only acts on the latest
+    button pressed in the meantime.
+    """
+
+    DROP = 0
+    COLLAPSE = 1
+
+
+# map Enum references so we can export them in a user-friendly way
+DROP = ThrottleMode.DROP
+COLLAPSE = ThrottleMode.COLLAPSE
+
+
+class TokenBucket:
+    """A token bucket which refills `rate` tokens per second, up to `capacity`.
+
+    :param rate: How many tokens are added per second.
+    :param capacity: How many tokens the bucket holds at most; the size of a burst.
+    """
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+        self.updated: float = time.monotonic()
+
+    def refill(self) -> float:
+        """Adds the tokens earned since the last refill and returns the current amount.
+
+        :rtype: float
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        return self.tokens
+
+    def delay(self) -> float:
+        """Returns how long, in seconds, until the bucket holds a whole token.
+
+        :rtype: float
+        """
+        return max(0.0, (1 - self.refill()) / self.rate)
+
+
+class InputThrottle:
+    """Limits how many inputs a menu acts on. Every accepted input takes a token from the menu's own bucket and one
+    from a bucket shared by all menus of the same user with the same limits, so a user can not get around the limit
+    by opening several menus.
+
+    :param rate: How many inputs per second are accepted on average.
+    :param burst: How many inputs may be accepted back to back.
+    :param mode: What happens to inputs beyond the limit.
+    """
+
+    __slots__ = ('rate', 'burst', 'mode', 'suppressed', '_bucket')
+
+    _user_buckets: Dict[Tuple[int, float, int], TokenBucket] = {}
+
+    def __init__(
+        self, rate: float = INPUT_RATE or DEFAULT_INPUT_RATE, burst: int = INPUT_BURST, mode: ThrottleMode = COLLAPSE
+    ):
+        if rate <= 0 or burst < 1:
+            raise ButtonsError(f'An input throttle needs a positive rate and burst; found rate={rate}, burst={burst}.')
+
+        self.rate: float = rate
+        self.burst: int = burst
+        self.mode: ThrottleMode = mode
+        self.suppressed: int = 0
+        self._bucket: TokenBucket = TokenBucket(rate, burst)
+
+    def __repr__(self):
+        return (
+            f'InputThrottle(rate={self.rate}, burst={self.burst}, mode={self.mode.name}, suppressed={self.suppressed})'
+        )
+
+    def acquire(self, user_id: int) -> float:
+        """Takes a token for an input by a user if both buckets have one, and returns 0. Otherwise, takes nothing and
+        returns how long, in seconds, until both buckets have a token.
+
+        :param user_id: The ID of the user who gave the input.
+        :rtype: float
+        """
+        user_bucket = self._user_bucket(user_id)
+        delay = max(self._bucket.delay(), user_bucket.delay())
+
+        if delay == 0:
+            self._bucket.tokens -= 1
+            user_bucket.tokens -= 1
+
+        return delay
+
+    # Internal Methods
+    def _user_bucket(self, user_id: int) -> TokenBucket:
+        """Returns the bucket shared by every menu of a user with the same limits, creating it on first use."""
+        buckets = InputThrottle._user_buckets
+        user_key = (user_id, self.rate, self.burst)
+
+        bucket = buckets.get(user_key)
+        if bucket is None:
+            if len(buckets) >= USER_BUCKET_PRUNE_SIZE:
+                for key in [key for key, b in buckets.items() if b.refill() >= b.capacity]:
+                    del buckets[key]
+
+            bucket = buckets[user_key] = TokenBucket(self.rate, self.burst)
+
+        return bucket
@@ -0,0 +1,150 @@
+from array import array
+from bisect import bisect_left
+from itertools import chain
+from typing import Iterable, Iterator, Set
+
+# the unsorted buffers are merged into the sorted array once they hold 1/16th of its size, or this many ids
+DELTA_MIN_SIZE = 256
+
+
+class VoterSet:
+    """A set of user IDs stored in a sorted int64 array, costing 8 bytes per voter instead of the 60+ bytes of a
+    Python set.
+
+    New IDs go into a small delta set and removed IDs into a tombstone set; both are merged into the sorted array
+    once they grow past a fraction of its size, so adds and removes are amortized O(log n) and lookups are a
+    binary search.
+
+    :param voters: The user IDs to start with.
+    """
+
+    __slots__ = ('_sorted', '_delta', '_removed')
+
+    def __init__(self, voters: Iterable[int] = ()):
+        self._sorted: array = array('q', sorted(set(voters)))
+        self._delta: Set[int] = set()
+        self._removed: Set[int] = set()
+
+    def __repr__(self):
+        return f'VoterSet(size={len(self)})'
+
+    def __len__(self) -> int:
+        return len(self._sorted) - len(self._removed) + len(self._delta)
+
+    def __iter__(self) -> Iterator[int]:
+        self._merge()
+
+        return iter(self._sorted)
+
+    def __contains__(self, voter: int) -> bool:
+        return voter in self._delta or (voter not in self._removed and self._in_sorted(voter))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, VoterSet):
+            self._merge()
+            other._merge()
+            return self._sorted == other._sorted
+
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and all(voter in self for voter in other)
+
+        return NotImplemented
+
+    def __and__(self, other: 'VoterSet') -> 'VoterSet':
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+
+        return VoterSet._from_sorted(voter for voter in small if voter in large)
+
+    def __sub__(self, other: Iterable[int]) -> 'VoterSet':
+        if not isinstance(other, (VoterSet, set, frozenset)):
+            other = set(other)
+
+        return VoterSet._from_sorted(voter for voter in self if voter not in other)
+
+    def __or__(self, other: 'VoterSet') -> 'VoterSet':
+        return VoterSet(chain(self, other))
+
+    def copy(self) -> 'VoterSet':
+        """Returns a shallow copy of the set.
+
+        :rtype: :class:`VoterSet`
+        """
+        self._merge()
+
+        return VoterSet._from_sorted(self._sorted)
+
+    def add(self, voter: int) -> bool:
+        """Adds a user ID. Returns true if it was not already in the set.
+
+        :param voter: The user ID to add.
+        :rtype: bool
+        """
+        if voter in self._removed:
+            self._removed.remove(voter)
+            return True
+
+        if voter in self._delta or self._in_sorted(voter):
+            return False
+
+        self._delta.add(voter)
+        self._maybe_merge()
+
+        return True
+
+    def discard(self, voter: int) -> bool:
+        """Removes a user ID if it is present. Returns true if it was removed.
+
+        :param voter: The user ID to remove.
+        :rtype: bool
+        """
+        if voter in self._delta:
+            self._delta.remove(voter)
+            return True
+
+        if voter in self._removed or not self._in_sorted(voter):
+            return False
+
+        self._removed.add(voter)
+        self._maybe_merge()
+
+        return True
+
+    def isdisjoint(self, other: 'VoterSet') -> bool:
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+
+        return not any(voter in large for voter in small)
+
+    # Internal Methods
+    @classmethod
+    def _from_sorted(cls, voters: Iterable[int]) -> 'VoterSet':
+        """Builds a set from IDs which are already sorted and unique, skipping the sort."""
+        voter_set = cls()
+        voter_set._sorted = array('q', voters)
+
+        return voter_set
+
+    def _in_sorted(self, voter: int) -> bool:
+        """Binary searches the sorted array, ignoring the buffers."""
+        i = bisect_left(self._sorted, voter)
+
+        return i < len(self._sorted) and self._sorted[i] == voter
+
+    def _maybe_merge(self):
+        """Merges the buffers once they are large enough for the merge to be amortized."""
+        if len(self._delta) + len(self._removed) > max(DELTA_MIN_SIZE, len(self._sorted) >> 4):
+            self._merge()
+
+    def _merge(self):
+        """Folds the delta and tombstone buffers into the sorted array. Sorting an already sorted run followed by
+        a short unsorted one is close to linear."""
+        if not self._delta and not self._removed:
+            return
+
+        kept = self._sorted
+        if self._removed:
+            removed = self._removed
+            kept = (voter for voter in kept if voter not in removed)
+
+        self._sorted = array('q', sorted(chain(kept, self._delta)))
+        self._delta = set()
+        self._removed = set()
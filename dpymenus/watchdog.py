@@ -0,0 +1,215 @@
+import asyncio
+import inspect
+import logging
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from functools import partial
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING
+
+from dpymenus.settings import WATCHDOG_THRESHOLD
+
+if TYPE_CHECKING:
+    from dpymenus import BaseMenu
+
+
+@dataclass
+class SlowCallbackReport:
+    """Describes a user callback, hook, or check that ran longer than the watchdog threshold."""
+
+    menu: str
+    page: Optional[int]
+    callback: str
+    duration: float
+    blocking: bool
+    stack: Optional[str] = None
+
+
+class Watchdog:
+    """Measures how long user callbacks run on the event loop and how far the loop lags behind.
+
+    A heartbeat task runs on the event loop while a daemon thread checks that the heartbeat keeps up. When the loop
+    stalls for longer than the threshold, the thread captures the stack of whatever is running on it, so the
+    offending callback can be reported with its menu and page identity.
+    """
+
+    def __init__(self, threshold: float = 0):
+        self.threshold: float = threshold
+        self.lag: float = 0.0
+        self.max_lag: float = 0.0
+        self._listeners: List[Callable[[SlowCallbackReport], Any]] = []
+        self._heartbeat: float = 0.0
+        self._stacks: Dict[int, str] = {}
+        self._active: Set[int] = set()
+        self._guard: threading.Lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def add_listener(self, fn: Callable[[SlowCallbackReport], Any]):
+        """Registers a function which receives a :class:`SlowCallbackReport` every time the threshold is exceeded.
+        Useful for forwarding reports to a metrics backend.
+
+        :param fn: A reference to a synchronous function.
+        """
+        self._listeners.append(fn)
+
+    def start(self):
+        """Starts the heartbeat task and the monitor thread on the running event loop. Does nothing if the
+        watchdog is disabled or already running."""
+        if not self.enabled or (self._task and not self._task.done()):
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = self._loop.create_task(self._beat())
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._monitor, name='dpymenus-watchdog', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stops the heartbeat task; the monitor thread exits on its next check."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self, menu: 'BaseMenu', fn: Callable, *args) -> Any:
+        """Runs a sync or async callback, reporting it if it exceeds the threshold."""
+        start = self._enter(sys._getframe())
+        try:
+            result = fn(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        finally:
+            self._finish(menu, fn, start, sys._getframe())
+
+    def wrap_check(self, menu: 'BaseMenu', fn: Callable) -> Callable:
+        """Returns a predicate which behaves like `fn`, but is timed by the watchdog."""
+        return partial(self._check, menu, fn)
+
+    # Internal Methods
+    def _check(self, menu: 'BaseMenu', fn: Callable, *args) -> bool:
+        """Runs a synchronous predicate, reporting it if it exceeds the threshold."""
+        start = self._enter(sys._getframe())
+        try:
+            return fn(*args)
+        finally:
+            self._finish(menu, fn, start, sys._getframe())
+
+    def _enter(self, frame: FrameType) -> float:
+        """Marks the frame of a watched callback as active, so the monitor thread may attach a stack to it, and
+        returns the start time."""
+        with self._guard:
+            self._active.add(id(frame))
+
+        return time.monotonic()
+
+    def _finish(self, menu: 'BaseMenu', fn: Callable, start: float, frame: FrameType):
+        """Reports a finished callback if it ran over the threshold."""
+        with self._guard:
+            self._active.discard(id(frame))
+            stack = self._stacks.pop(id(frame), None)
+        duration = time.monotonic() - start
+
+        if stack is None and duration < self.threshold:
+            return
+
+        self._report(
+            SlowCallbackReport(
+                menu=repr(menu),
+                page=menu.page.index if menu.page else None,
+                callback=getattr(fn, '__qualname__', repr(fn)),
+                duration=duration,
+                blocking=stack is not None,
+                stack=stack,
+            )
+        )
+
+    def _report(self, report: SlowCallbackReport):
+        """Logs a report and forwards it to every registered listener."""
+        if report.blocking:
+            logging.warning(
+                f'{report.callback} blocked the event loop for {report.duration:.3f}s '
+                f'(menu: {report.menu}, page: {report.page}).\n{report.stack}'
+            )
+        else:
+            logging.info(
+                f'{report.callback} took {report.duration:.3f}s to complete (menu: {report.menu}, page: {report.page}).'
+            )
+
+        for listener in self._listeners:
+            try:
+                listener(report)
+            except Exception:
+                logging.exception('Watchdog listener raised an exception.')
+
+    async def _beat(self):
+        """Updates the heartbeat and measures how late the event loop wakes us up."""
+        interval = self.threshold / 4
+
+        while True:
+            before = time.monotonic()
+            await asyncio.sleep(interval)
+            self._heartbeat = time.monotonic()
+            self.lag = self._heartbeat - before - interval
+            self.max_lag = max(self.max_lag, self.lag)
+
+            if self.lag >= self.threshold:
+                logging.warning(f'dpymenus event loop lagged by {self.lag:.3f}s.')
+
+    def _monitor(self):
+        """Runs in a separate thread. Captures the event loop stack once per stall, attributing it to the watched
+        callback that is currently executing."""
+        interval = self.threshold / 4
+        captured = None
+
+        while self._task is not None:
+            time.sleep(interval)
+
+            if time.monotonic() - self._heartbeat < self.threshold:
+                captured = None
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            watched = self._find_watched_frame(frame)
+            if watched is not None and watched is not captured:
+                self._capture(watched, frame)
+                captured = watched
+
+            del frame, watched
+
+    def _capture(self, watched: FrameType, frame: FrameType):
+        """Stores the stack of a stalled event loop for a watched callback. The callback may finish while the stack
+        is formatted, so it is only stored if the callback is still active; the watched frame is kept alive by the
+        caller, so its ID can not have been reused."""
+        stack = ''.join(traceback.format_stack(frame))
+
+        with self._guard:
+            if id(watched) in self._active:
+                self._stacks[id(watched)] = stack
+
+    @staticmethod
+    def _find_watched_frame(frame: Optional[FrameType]) -> Optional[FrameType]:
+        """Walks up the stack until it finds the innermost frame created by `run` or `wrap_check`."""
+        while frame is not None:
+            if frame.f_code in _WATCHED_CODES:
+                return frame
+            frame = frame.f_back
+
+        return None
+
+
+_WATCHED_CODES = (Watchdog.run.__code__, Watchdog._check.__code__)
+
+watchdog = Watchdog(WATCHDOG_THRESHOLD)
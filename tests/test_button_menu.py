@@ -0,0 +1,111 @@
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+from discord import Forbidden
+
+from dpymenus import ButtonMenu, Page
+from dpymenus.button_menu import diff_reactions
+
+
+class FakeMessage:
+    """A DM message which counts the requests made to it."""
+
+    id = 6
+    channel = SimpleNamespace(id=5)
+
+    def __init__(self, calls, editable=True):
+        self.calls = calls
+        self.editable = editable
+
+    async def edit(self, **fields):
+        self.calls['edit'] += 1
+        if not self.editable:
+            raise Forbidden(SimpleNamespace(status=403, reason='Forbidden'), 'Cannot edit')
+
+    async def delete(self):
+        self.calls['delete'] += 1
+
+    async def add_reaction(self, emoji):
+        self.calls['add_reaction'] += 1
+
+    async def remove_reaction(self, emoji, member):
+        self.calls['remove_reaction'] += 1
+
+
+def test_diff_keeps_reactions_in_order():
+    assert diff_reactions(['a', 'b', 'c'], ['a', 'b', 'c']) == ([], [])
+    assert diff_reactions(['a', 'b', 'c'], ['a', 'c']) == (['b'], [])
+    assert diff_reactions(['a', 'b', 'c'], ['a', 'b', 'd']) == (['c'], ['d'])
+    assert diff_reactions(['a', 'b'], ['b', 'a']) == (['a'], ['a'])
+    assert diff_reactions([], ['a', 'b']) == ([], ['a', 'b'])
+
+
+def test_diff_compares_by_key():
+    assert diff_reactions(['<:left:1>'], ['left:1', 'x'], key=ButtonMenu._button_name) == ([], ['x'])
+
+
+def count_page_turn(editable):
+    """Turns a DM menu from a page with buttons a, b, c to one with a, b, d and counts the requests made."""
+
+    async def run():
+        calls = Counter()
+
+        async def send(**fields):
+            calls['send'] += 1
+            return FakeMessage(calls)
+
+        menu = ButtonMenu(SimpleNamespace(author=SimpleNamespace(id=1), me=SimpleNamespace(id=2), send=send))
+        menu.output = FakeMessage(calls, editable)
+        menu._shown = ['a', 'b', 'c']
+
+        menu.page = Page(title='Second').buttons(['a', 'b', 'd'])
+        await menu.send_message(menu.page)
+        if menu._adding:
+            await menu._adding
+        else:
+            await menu._add_buttons()
+
+        assert menu._shown == ['a', 'b', 'd']
+
+        return calls
+
+    return asyncio.run(run())
+
+
+def test_dm_page_turn_edits_in_place():
+    in_place = count_page_turn(editable=True)
+    resent = count_page_turn(editable=False)
+
+    assert in_place == {'edit': 1, 'remove_reaction': 1, 'add_reaction': 1}
+    assert resent == {'edit': 1, 'delete': 1, 'send': 1, 'add_reaction': 3}
+    assert sum(in_place.values()) < sum(resent.values())
+
+
+def test_cancelled_sync_keeps_shown_buttons_accurate():
+    class SlowMessage:
+        id = 7
+        channel = SimpleNamespace(id=8)
+
+        def __init__(self):
+            self.reactions = []
+
+        async def add_reaction(self, emoji):
+            await asyncio.sleep(0.05)
+            self.reactions.append(emoji)
+
+    async def run():
+        menu = ButtonMenu(SimpleNamespace(author=SimpleNamespace(id=1), me=SimpleNamespace(id=2)))
+        menu.output = SlowMessage()
+
+        sync = asyncio.create_task(menu._sync_buttons(['a', 'b', 'c']))
+        await asyncio.sleep(0.02)
+        sync.cancel()
+        await asyncio.sleep(0.1)
+
+        return menu.output.reactions, menu._shown
+
+    reactions, shown = asyncio.run(run())
+
+    assert reactions == ['a']
+    assert shown == ['a']
@@ -0,0 +1,78 @@
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+from discord import Forbidden, HTTPException, NotFound, TextChannel
+from discord.utils import time_snowflake
+
+from dpymenus.cleanup import DeleteQueue
+
+
+def http_error(cls, status):
+    return cls(SimpleNamespace(status=status, reason='error'), 'error')
+
+
+class FakeTextChannel(TextChannel):
+    id = 1
+
+    def __init__(self, bulk_error=None):
+        self.bulk_error = bulk_error
+        self.bulk_deletes = []
+        self.deleted = []
+
+    async def delete_messages(self, messages):
+        if self.bulk_error is not None:
+            raise self.bulk_error
+        self.bulk_deletes.append([message.id for message in messages])
+
+
+class FakeMessage:
+    def __init__(self, channel, offset, error=None):
+        self.channel = channel
+        self.id = time_snowflake(datetime.datetime.utcnow()) + offset
+        self.error = error
+
+    async def delete(self):
+        if self.error is not None:
+            raise self.error
+        self.channel.deleted.append(self.id)
+
+
+def test_full_batches_are_bulk_deleted():
+    channel = FakeTextChannel()
+
+    async def run():
+        queue = DeleteQueue(interval=60, size=3)
+        messages = [FakeMessage(channel, i) for i in range(3)]
+        for message in messages:
+            queue.add(message)
+
+        await asyncio.gather(*queue._flushes)
+
+        return [message.id for message in messages]
+
+    ids = asyncio.run(run())
+    assert channel.bulk_deletes == [ids]
+    assert channel.deleted == []
+
+
+def test_failed_bulk_deletes_fall_back_to_single_deletes():
+    channel = FakeTextChannel(bulk_error=http_error(HTTPException, 400))
+
+    async def run():
+        queue = DeleteQueue(interval=60, size=100)
+        messages = [
+            FakeMessage(channel, 0),
+            FakeMessage(channel, 1, error=http_error(Forbidden, 403)),
+            FakeMessage(channel, 2, error=http_error(NotFound, 404)),
+            FakeMessage(channel, 3),
+        ]
+        for message in messages:
+            queue.add(message)
+
+        await queue.flush_all()
+
+        return messages
+
+    messages = asyncio.run(run())
+    assert channel.deleted == [messages[0].id, messages[3].id]
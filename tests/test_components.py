@@ -0,0 +1,114 @@
+import asyncio
+from types import SimpleNamespace
+
+from dpymenus import PaginatedMenu
+from dpymenus.components import (
+    COMPONENTS,
+    ComponentPress,
+    ComponentRouter,
+    page_buckets,
+    parse_custom_id,
+    render_components,
+    render_page_select,
+)
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.requests = []
+
+    async def request(self, route, json=None):
+        self.requests.append((route.method, route.path, json))
+
+
+class FakeBot:
+    def __init__(self):
+        self.http = FakeHTTP()
+        self.listeners = []
+
+    def add_listener(self, fn, name):
+        self.listeners.append((fn, name))
+
+
+def interaction(custom_id, user_id=1):
+    return {
+        't': 'INTERACTION_CREATE',
+        'd': {'id': '10', 'token': 'abc', 'type': 3, 'data': {'custom_id': custom_id}, 'user': {'id': str(user_id)}},
+    }
+
+
+def test_buttons_are_rendered_in_rows_of_five():
+    rows = render_components(['a'] * 7 + ['<:left:12>', '<a:spin:34>'], 99)
+
+    assert [len(row['components']) for row in rows] == [5, 4]
+    assert rows[0]['components'][0]['custom_id'] == 'dpymenus:99:0'
+    assert rows[1]['components'][2]['emoji'] == {'name': 'left', 'id': 12, 'animated': False}
+    assert rows[1]['components'][3]['emoji'] == {'name': 'spin', 'id': 34, 'animated': True}
+
+
+def test_custom_ids_of_other_libraries_are_ignored():
+    assert parse_custom_id('dpymenus:99:3') == (99, 3)
+    assert parse_custom_id('other:99:3') is None
+    assert parse_custom_id('dpymenus:99') is None
+
+
+def test_presses_are_routed_by_custom_id_and_acknowledged():
+    async def run():
+        router, bot = ComponentRouter(), FakeBot()
+        queue = router.listen(bot, 99)
+        router.listen(bot, 100)
+
+        assert len(bot.listeners) == 1
+
+        await router._on_socket_response(interaction('dpymenus:99:2', user_id=7))
+        await router._on_socket_response(interaction('dpymenus:101:0'))
+        await router._on_socket_response({'t': 'MESSAGE_CREATE', 'd': {}})
+
+        press = queue.get_nowait()
+        assert (press.user_id, press.message_id, press.index) == (7, 99, 2)
+        assert queue.empty()
+        assert bot.http.requests == [
+            ('POST', '/interactions/{interaction_id}/{interaction_token}/callback', {'type': 6})
+        ]
+
+    asyncio.run(run())
+
+
+def test_menu_maps_presses_to_its_buttons():
+    async def run():
+        bot = FakeBot()
+        menu = PaginatedMenu(SimpleNamespace(author=SimpleNamespace(id=1), bot=bot)).set_input_backend(COMPONENTS)
+        menu.output = SimpleNamespace(id=42)
+        menu._shown = ['◀️', '⏹️', '▶️']
+
+        assert menu._press_listeners() == [menu._get_component_press]
+        assert not menu._removes_reactions()
+
+        press = asyncio.create_task(menu._get_component_press())
+        await asyncio.sleep(0)
+
+        listener = bot.listeners[0][0]
+        await listener(interaction('dpymenus:42:2', user_id=3))
+        await listener(interaction('dpymenus:42:2', user_id=1))
+
+        assert await press == '▶️'
+
+    asyncio.run(run())
+
+
+def test_page_buckets_cover_every_page():
+    buckets = page_buckets(1000)
+
+    assert len(buckets) == 25
+    assert buckets[799 // buckets.step] == 760
+    assert list(page_buckets(7)) == list(range(7))
+    assert page_buckets(0) == range(0)
+
+
+def test_page_select_labels_ranges():
+    options = render_page_select(1001, 99)['components'][0]['options']
+
+    assert len(options) == 25
+    assert options[0] == {'label': 'Pages 1-41', 'value': '0'}
+    assert options[-1] == {'label': 'Pages 985-1001', 'value': '984'}
+    assert render_page_select(2, 99)['components'][0]['options'][1] == {'label': 'Page 2', 'value': '1'}
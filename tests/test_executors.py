@@ -0,0 +1,33 @@
+import asyncio
+import threading
+
+import pytest
+
+from dpymenus import EventError, blocking, cpu_bound
+from dpymenus.executors import map_in_executor, run_in_executor, shutdown_executors
+
+
+@pytest.mark.parametrize('decorator', [blocking, cpu_bound])
+def test_coroutine_functions_can_not_be_marked(decorator):
+    async def callback():
+        pass
+
+    with pytest.raises(EventError):
+        decorator(callback)
+
+
+def test_blocking_functions_run_in_the_thread_pool():
+    @blocking
+    def thread_name(suffix):
+        return threading.current_thread().name + suffix
+
+    async def run():
+        try:
+            return await run_in_executor(thread_name, '!'), await map_in_executor(thread_name, 'ab')
+        finally:
+            shutdown_executors()
+
+    single, mapped = asyncio.run(run())
+
+    assert single.startswith('dpymenus') and single.endswith('!')
+    assert [name[-1] for name in mapped] == ['a', 'b']
@@ -0,0 +1,64 @@
+from dpymenus import TextMenu
+from dpymenus.history import History
+
+
+def test_history_is_bounded():
+    history = History(limit=3)
+    for i in range(5):
+        history.append(i)
+
+    assert list(history) == [2, 3, 4]
+    assert history[-1] == 4
+    assert history[-2] == 3
+    assert len(history) == 3
+
+
+def test_back_and_forward():
+    history = History(limit=5)
+    for i in range(3):
+        history.append(i)
+
+    assert history.back() == 1
+    assert history.back() == 0
+    assert history.back() is None
+    assert history.forward() == 1
+    assert list(history) == [0, 1]
+
+    history.append(7)
+    assert history.forward() is None
+    assert list(history) == [0, 1, 7]
+
+
+def test_unlimited_history():
+    history = History(limit=0)
+    for i in range(100):
+        history.append(i)
+
+    assert len(history) == 100
+    assert history.back() == 98
+    history.append(5)
+    assert list(history)[-2:] == [98, 5]
+
+
+def test_set_limit_keeps_newest():
+    history = History(limit=10)
+    for i in range(6):
+        history.append(i)
+
+    history.set_limit(3)
+    assert list(history) == [3, 4, 5]
+
+    history.append(6)
+    assert list(history) == [4, 5, 6]
+
+
+def test_last_visited_page_after_going_back():
+    menu = TextMenu(None)
+    assert menu.last_visited_page() is None
+
+    menu.history.append(0)
+    menu.history.append(1)
+    assert menu.last_visited_page() == 0
+
+    menu.history.back()
+    assert menu.last_visited_page() is None
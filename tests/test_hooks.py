@@ -0,0 +1,80 @@
+import asyncio
+
+from dpymenus import TextMenu
+from dpymenus import hooks
+from dpymenus.hooks import AFTER, BEFORE, OPEN, UPDATE, HookRegistry, call_hook
+
+
+def test_registry_adds_and_removes_callbacks():
+    def first():
+        pass
+
+    def second():
+        pass
+
+    registry = HookRegistry()
+    registry.add(BEFORE, OPEN, first)
+    registry.add(BEFORE, OPEN, second, timeout=2)
+    registry.add(BEFORE, OPEN, first)
+
+    assert registry.get(BEFORE, OPEN) == [(first, None), (second, 2), (first, None)]
+    assert registry.get(AFTER, OPEN) == []
+
+    registry.remove(BEFORE, OPEN, first)
+    assert registry.get(BEFORE, OPEN) == [(second, 2)]
+
+
+def test_global_hooks_run_before_menu_hooks():
+    calls = []
+
+    async def run():
+        menu = TextMenu(None).add_hook(BEFORE, UPDATE, lambda: calls.append('menu'))
+        hooks.add_global_hook(BEFORE, UPDATE, lambda: calls.append('global'))
+        try:
+            await call_hook(menu, BEFORE, UPDATE)
+            await call_hook(TextMenu(None), BEFORE, UPDATE)
+        finally:
+            hooks.global_hooks._hooks.clear()
+
+    asyncio.run(run())
+    assert calls == ['global', 'menu', 'global']
+
+
+def test_after_hooks_run_in_the_background():
+    calls = []
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        calls.append('slow')
+
+    async def failing():
+        raise ValueError('broken hook')
+
+    async def run():
+        menu = TextMenu(None).add_hook(AFTER, UPDATE, slow).add_hook(AFTER, UPDATE, failing)
+        menu.add_hook(AFTER, UPDATE, lambda: calls.append('fast'))
+
+        await call_hook(menu, AFTER, UPDATE)
+        assert calls == []
+
+        await asyncio.gather(*hooks._background_hooks)
+
+    asyncio.run(run())
+    assert calls == ['fast', 'slow']
+
+
+def test_after_hooks_are_bounded_by_their_timeout():
+    calls = []
+
+    async def stuck():
+        await asyncio.sleep(10)
+        calls.append('stuck')
+
+    async def run():
+        menu = TextMenu(None).add_hook(AFTER, UPDATE, stuck, timeout=0.01)
+
+        await call_hook(menu, AFTER, UPDATE)
+        await asyncio.wait_for(asyncio.gather(*hooks._background_hooks), 1)
+
+    asyncio.run(run())
+    assert calls == []
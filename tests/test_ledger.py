@@ -0,0 +1,55 @@
+import asyncio
+
+from dpymenus.ledger import VoteLedger
+from dpymenus.tally import VoteTally
+
+
+def record(tally, ledger, added, voter, choice):
+    tally.add(voter, choice) if added else tally.remove(voter, choice)
+    ledger.record(added, voter, choice)
+
+
+def test_ledger_restores_snapshot_and_tail(tmp_path):
+    async def run():
+        tally = VoteTally(['a', 'b'])
+        ledger = VoteLedger(tmp_path / 'poll', flush_interval=60, snapshot_events=5)
+        await ledger.start(tally, ends_at=123.0, channel_id=1, message_id=2)
+
+        for voter in range(8):
+            record(tally, ledger, True, voter, 'a' if voter % 2 else 'b')
+        await ledger.flush()
+
+        record(tally, ledger, False, 1, 'a')
+        record(tally, ledger, True, 2, 'a')
+        await ledger.flush()
+
+        # the bot dies while writing the next batch
+        with open(ledger.log_path, 'a') as file:
+            file.write('[99, 1, 5')
+
+        return tally, await VoteLedger(tmp_path / 'poll').load()
+
+    tally, state = asyncio.run(run())
+
+    assert state.ends_at == 123.0
+    assert (state.channel_id, state.message_id) == (1, 2)
+
+    restored = VoteTally(state.choices)
+    for choice, voters in state.votes.items():
+        for voter in voters:
+            restored.add(voter, choice)
+
+    assert restored.results() == tally.results()
+    assert restored.duplicates == {2}
+
+
+def test_closed_ledger_is_deleted(tmp_path):
+    async def run():
+        ledger = VoteLedger(tmp_path / 'poll')
+        await ledger.start(VoteTally(['a', 'b']), ends_at=0.0, channel_id=1, message_id=2)
+        ledger.record(True, 1, 'a')
+        await ledger.close(delete=True)
+
+        return await VoteLedger(tmp_path / 'poll').load()
+
+    assert asyncio.run(run()) is None
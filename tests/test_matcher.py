@@ -0,0 +1,26 @@
+from dpymenus.constants import CONFIRM, QUIT
+from dpymenus.matcher import ResponseMatcher
+
+
+def test_constants_are_compiled():
+    assert isinstance(QUIT, ResponseMatcher)
+    assert QUIT.matches('quit')
+    assert 'yes' in CONFIRM
+    assert not CONFIRM.matches('nope')
+
+
+def test_prefix_matching():
+    matcher = ResponseMatcher(prefixes=['buy', 'buy all', 'sell'])
+    assert matcher.match_prefix('buy all potions') == 'buy all'
+    assert matcher.match_prefix('buy potion') == 'buy'
+    assert matcher.match_prefix('sell') == 'sell'
+    assert matcher.match_prefix('bu') is None
+    assert matcher.matches('sell sword')
+
+
+def test_pattern_matching():
+    matcher = ResponseMatcher(choices=['none'], patterns=[r'\d+', r'page \d+'])
+    assert matcher.matches('42')
+    assert matcher.matches('page 7')
+    assert matcher.matches('none')
+    assert not matcher.matches('42a')
@@ -0,0 +1,37 @@
+import tracemalloc
+
+import pytest
+
+from dpymenus import ButtonMenu, PaginatedMenu, Poll, TextMenu
+
+# bytes per menu instance with default options, including its own containers
+MEMORY_BUDGET = 320
+
+
+@pytest.mark.parametrize('menu_type', [TextMenu, ButtonMenu, PaginatedMenu, Poll])
+def test_menus_are_slotted(menu_type):
+    assert not hasattr(menu_type(None), '__dict__')
+
+
+@pytest.mark.parametrize('menu_type', [TextMenu, ButtonMenu, PaginatedMenu])
+def test_menu_memory_footprint(menu_type):
+    count = 5000
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    menus = [menu_type(None) for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(menus) == count
+    assert (after - before) / count < MEMORY_BUDGET
+
+
+def test_options_are_shared_until_set():
+    first, second = TextMenu(None), TextMenu(None)
+    assert first._options is second._options
+
+    first.set_timeout(5)
+    assert first.timeout == 5
+    assert second.timeout != 5
+    assert first._options is not second._options
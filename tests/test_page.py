@@ -0,0 +1,32 @@
+from discord import Embed
+
+from dpymenus import Page
+
+DATA = {
+    'title': 'Title',
+    'description': 'Description',
+    'color': 0x3366FF,
+    'footer': {'text': 'Footer'},
+    'fields': [{'name': 'A', 'value': '1', 'inline': False}],
+}
+
+
+def test_from_embed_adopts_state():
+    embed = Embed.from_dict(DATA)
+    page = Page.from_embed(embed)
+
+    assert isinstance(page, Page)
+    assert page.to_dict() == Page.from_dict(embed.to_dict()).to_dict()
+    assert page._fields is embed._fields
+
+
+def test_convert_from_embed():
+    assert Page.convert_from(Embed.from_dict(DATA)).to_dict() == Page.from_dict(DATA).to_dict()
+
+
+def test_from_dicts():
+    pages = Page.from_dicts([DATA] * 3)
+    trusted = Page.from_dicts([DATA] * 3, trusted=True)
+
+    assert all(isinstance(page, Page) for page in pages + trusted)
+    assert [page.to_dict() for page in pages] == [page.to_dict() for page in trusted]
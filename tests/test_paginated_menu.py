@@ -0,0 +1,107 @@
+import asyncio
+from types import SimpleNamespace
+
+from discord.abc import GuildChannel
+
+from dpymenus import Page, PaginatedMenu
+from dpymenus.components import ComponentPress
+from dpymenus.constants import GENERIC_BUTTONS
+
+
+def event(name, user_id=1, message_id=2):
+    return SimpleNamespace(user_id=user_id, message_id=message_id, emoji=SimpleNamespace(name=name))
+
+
+def make_menu():
+    menu = PaginatedMenu(SimpleNamespace(author=SimpleNamespace(id=1)))
+    menu.output = SimpleNamespace(id=2)
+
+    return menu
+
+
+def test_shown_buttons_follow_settings_without_mutating_defaults():
+    defaults = list(GENERIC_BUTTONS)
+    menu = make_menu().buttons(GENERIC_BUTTONS).hide_cancel_button()
+
+    shown = [button for button, _ in menu._shown_buttons()]
+    assert shown == [GENERIC_BUTTONS[1], GENERIC_BUTTONS[3]]
+    assert GENERIC_BUTTONS == defaults
+
+    menu.show_skip_buttons()
+    assert [button for button, _ in menu._shown_buttons()] == [defaults[0], defaults[1], defaults[3], defaults[4]]
+
+
+def test_three_custom_buttons_are_filled_in():
+    custom = ['a', 'b', 'c']
+    menu = make_menu().buttons(custom)
+
+    assert custom == ['a', 'b', 'c']
+    assert [button for button, _ in menu._shown_buttons()] == custom
+
+
+def test_check_accepts_shown_buttons_before_they_are_added():
+    menu = make_menu().buttons(['<:left:1>', 'x', '<:right:2>'])
+    check = menu._get_check()
+
+    assert check(event('left'))
+    assert check(event('x'))
+    assert not check(event('y'))
+    assert not check(event('left', user_id=3))
+    assert not check(event('left', message_id=4))
+
+
+class FakeGuildChannel(GuildChannel):
+    id = 3
+
+
+def test_toggle_mode_listens_for_removes_instead_of_removing_reactions():
+    menu = make_menu()
+    menu.output = SimpleNamespace(id=2, channel=FakeGuildChannel())
+
+    assert menu._press_listeners() == [menu._get_reaction_add]
+    assert menu._removes_reactions()
+
+    menu.use_toggle_buttons()
+
+    assert menu._press_listeners() == [menu._get_reaction_add, menu._get_reaction_remove]
+    assert not menu._removes_reactions()
+
+
+def test_page_numbers_are_checked_against_the_page_count():
+    menu = make_menu().add_pages([Page(title=str(i)) for i in range(1000)])
+    menu.output = SimpleNamespace(id=2, channel=4)
+
+    def message(content, author=menu.ctx.author, channel=4):
+        return SimpleNamespace(content=content, author=author, channel=channel)
+
+    assert menu._check_page_number(message('800'))
+    assert menu._check_page_number(message(' 1000 '))
+    assert not menu._check_page_number(message('0'))
+    assert not menu._check_page_number(message('1001'))
+    assert not menu._check_page_number(message('page 8'))
+    assert not menu._check_page_number(message('8', author=SimpleNamespace(id=5)))
+    assert not menu._check_page_number(message('8', channel=5))
+
+
+def test_jump_goes_to_the_page_with_one_edit():
+    class FakeMessage:
+        channel = SimpleNamespace(id=4)
+        edits = 0
+
+        async def edit(self, **fields):
+            self.edits += 1
+
+    async def run():
+        menu = make_menu().add_pages([Page(title=str(i)) for i in range(1000)]).show_jump_control()
+        menu.output = FakeMessage()
+        menu.page = menu.pages[0]
+
+        menu.input = menu._press_input(ComponentPress(1, 2, 25, ('760',)))
+        await menu._handle_transition()
+
+        assert menu.page.index == 760
+        assert menu.output.edits == 1
+        assert menu._press_input(ComponentPress(3, 2, 25, ('760',))) is None
+        assert menu._press_input(ComponentPress(1, 2, 25, ('1000',))) is None
+
+    asyncio.run(run())
@@ -0,0 +1,229 @@
+import asyncio
+from types import SimpleNamespace
+
+from dpymenus import Page, Poll, ShardedPoll
+from dpymenus.components import COMPONENTS, REACTIONS
+from dpymenus.tally import VoteTally
+
+
+class FakeMessage:
+    channel = SimpleNamespace(id=1)
+
+    def __init__(self):
+        self.edits = 0
+
+    async def edit(self, **kwargs):
+        self.edits += 1
+        await asyncio.sleep(0.01)
+
+
+def test_live_results_are_coalesced():
+    async def run():
+        poll = Poll(None).show_live_results(0.05)
+        poll.page = Page(title='Poll')
+        poll.output = FakeMessage()
+        poll.tally = VoteTally(['a', 'b'])
+
+        updater = asyncio.create_task(poll._update_live_results())
+        for voter in range(10_000):
+            poll.tally.add(voter, 'a')
+            if voter % 500 == 0:
+                await asyncio.sleep(0.01)
+
+        await asyncio.sleep(0.2)
+        edits = poll.output.edits
+        await asyncio.sleep(0.2)
+        updater.cancel()
+
+        return edits, poll.output.edits
+
+    edits, edits_when_idle = asyncio.run(run())
+    assert 1 <= edits <= 10
+    assert edits_when_idle == edits
+
+
+class FakeUser:
+    def __init__(self, id, bot=False):
+        self.id = id
+        self.bot = bot
+
+
+class FakeReaction:
+    def __init__(self, emoji, user_ids):
+        self.emoji = emoji
+        self.user_ids = user_ids
+
+    async def users(self, limit=None):
+        yield FakeUser(0, bot=True)
+        for user_id in self.user_ids:
+            await asyncio.sleep(0)
+            yield FakeUser(user_id)
+
+
+class FakeChannel:
+    def __init__(self, message):
+        self.message = message
+
+    async def fetch_message(self, id):
+        return self.message
+
+
+class FakeReactionMessage:
+    id = 1
+
+    def __init__(self, reactions):
+        self.reactions = reactions
+        self.channel = FakeChannel(self)
+
+
+def test_reconcile_applies_the_difference():
+    async def run():
+        poll = Poll(None)
+        poll.page = Page(title='Poll').buttons(['a', 'b'])
+        poll.output = FakeReactionMessage([FakeReaction('a', [1, 2, 3]), FakeReaction('b', [3, 4])])
+        poll.tally = VoteTally(['a', 'b'])
+        poll.tally.add(1, 'a')
+        poll.tally.add(9, 'b')
+
+        await poll._reconcile()
+
+        return poll.tally
+
+    tally = asyncio.run(run())
+
+    assert tally.results() == {'a': 2, 'b': 1}
+    assert tally.duplicates == {3}
+    assert tally.choices_of(9) == set()
+
+
+class FakeLedger:
+    def __init__(self):
+        self.events = []
+
+    def record(self, added, voter, choice):
+        self.events.append((added, voter, choice))
+
+
+class SlowReaction(FakeReaction):
+    def __init__(self, emoji, user_ids, fetches):
+        super().__init__(emoji, user_ids)
+        self.fetches = fetches
+
+    async def users(self, limit=None):
+        self.fetches.append(self.emoji)
+        await asyncio.sleep(0.02)
+        async for user in super().users(limit):
+            yield user
+
+
+def test_votes_during_a_reconcile_are_written_to_the_ledger_once():
+    async def run():
+        poll = Poll(None)
+        poll.page = Page(title='Poll').buttons(['a', 'b'])
+        poll.output = FakeReactionMessage([SlowReaction('a', [1], []), SlowReaction('b', [2], [])])
+        poll.tally = VoteTally(['a', 'b'])
+        poll.ledger = FakeLedger()
+
+        reconcile = asyncio.create_task(poll._reconcile())
+        await asyncio.sleep(0.01)
+        poll._record_vote(True, 2, 'b')
+        await reconcile
+
+        return poll
+
+    poll = asyncio.run(run())
+
+    assert poll.ledger.events == [(True, 1, 'a'), (True, 2, 'b')]
+    assert poll.tally.results() == {'a': 1, 'b': 1}
+
+
+def test_only_one_reconcile_runs_at_a_time():
+    fetches = []
+
+    async def run():
+        poll = Poll(None)
+        poll.page = Page(title='Poll').buttons(['a'])
+        poll.output = FakeReactionMessage([SlowReaction('a', [1], fetches)])
+        poll.tally = VoteTally(['a'])
+
+        first = asyncio.create_task(poll._reconcile())
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(poll._reconcile())
+        await asyncio.sleep(0.005)
+        during = list(fetches)
+        await asyncio.gather(first, second)
+
+        return during
+
+    assert asyncio.run(run()) == ['a']
+    assert fetches == ['a', 'a']
+
+
+class FakeBot:
+    def __init__(self):
+        self.waiters = {}
+
+    async def wait_for(self, event):
+        self.waiters[event] = asyncio.get_running_loop().create_future()
+        return await self.waiters[event]
+
+    def dispatch(self, event):
+        self.waiters.pop(event).set_result(None)
+
+
+class CountingPoll(Poll):
+    def __init__(self, ctx):
+        super().__init__(ctx)
+        self.reconciles = 0
+
+    async def _reconcile(self):
+        self.reconciles += 1
+
+
+def test_votes_are_reconciled_after_a_reconnect():
+    async def run():
+        poll = CountingPoll(SimpleNamespace(bot=FakeBot()))
+        watcher = asyncio.create_task(poll._reconcile_on_resume())
+        await asyncio.sleep(0.01)
+        poll.ctx.bot.dispatch('ready')
+        await asyncio.sleep(0.01)
+        poll.ctx.bot.dispatch('resumed')
+        await asyncio.sleep(0.01)
+        watcher.cancel()
+
+        return poll.reconciles
+
+    assert asyncio.run(run()) == 2
+
+
+def test_sharded_poll_splits_and_merges():
+    buttons = [chr(0x1F600 + i) for i in range(45)]
+    poll = ShardedPoll(None)
+    poll.page = Page(title='Election').buttons(buttons)
+    poll.pages = [poll.page, Page(title='Results')]
+    poll.page.index, poll.pages[1].index = 0, 1
+    poll.tally = VoteTally(buttons)
+
+    chunks = poll._chunks()
+    assert [len(chunk) for chunk in chunks] == [20, 20, 5]
+
+    poll.tally.add(1, buttons[0])
+    poll.tally.add(2, buttons[44])
+    poll.tally.add(2, buttons[3])
+    assert poll.tally.duplicates == {2}
+
+    asyncio.run(poll.add_results_fields())
+    fields = poll.pages[1].fields
+    assert fields[0].value.startswith(f'{buttons[0]} 1\n')
+    assert sum(field.value.count('\n') for field in fields) == 45
+
+
+def test_sharded_poll_ignores_ledger(tmp_path):
+    assert Poll(None).set_ledger(tmp_path / 'poll').ledger is not None
+    assert ShardedPoll(None).set_ledger(tmp_path / 'sharded').ledger is None
+
+
+def test_sharded_poll_ignores_components_backend():
+    poll = ShardedPoll(None).set_input_backend(COMPONENTS)
+
+    assert poll.input_backend is REACTIONS
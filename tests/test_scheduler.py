@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from dpymenus.scheduler import Priority, RateLimitScheduler
+
+
+class FakeChannel:
+    id = 1
+
+
+class FakeMessage:
+    channel = FakeChannel()
+
+    def __init__(self, latencies=None):
+        self.reactions = []
+        self.latencies = latencies or {}
+
+    async def add_reaction(self, emoji):
+        await asyncio.sleep(self.latencies.get(emoji, 0.001))
+        self.reactions.append(emoji)
+
+
+def test_reactions_are_added_in_order_and_quickly():
+    async def run():
+        scheduler = RateLimitScheduler(rate=4.0)
+        first, second = FakeMessage(), FakeMessage()
+
+        start = time.monotonic()
+        await asyncio.gather(
+            scheduler.add_reactions(first, ['1', '2', None, '3', '4', '5']),
+            scheduler.add_reactions(second, ['a', 'b']),
+        )
+
+        return time.monotonic() - start, first.reactions, second.reactions
+
+    elapsed, first, second = asyncio.run(run())
+
+    assert first == ['1', '2', '3', '4', '5']
+    assert second == ['a', 'b']
+    assert elapsed < 1.75
+
+
+def test_slow_requests_halve_the_rate():
+    async def run():
+        scheduler = RateLimitScheduler(rate=4.0)
+        message = FakeMessage({'3': 0.6})
+
+        await scheduler.add_reactions(message, ['1', '2', '3'])
+
+        return scheduler.bucket_rate((1, 'reactions'))
+
+    # two fast requests raise the rate to 6, the slow one halves it
+    assert asyncio.run(run()) == 3.0
+
+
+def test_menus_take_turns_and_interactive_requests_go_first():
+    async def run():
+        scheduler = RateLimitScheduler(rate=1000.0)
+        calls = []
+
+        async def request(name):
+            calls.append(name)
+
+        key = (1, 'edit')
+        futures = [scheduler.submit(key, request, 'first', owner='busy')]
+        futures += [scheduler.submit(key, request, f'busy{i}', owner='busy') for i in range(3)]
+        futures += [scheduler.submit(key, request, 'cleanup', owner='quiet', priority=Priority.CLEANUP)]
+        futures += [scheduler.submit(key, request, 'quiet', owner='quiet')]
+
+        depths = scheduler.queue_depths()
+        await asyncio.gather(*futures)
+
+        return calls, depths, scheduler.queue_depths()
+
+    calls, depths, depths_after = asyncio.run(run())
+
+    assert calls == ['first', 'quiet', 'busy0', 'busy1', 'busy2', 'cleanup']
+    assert depths == {1: 6}
+    assert depths_after == {}
+
+
+def test_idle_throttled_buckets_are_evicted_once_recovered():
+    async def run():
+        scheduler = RateLimitScheduler(rate=4.0)
+        message = FakeMessage({'slow': 0.6})
+
+        await scheduler.add_reactions(message, ['1', '2', 'slow'])
+        throttled = (1, 'reactions') in scheduler._buckets
+
+        # the bucket ran at 3 requests/s, so it is back at 4 after one idle second
+        bucket = scheduler._buckets[(1, 'reactions')]
+        scheduler._evict_idle(bucket.last_issue + 0.5)
+        kept = (1, 'reactions') in scheduler._buckets
+
+        scheduler._evict_idle(bucket.last_issue + 1.0)
+
+        return throttled, kept, (1, 'reactions') in scheduler._buckets
+
+    assert asyncio.run(run()) == (True, True, False)
@@ -0,0 +1,81 @@
+import asyncio
+from types import SimpleNamespace
+
+from dpymenus import Session, TextMenu, close_all, sessions
+
+
+class CleanupMenu(TextMenu):
+    def __init__(self, ctx, steps=()):
+        super().__init__(ctx)
+        self.steps = steps
+
+    def _cleanup_tasks(self):
+        return [step() for step in self.steps]
+
+
+def make_menu(author_id, guild=None, steps=()):
+    return CleanupMenu(SimpleNamespace(author=SimpleNamespace(id=author_id), guild=guild), steps)
+
+
+def test_close_all_closes_every_menu_in_a_guild():
+    async def run():
+        menus = [make_menu(user_id, guild='guild' if user_id < 8 else 'other') for user_id in range(10)]
+        for menu in menus:
+            await Session.create(menu)
+
+        closed = await close_all(guild='guild', concurrency=3)
+
+        return closed, menus
+
+    try:
+        closed, menus = asyncio.run(run())
+    finally:
+        sessions.clear()
+
+    assert closed == 8
+    assert [menu.active for menu in menus] == [False] * 8 + [True] * 2
+
+
+def test_failed_cleanup_steps_do_not_stop_the_others():
+    done = []
+
+    async def fail():
+        raise RuntimeError('cleanup failed')
+
+    async def finish():
+        await asyncio.sleep(0.01)
+        done.append(True)
+
+    async def run():
+        menus = [make_menu(user_id, steps=(fail, finish)) for user_id in range(3)]
+        for menu in menus:
+            await Session.create(menu)
+
+        return await close_all()
+
+    try:
+        closed = asyncio.run(run())
+    finally:
+        sessions.clear()
+
+    assert closed == 3
+    assert done == [True] * 3
+
+
+def test_close_all_abandons_menus_past_the_deadline():
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def run():
+        menus = [make_menu(0, steps=(hang,)), make_menu(1)]
+        for menu in menus:
+            await Session.create(menu)
+
+        return await asyncio.wait_for(close_all(timeout=0.05), 1)
+
+    try:
+        closed = asyncio.run(run())
+    finally:
+        sessions.clear()
+
+    assert closed == 1
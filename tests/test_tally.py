@@ -0,0 +1,50 @@
+from dpymenus.tally import VoteTally
+
+
+def test_single_choice_voids_duplicate_votes():
+    tally = VoteTally(['a', 'b', 'c'])
+    tally.add(1, 'a')
+    tally.add(2, 'a')
+    tally.add(2, 'b')
+
+    assert tally.results() == {'a': 1, 'b': 0, 'c': 0}
+    assert tally.duplicates == {2}
+    assert len(tally) == 1
+
+    tally.remove(2, 'a')
+    assert tally.results() == {'a': 1, 'b': 1, 'c': 0}
+    assert tally.duplicates == set()
+
+
+def test_remove_and_unknown_choices():
+    tally = VoteTally(['a', 'b'])
+    assert tally.add(1, 'x') is False
+    assert tally.remove(1, 'a') is False
+
+    tally.add(1, 'a')
+    assert tally.add(1, 'a') is False
+    assert tally.remove(1, 'a') is True
+    assert tally.results() == {'a': 0, 'b': 0}
+    assert len(tally) == 0
+
+
+def test_multiple_votes():
+    tally = VoteTally(['a', 'b'], multiple=True)
+    tally.add(1, 'a')
+    tally.add(1, 'b')
+    tally.add(2, 'b')
+
+    assert tally.results() == {'a': 1, 'b': 2}
+    assert tally.voters() == {'a': {1}, 'b': {1, 2}}
+
+
+def test_voters_leave_out_duplicates():
+    tally = VoteTally(['a', 'b', 'c'])
+    tally.add(1, 'a')
+    tally.add(2, 'a')
+    tally.add(2, 'b')
+    tally.add(2, 'c')
+    tally.remove(2, 'c')
+
+    assert tally.results() == {'a': 1, 'b': 0, 'c': 0}
+    assert tally.voters() == {'a': {1}, 'b': set(), 'c': set()}
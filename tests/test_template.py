@@ -0,0 +1,56 @@
+from dpymenus import FieldSort, FieldStyle, Page, Template, TextMenu
+
+TEMPLATE_FIELDS = [{'name': 'A', 'value': '1'}, {'name': 'B', 'value': '2'}]
+
+
+def make_pages(style: FieldStyle, sort: FieldSort):
+    template = Template(footer={'text': 'Footer'}, fields=TEMPLATE_FIELDS, field_style=style, field_sort=sort)
+
+    plain = Page(title='Plain')
+    own = Page(title='Own').add_field(name='C', value='3')
+    own.set_footer(text='Own footer')
+
+    return TextMenu(None).add_pages([plain, own], template=template).pages
+
+
+def field_names(page: Page):
+    return [field['name'] for field in page.to_dict().get('fields', [])]
+
+
+def test_template_data_is_shared():
+    menu = TextMenu(None).add_pages([Page(title=str(i)) for i in range(500)], template=Template(footer={'text': 'F'}))
+    pages = menu.pages
+    assert all(page._template is pages[0]._template for page in pages)
+    assert not hasattr(pages[0], '_footer')
+    assert pages[0].to_dict()['footer'] == {'text': 'F', 'icon_url': ''}
+    assert pages[0].footer.text == 'F'
+
+
+def test_compiled_template_is_reusable():
+    compiled = Template(title='Default', fields=TEMPLATE_FIELDS).compile()
+    pages = compiled.apply([Page(), Page(title='Own')])
+    assert [page.title for page in pages] == ['Default', 'Own']
+    assert all(page._template is compiled for page in pages)
+
+    menu = TextMenu(None).add_pages([Page()], template=compiled)
+    assert menu.pages[0]._template is compiled
+
+
+def test_own_attributes_override_template():
+    _, own = make_pages(FieldStyle.IGNORE, FieldSort.LAST)
+    assert own.to_dict()['footer'] == {'text': 'Own footer'}
+    assert field_names(own) == ['C']
+
+
+def test_field_styles():
+    plain, own = make_pages(FieldStyle.COMBINE, FieldSort.LAST)
+    assert field_names(plain) == ['A', 'B']
+    assert field_names(own) == ['C', 'A', 'B']
+
+    plain, own = make_pages(FieldStyle.COMBINE, FieldSort.FIRST)
+    assert field_names(plain) == ['A', 'B']
+    assert field_names(own) == ['A', 'B', 'C']
+
+    _, own = make_pages(FieldStyle.OVERRIDE, FieldSort.LAST)
+    assert field_names(own) == ['A', 'B']
+    assert [field.name for field in own.fields] == ['A', 'B']
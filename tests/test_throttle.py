@@ -0,0 +1,129 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from discord.abc import GuildChannel
+
+from dpymenus import ButtonsError, PaginatedMenu
+from dpymenus.throttle import COLLAPSE, DROP, InputThrottle
+
+
+class QueuedMenu(PaginatedMenu):
+    """A menu whose button presses come from a queue instead of the gateway."""
+
+    __slots__ = ('presses',)
+
+    def _press_listeners(self):
+        return [self.presses.get]
+
+
+def make_menu(user_id):
+    menu = QueuedMenu(SimpleNamespace(author=SimpleNamespace(id=user_id)))
+    menu.active = True
+    menu.presses = asyncio.Queue()
+
+    return menu
+
+
+def test_bursts_are_accepted_then_limited():
+    throttle = InputThrottle(rate=1, burst=2)
+
+    assert throttle.acquire(100) == 0
+    assert throttle.acquire(100) == 0
+    assert 0 < throttle.acquire(100) <= 1
+
+
+def test_user_bucket_is_shared_between_menus():
+    first, second = InputThrottle(rate=1, burst=2), InputThrottle(rate=1, burst=2)
+
+    assert first.acquire(101) == 0
+    assert first.acquire(101) == 0
+    assert second.acquire(101) > 0
+    assert second.acquire(102) == 0
+
+
+def test_drop_mode_suppresses_excess_presses():
+    async def run():
+        menu = make_menu(103)
+        menu.set_input_throttle(rate=1, burst=1, mode=DROP)
+
+        results = [await menu._throttle_input('a') for _ in range(3)]
+
+        assert results == ['a', None, None]
+        assert menu.input_throttle.suppressed == 2
+
+    asyncio.run(run())
+
+
+def test_collapse_mode_acts_on_the_latest_press():
+    async def run():
+        menu = make_menu(104)
+        menu.set_input_throttle(rate=20, burst=1, mode=COLLAPSE)
+
+        assert await menu._throttle_input('a') == 'a'
+
+        menu.presses.put_nowait('b')
+        menu.presses.put_nowait('c')
+        assert await menu._throttle_input('a') == 'c'
+        assert menu.input_throttle.suppressed == 2
+
+    asyncio.run(run())
+
+
+def test_user_buckets_are_kept_per_limit():
+    strict, loose = InputThrottle(rate=1, burst=1), InputThrottle(rate=10, burst=5)
+
+    assert strict.acquire(105) == 0
+    assert strict.acquire(105) > 0
+    assert loose.acquire(105) == 0
+    assert loose._user_bucket(105).capacity == 5
+
+
+class FakeGuildChannel(GuildChannel):
+    id = 7
+
+
+class FakeMessage:
+    id = 8
+    channel = FakeGuildChannel()
+
+    def __init__(self):
+        self.removed = []
+
+    async def remove_reaction(self, emoji, member):
+        self.removed.append(emoji)
+
+
+def test_suppressed_presses_have_their_reactions_removed():
+    async def run():
+        menu = make_menu(106)
+        menu.output = FakeMessage()
+        menu.set_input_throttle(rate=1, burst=1, mode=DROP)
+
+        assert await menu._throttle_input('a') == 'a'
+        assert await menu._throttle_input('b') is None
+        assert menu.output.removed == ['b']
+
+        menu.set_input_throttle(rate=20, burst=1, mode=COLLAPSE)
+        assert await menu._throttle_input('a') == 'a'
+
+        menu.presses.put_nowait('c')
+        assert await menu._throttle_input('b') == 'c'
+        assert menu.output.removed == ['b', 'b']
+
+    asyncio.run(run())
+
+
+def test_default_throttle_has_a_positive_rate():
+    async def run():
+        menu = make_menu(106).set_input_throttle()
+
+        assert menu.input_throttle.rate > 0
+        assert await menu._throttle_input('a') == 'a'
+
+    asyncio.run(run())
+
+
+def test_throttles_without_a_rate_are_rejected():
+    with pytest.raises(ButtonsError):
+        InputThrottle(rate=0)
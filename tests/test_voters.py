@@ -0,0 +1,68 @@
+import random
+import tracemalloc
+
+from dpymenus.tally import CompactVoteTally
+from dpymenus.voters import VoterSet
+
+
+def test_voter_set_behaves_like_a_set():
+    ids = random.Random(0).sample(range(10**17, 10**18), 5000)
+    voters, expected = VoterSet(), set()
+
+    for voter in ids:
+        assert voters.add(voter) is (voter not in expected)
+        expected.add(voter)
+    for voter in ids[::3]:
+        assert voters.discard(voter) is True
+        expected.discard(voter)
+
+    assert voters.add(ids[0]) is True
+    expected.add(ids[0])
+    assert voters.discard(-1) is False
+
+    assert len(voters) == len(expected)
+    assert voters == expected
+    assert list(voters) == sorted(expected)
+    assert all(voter in voters for voter in expected)
+
+
+def test_voter_set_operations():
+    a, b = VoterSet([1, 2, 3, 4]), VoterSet([3, 4, 5])
+
+    assert a & b == {3, 4}
+    assert a - b == {1, 2}
+    assert a | b == {1, 2, 3, 4, 5}
+    assert not a.isdisjoint(b)
+    assert VoterSet([1]).isdisjoint(VoterSet([2]))
+
+
+def test_voter_set_memory_against_set():
+    ids = random.Random(1).sample(range(10**17, 10**18), 30_000)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    python_set = set(ids)
+    middle, _ = tracemalloc.get_traced_memory()
+    voter_set = VoterSet()
+    for voter in ids:
+        voter_set.add(voter)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(python_set) == len(voter_set)
+    assert (after - middle) * 3 < middle - before
+
+
+def test_compact_tally_matches_tally():
+    tally = CompactVoteTally(['a', 'b'])
+    tally.add(1, 'a')
+    tally.add(2, 'a')
+    tally.add(2, 'b')
+
+    assert tally.results() == {'a': 1, 'b': 0}
+    assert tally.voters() == {'a': {1}, 'b': set()}
+    assert tally.choices_of(2) == {'a', 'b'}
+
+    tally.remove(2, 'a')
+    assert tally.results() == {'a': 1, 'b': 1}
+    assert len(tally) == 2
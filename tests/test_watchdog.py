@@ -0,0 +1,60 @@
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+
+from dpymenus.watchdog import Watchdog
+
+MENU = SimpleNamespace(page=None)
+
+
+def test_blocking_callbacks_are_reported_with_their_stack():
+    reports = []
+
+    def stall():
+        time.sleep(0.3)
+
+    async def run():
+        watchdog = Watchdog(threshold=0.05)
+        watchdog.add_listener(reports.append)
+        watchdog.start()
+        await asyncio.sleep(0.02)
+        try:
+            await watchdog.run(MENU, stall)
+        finally:
+            watchdog.stop()
+
+        return watchdog
+
+    watchdog = asyncio.run(run())
+
+    assert len(reports) == 1
+    assert reports[0].blocking
+    assert 'stall' in reports[0].stack
+    assert watchdog._stacks == {}
+    assert watchdog._active == set()
+
+
+def test_stacks_of_finished_callbacks_are_not_stored():
+    watchdog = Watchdog(threshold=10)
+    frame = sys._getframe()
+
+    start = watchdog._enter(frame)
+    watchdog._finish(MENU, test_stacks_of_finished_callbacks_are_not_stored, start, frame)
+    watchdog._capture(frame, frame)
+
+    assert watchdog._stacks == {}
+
+
+def test_stacks_of_active_callbacks_are_reported():
+    reports = []
+    watchdog = Watchdog(threshold=10)
+    watchdog.add_listener(reports.append)
+    frame = sys._getframe()
+
+    start = watchdog._enter(frame)
+    watchdog._capture(frame, frame)
+    watchdog._finish(MENU, test_stacks_of_active_callbacks_are_reported, start, frame)
+
+    assert watchdog._stacks == {}
+    assert [report.blocking for report in reports] == [True]